@@ -1,10 +1,9 @@
 """Agente para extraer emails de descripciones de trabajos usando LLM."""
 
 import asyncio
+import json
 import logging
-from typing import List, Dict, Optional
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from typing import Callable, List, Dict, Optional
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
@@ -13,14 +12,22 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.email_validator import EmailValidator
-from utils.skill_loader import SkillLoader
+from utils.agent_runtime import get_runtime, SharedLLM
+from utils.llm_json import extract_json_content
+from utils.llm_scheduler import PRIORITY_LOW
 from config.settings import (
-    LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY,
-    EMAIL_EXTRACTION_CONCURRENCY
+    LLM_PROVIDER, OPENAI_API_KEY, ANTHROPIC_API_KEY,
+    EMAIL_EXTRACTION_CONCURRENCY, EMAIL_LLM_PRECHECK, EMAIL_BATCH_SIZE
 )
 
 logger = logging.getLogger(__name__)
 
+# Límite de caracteres de la descripción enviada al LLM
+MAX_DESCRIPTION_CHARS = 2000
+
+# Tokens de respuesta esperados por descripción (presupuesto TPM del scheduler)
+RESULT_TOKENS_PER_JOB = 150
+
 
 class ContactInfo(BaseModel):
     """Modelo para información de contacto extraída."""
@@ -34,33 +41,110 @@ class ContactInfo(BaseModel):
 class EmailExtractorAgent:
     """Agente que usa LLM para extraer emails de descripciones de trabajos."""
     
+    llm = SharedLLM(temperature=0)
+    
     def __init__(self):
         self.validator = EmailValidator()
         
-        # Inicializar LLM según configuración
+        # Inicializar LLM según configuración (cliente compartido del runtime)
+        runtime = get_runtime()
+        self.scheduler = runtime.scheduler
         if LLM_PROVIDER == "anthropic" and ANTHROPIC_API_KEY:
-            self.llm = ChatAnthropic(
-                model=LLM_MODEL if "claude" in LLM_MODEL.lower() else "claude-3-5-sonnet-20241022",
-                temperature=0
-            )
+            self.llm_provider = "anthropic"
         elif OPENAI_API_KEY:
-            self.llm = ChatOpenAI(
-                model=LLM_MODEL,
-                temperature=0
-            )
+            self.llm_provider = "openai"
         else:
             logger.warning("No hay API key configurada, usando extracción básica con regex")
-            self.llm = None
+            self.llm_provider = None
         
         # Parser de salida
         self.output_parser = PydanticOutputParser(pydantic_object=ContactInfo)
         
         # Cargar skill para template de prompt
-        skill_loader = SkillLoader()
+        skill_loader = runtime.skill_loader
         self.prompt_template = skill_loader.load_skill("email-extractor")
+        
+        # Variante por lotes (K descripciones por llamada)
+        try:
+            self.batch_prompt_template = skill_loader.load_skill("email-extractor-batch")
+        except Exception as e:
+            logger.warning(f"Error cargando skill email-extractor-batch: {e}")
+            self.batch_prompt_template = None
     
-    async def extract_emails(self, job_description: str) -> Dict:
-        """Extrae emails de una descripción de trabajo (versión async)."""
+    def needs_llm(self, job_description: str) -> bool:
+        """
+        Indica si la descripción amerita la llamada LLM (pre-clasificador regex).
+        
+        Con EMAIL_LLM_PRECHECK solo se escalan los casos ambiguos u ofuscados:
+        sin señal de contacto o con emails explícitos, el regex da el mismo resultado.
+        
+        Args:
+            job_description: Descripción del trabajo
+        
+        Returns:
+            True si se debe usar el LLM
+        """
+        if not EMAIL_LLM_PRECHECK:
+            return True
+        return self.validator.classify_contact_signal(job_description) == 'ambiguous'
+    
+    def _merge_contact_info(self, parsed: ContactInfo, regex_emails: List[str]) -> Dict:
+        """
+        Valida la respuesta del LLM y la combina con los emails encontrados por regex.
+        
+        Args:
+            parsed: Información de contacto retornada por el LLM
+            regex_emails: Emails válidos encontrados con regex en la misma descripción
+        
+        Returns:
+            Diccionario con emails e información de contacto
+        """
+        # Validar emails extraídos por LLM
+        all_emails = []
+        if parsed.emails:
+            all_emails.extend(self.validator.filter_valid_emails(parsed.emails))
+        
+        # Agregar emails específicos si son válidos
+        if parsed.application_email:
+            normalized = self.validator.normalize_email(parsed.application_email)
+            if normalized and normalized not in all_emails:
+                all_emails.append(normalized)
+        
+        if parsed.recruiter_email:
+            normalized = self.validator.normalize_email(parsed.recruiter_email)
+            if normalized and normalized not in all_emails:
+                all_emails.append(normalized)
+        
+        if parsed.hr_email:
+            normalized = self.validator.normalize_email(parsed.hr_email)
+            if normalized and normalized not in all_emails:
+                all_emails.append(normalized)
+        
+        # Combinar con emails encontrados por regex
+        for email in regex_emails:
+            if email not in all_emails:
+                all_emails.append(email)
+        
+        return {
+            'emails': all_emails,
+            'application_email': parsed.application_email if self.validator.is_valid_email(parsed.application_email) else (all_emails[0] if all_emails else None),
+            'recruiter_email': parsed.recruiter_email if self.validator.is_valid_email(parsed.recruiter_email) else None,
+            'hr_email': parsed.hr_email if self.validator.is_valid_email(parsed.hr_email) else None,
+            'confidence': parsed.confidence
+        }
+    
+    async def extract_emails(self, job_description: str, use_llm: bool = True) -> Dict:
+        """
+        Extrae emails de una descripción de trabajo (versión async).
+        
+        Args:
+            job_description: Descripción del trabajo
+            use_llm: Si False, solo extracción con regex (sin llamada LLM). Con
+                     True el LLM se usa solo si needs_llm() lo indica
+        
+        Returns:
+            Diccionario con emails e información de contacto
+        """
         if not job_description:
             return {
                 'emails': [],
@@ -74,8 +158,8 @@ class EmailExtractorAgent:
         basic_emails = self.validator.extract_emails(job_description)
         valid_emails = self.validator.filter_valid_emails(basic_emails)
         
-        # Si no hay LLM configurado, retornar resultado básico
-        if not self.llm:
+        # Si no hay LLM configurado, no se pidió o no hay señal ambigua, retornar resultado básico
+        if not self.llm or not use_llm or not self.needs_llm(job_description):
             return {
                 'emails': valid_emails,
                 'application_email': valid_emails[0] if valid_emails else None,
@@ -87,47 +171,17 @@ class EmailExtractorAgent:
         # Usar LLM para extracción más inteligente
         try:
             prompt = self.prompt_template.format_messages(
-                description=job_description[:2000],  # Limitar tamaño
+                description=job_description[:MAX_DESCRIPTION_CHARS],  # Limitar tamaño
                 format_instructions=self.output_parser.get_format_instructions()
             )
             
-            # Usar ainvoke para llamada async
-            response = await self.llm.ainvoke(prompt)
+            # Llamada async vía el scheduler (prioridad baja frente al análisis semántico)
+            response = await self.scheduler.ainvoke(
+                self.llm, prompt, priority=PRIORITY_LOW, expected_output_tokens=RESULT_TOKENS_PER_JOB
+            )
             parsed = self.output_parser.parse(response.content)
             
-            # Validar emails extraídos por LLM
-            all_emails = []
-            if parsed.emails:
-                all_emails.extend(self.validator.filter_valid_emails(parsed.emails))
-            
-            # Agregar emails específicos si son válidos
-            if parsed.application_email:
-                normalized = self.validator.normalize_email(parsed.application_email)
-                if normalized and normalized not in all_emails:
-                    all_emails.append(normalized)
-            
-            if parsed.recruiter_email:
-                normalized = self.validator.normalize_email(parsed.recruiter_email)
-                if normalized and normalized not in all_emails:
-                    all_emails.append(normalized)
-            
-            if parsed.hr_email:
-                normalized = self.validator.normalize_email(parsed.hr_email)
-                if normalized and normalized not in all_emails:
-                    all_emails.append(normalized)
-            
-            # Combinar con emails encontrados por regex
-            for email in valid_emails:
-                if email not in all_emails:
-                    all_emails.append(email)
-            
-            return {
-                'emails': all_emails,
-                'application_email': parsed.application_email if self.validator.is_valid_email(parsed.application_email) else (all_emails[0] if all_emails else None),
-                'recruiter_email': parsed.recruiter_email if self.validator.is_valid_email(parsed.recruiter_email) else None,
-                'hr_email': parsed.hr_email if self.validator.is_valid_email(parsed.hr_email) else None,
-                'confidence': parsed.confidence
-            }
+            return self._merge_contact_info(parsed, valid_emails)
             
         except Exception as e:
             logger.warning(f"Error usando LLM para extraer emails, usando método básico: {e}")
@@ -139,30 +193,177 @@ class EmailExtractorAgent:
                 'confidence': 0.3 if valid_emails else 0.0
             }
     
-    async def extract_from_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Extrae emails de una lista de trabajos en paralelo con límite de concurrencia."""
+    @staticmethod
+    def _format_descriptions_block(descriptions: List[str]) -> str:
+        """Formatea las descripciones de un lote numeradas desde 1 para el prompt por lotes."""
+        return "\n\n".join(
+            f"### Trabajo {index}\n{description[:MAX_DESCRIPTION_CHARS]}"
+            for index, description in enumerate(descriptions, start=1)
+        )
+    
+    def _belongs_to_description(self, contact: ContactInfo, description: str) -> bool:
+        """
+        Verifica que los emails de una entrada del lote salgan de su descripción.
+        
+        Cada email debe tener su parte local y su dominio (sin TLD) en el texto,
+        lo que admite formas ofuscadas ("hr [at] acme [dot] com") pero detecta
+        entradas con el job_index cruzado.
+        """
+        text = description[:MAX_DESCRIPTION_CHARS].lower()
+        emails = list(contact.emails) + [
+            email for email in (contact.application_email, contact.recruiter_email, contact.hr_email) if email
+        ]
+        for email in emails:
+            local, _, domain = email.lower().partition('@')
+            if local not in text or domain.rsplit('.', 1)[0] not in text:
+                return False
+        return True
+    
+    async def extract_emails_batched(self, descriptions: List[str]) -> List[Optional[Dict]]:
+        """
+        Extrae emails de varias descripciones en una sola llamada LLM (skill email-extractor-batch).
+        
+        Args:
+            descriptions: Descripciones del lote
+        
+        Returns:
+            Lista alineada con descriptions: la información de contacto de cada
+            una, o None si su entrada falta, no valida como ContactInfo o trae
+            emails que no aparecen en su descripción (el llamador debe re-procesarla)
+        """
+        results: List[Optional[Dict]] = [None] * len(descriptions)
+        if not descriptions or not self.llm or not self.batch_prompt_template:
+            return results
+        
+        try:
+            prompt = self.batch_prompt_template.format_messages(
+                jobs_block=self._format_descriptions_block(descriptions),
+                job_count=len(descriptions)
+            )
+            response = await self.scheduler.ainvoke(
+                self.llm, prompt, priority=PRIORITY_LOW,
+                expected_output_tokens=RESULT_TOKENS_PER_JOB * len(descriptions)
+            )
+            parsed = json.loads(extract_json_content(response.content))
+        except Exception as e:
+            logger.warning(f"Error extrayendo emails por lotes ({len(descriptions)} trabajos): {e}")
+            return results
+        
+        if isinstance(parsed, dict):
+            parsed = parsed.get('results', [parsed])
+        if not isinstance(parsed, list):
+            return results
+        
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get('job_index')) - 1
+                contact = ContactInfo.model_validate({k: v for k, v in entry.items() if k != 'job_index'})
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < len(descriptions) or results[index] is not None:
+                continue
+            if not self._belongs_to_description(contact, descriptions[index]):
+                continue
+            
+            regex_emails = self.validator.filter_valid_emails(self.validator.extract_emails(descriptions[index]))
+            results[index] = self._merge_contact_info(contact, regex_emails)
+        
+        return results
+    
+    async def extract_from_jobs(
+        self,
+        jobs: List[Dict],
+        use_llm: Optional[Callable[[Dict], bool]] = None,
+        batch_size: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Extrae emails de una lista de trabajos en paralelo con límite de concurrencia.
+        
+        Con batch_size > 1 los trabajos que usan el LLM se envían en lotes (una
+        llamada por lote); las entradas que fallen se re-procesan individualmente.
+        
+        Args:
+            jobs: Trabajos a procesar
+            use_llm: Predicado que indica qué trabajos usan el LLM; el resto solo
+                     usa regex. None = todos usan el LLM
+            batch_size: Descripciones por llamada LLM (default: EMAIL_BATCH_SIZE; 1 = una por llamada)
+        
+        Returns:
+            Trabajos enriquecidos con contact_info, emails y application_email
+        """
         if not jobs:
             return []
         
+        if batch_size is None:
+            batch_size = EMAIL_BATCH_SIZE
+        if not self.batch_prompt_template:
+            batch_size = 1
+        
         # Crear semáforo para limitar concurrencia
         semaphore = asyncio.Semaphore(EMAIL_EXTRACTION_CONCURRENCY)
         
-        async def process_job(job: Dict) -> Dict:
+        def job_description(job: Dict) -> str:
+            return job.get('description', '') or job.get('summary', '')
+        
+        def apply_contact_info(job: Dict, contact_info: Dict, used_llm: bool) -> Dict:
+            """Agrega la información de contacto al job."""
+            job['contact_info'] = contact_info
+            job['emails'] = contact_info['emails']
+            job['application_email'] = contact_info['application_email']
+            job['email_used_llm'] = used_llm
+            return job
+        
+        async def process_job(job: Dict, job_use_llm: bool) -> Dict:
             """Procesa un trabajo individual con control de concurrencia."""
             async with semaphore:
-                description = job.get('description', '') or job.get('summary', '')
-                contact_info = await self.extract_emails(description)
-                
-                # Agregar información de contacto al job
-                job['contact_info'] = contact_info
-                job['emails'] = contact_info['emails']
-                job['application_email'] = contact_info['application_email']
-                
-                return job
+                contact_info = await self.extract_emails(job_description(job), use_llm=job_use_llm)
+            return apply_contact_info(job, contact_info, job_use_llm)
+        
+        async def process_chunk(chunk: List[Dict]) -> List[Dict]:
+            """Procesa un lote en una llamada; re-procesa individualmente las entradas fallidas."""
+            async with semaphore:
+                batch_results = await self.extract_emails_batched([job_description(job) for job in chunk])
+            
+            failed = [job for job, result in zip(chunk, batch_results) if result is None]
+            if failed:
+                logger.debug(f"Re-procesando individualmente {len(failed)}/{len(chunk)} trabajos del lote")
+                await asyncio.gather(*(process_job(job, True) for job in failed))
+            
+            for job, result in zip(chunk, batch_results):
+                if result is not None:
+                    apply_contact_info(job, result, True)
+            return chunk
+        
+        llm_flags = [
+            self.llm is not None
+            and (use_llm(job) if use_llm else True)
+            and self.needs_llm(job_description(job))
+            for job in jobs
+        ]
+        
+        # Lotes con los trabajos que usan el LLM; el resto se procesa de a uno
+        llm_positions = [i for i, flag in enumerate(llm_flags) if flag] if batch_size > 1 else []
+        chunks = [llm_positions[i:i + batch_size] for i in range(0, len(llm_positions), batch_size)]
+        # Un lote de un solo trabajo usa el prompt individual
+        chunks = [chunk for chunk in chunks if len(chunk) > 1]
+        batched_positions = {i for chunk in chunks for i in chunk}
+        single_positions = [i for i in range(len(jobs)) if i not in batched_positions]
         
         # Procesar todos los trabajos en paralelo
-        tasks = [process_job(job) for job in jobs]
-        enriched_jobs = await asyncio.gather(*tasks, return_exceptions=True)
+        outcomes = await asyncio.gather(
+            *(process_job(jobs[i], llm_flags[i]) for i in single_positions),
+            *(process_chunk([jobs[i] for i in chunk]) for chunk in chunks),
+            return_exceptions=True
+        )
+        enriched_jobs: List = [None] * len(jobs)
+        for position, outcome in zip(single_positions, outcomes):
+            enriched_jobs[position] = outcome
+        for chunk, outcome in zip(chunks, outcomes[len(single_positions):]):
+            chunk_outcomes = [outcome] * len(chunk) if isinstance(outcome, Exception) else outcome
+            for position, job_outcome in zip(chunk, chunk_outcomes):
+                enriched_jobs[position] = job_outcome
         
         # Filtrar excepciones y retornar solo trabajos válidos
         result = []
@@ -1,14 +1,14 @@
 """Agente especializado para buscar trabajos en Findjobit."""
 
 import logging
-import asyncio
 from typing import List, Dict, Optional, Tuple
 from bs4 import BeautifulSoup
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.web_scraper import SimpleHTTPScraper
+from tools.web_scraper import AsyncHTTPScraper
+from utils.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +17,7 @@ class FindjobitAgent:
     """Agente para buscar trabajos en Findjobit (portal LATAM)."""
 
     def __init__(self):
-        self.scraper = SimpleHTTPScraper()
+        self.scraper = AsyncHTTPScraper()
         self.base_url = "https://findjobit.com"
 
     async def search(self, keywords: List[str], region_type: Optional[str] = None) -> List[Dict]:
@@ -37,7 +37,11 @@ class FindjobitAgent:
         # Findjobit no tiene API, necesitamos scraping web
         # La página principal muestra trabajos por categoría
         try:
-            html = await asyncio.get_event_loop().run_in_executor(None, self.scraper.fetch, self.base_url)
+            # Ambas regiones piden la misma página principal: un solo fetch compartido
+            html = await get_single_flight().do(
+                ('GET', self.base_url),
+                lambda: self.scraper.fetch(self.base_url)
+            )
             soup = self.scraper.parse_html(html)
 
             # Buscar trabajos en la página principal
@@ -221,4 +225,8 @@ class FindjobitAgent:
                 seen_urls.add(url)
                 unique_jobs.append(job)
 
-        return unique_jobs
\ No newline at end of file
+        return unique_jobs
+
+    async def close(self) -> None:
+        """Cierra la sesión HTTP asíncrona del scraper."""
+        await self.scraper.close()
@@ -38,11 +38,11 @@ class IndeedAgent:
         search_keywords = keywords
         if self.query_variator:
             try:
-                # Generar variaciones para cada keyword (máximo 2 variaciones por keyword)
+                # Generar variaciones de todos los keywords en una llamada (máximo 2 por keyword)
+                variations_by_keyword = await self.query_variator.agenerate_variations_batch(keywords, num_variations=2)
                 expanded_keywords = []
                 for keyword in keywords:
-                    variations = self.query_variator.generate_variations(keyword, num_variations=2)
-                    expanded_keywords.extend(variations[:3])  # Limitar a 3 por keyword
+                    expanded_keywords.extend(variations_by_keyword.get(keyword, [keyword])[:3])  # Limitar a 3 por keyword
                 
                 if expanded_keywords:
                     search_keywords = expanded_keywords
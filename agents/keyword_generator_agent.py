@@ -1,16 +1,20 @@
 """Agente para generar keywords de búsqueda adaptativos usando LLM."""
 
+import asyncio
+import json
 import logging
-from typing import List, Dict, Optional
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+from typing import List, Dict, Optional, Tuple
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.skill_loader import SkillLoader
+from utils.agent_runtime import get_runtime, SharedLLM
+from utils.llm_json import extract_json_content
+from utils.llm_scheduler import PRIORITY_NORMAL, DEFAULT_OUTPUT_TOKENS
+from utils.keyword_cache import get_keyword_cache
+from utils.profile_index import get_profile_index
 from config.settings import (
-    LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY
+    LLM_PROVIDER, OPENAI_API_KEY, ANTHROPIC_API_KEY
 )
 
 logger = logging.getLogger(__name__)
@@ -19,38 +23,52 @@ logger = logging.getLogger(__name__)
 class KeywordGeneratorAgent:
     """Agente que usa LLM para generar keywords de búsqueda adaptados dinámicamente."""
     
+    llm = SharedLLM(temperature=0.8)  # Mayor creatividad para sinónimos
+    
     def __init__(self):
-        # Inicializar LLM según configuración
+        # Inicializar LLM según configuración (cliente compartido del runtime)
+        runtime = get_runtime()
+        self.scheduler = runtime.scheduler
         if LLM_PROVIDER == "anthropic" and ANTHROPIC_API_KEY:
-            self.llm = ChatAnthropic(
-                model=LLM_MODEL if "claude" in LLM_MODEL.lower() else "claude-3-5-sonnet-20241022",
-                temperature=0.8  # Mayor creatividad para sinónimos
-            )
+            self.llm_provider = "anthropic"
         elif OPENAI_API_KEY:
-            self.llm = ChatOpenAI(
-                model=LLM_MODEL,
-                temperature=0.8
-            )
+            self.llm_provider = "openai"
         else:
             logger.warning("No hay API key configurada, usando keywords por defecto")
-            self.llm = None
+            self.llm_provider = None
         
         # Cargar skill para template de prompt
-        skill_loader = SkillLoader()
+        skill_loader = runtime.skill_loader
         try:
             self.prompt_template = skill_loader.load_skill("keyword-generator")
         except Exception as e:
             logger.warning(f"Error cargando skill keyword-generator: {e}")
             self.prompt_template = None
         
-        # Caché para keywords generados
+        # Variante multi-objetivo (todas las fuentes × regiones en una llamada)
+        try:
+            self.matrix_prompt_template = skill_loader.load_skill("keyword-generator-matrix")
+        except Exception as e:
+            logger.warning(f"Error cargando skill keyword-generator-matrix: {e}")
+            self.matrix_prompt_template = None
+        
+        # Caché para keywords generados (en memoria y, si está habilitado, en disco)
         self._cache: Dict[str, List[str]] = {}
+        self.persistent_cache = get_keyword_cache()
+        self.skill_version = skill_loader.get_skills_version(["keyword-generator", "keyword-generator-matrix"])
     
     def _create_profile_summary(self, profile: Dict) -> str:
-        """Crea un resumen conciso del perfil para el prompt."""
+        """Crea un resumen conciso del perfil para el prompt (una vez por perfil)."""
         if not profile:
             return "Perfil no disponible"
         
+        return get_profile_index(profile).memo(
+            'keyword_profile_summary',
+            lambda: self._build_profile_summary(profile)
+        )
+    
+    def _build_profile_summary(self, profile: Dict) -> str:
+        """Construye el resumen conciso del perfil."""
         summary_parts = []
         
         # Skills principales
@@ -92,14 +110,49 @@ class KeywordGeneratorAgent:
         return f"{source}:{region}:{profile_hash}"
     
     def _get_profile_hash(self, profile: Dict) -> str:
-        """Genera un hash simple del perfil para caching."""
-        # Usar skills principales como identificador
-        skills = profile.get('skills', {})
-        if isinstance(skills, dict):
-            skills_str = str(sorted([str(k) for k in skills.keys()]))[:100]
-        else:
-            skills_str = str(skills)[:100]
-        return str(hash(skills_str))
+        """Retorna el hash estable del contenido del perfil para caching."""
+        return get_profile_index(profile).content_hash
+    
+    def _get_cached_keywords(
+        self,
+        profile_hash: str,
+        source: str,
+        region: str,
+        base_keywords: Optional[List[str]],
+        num_keywords: int
+    ) -> Optional[List[str]]:
+        """Busca keywords en el caché en memoria y luego en el persistente (sin LLM)."""
+        cache_key = self._generate_cache_key(source, region, profile_hash)
+        if cache_key in self._cache:
+            return self._cache[cache_key]
+        
+        if self.persistent_cache is not None:
+            keywords = self.persistent_cache.get(self.persistent_cache.make_key(
+                profile_hash, source, region, base_keywords, num_keywords, self.skill_version
+            ))
+            if keywords:
+                self._cache[cache_key] = keywords
+                return keywords
+        return None
+    
+    def _store_keywords(
+        self,
+        profile_hash: str,
+        source: str,
+        region: str,
+        base_keywords: Optional[List[str]],
+        num_keywords: int,
+        keywords: List[str]
+    ) -> None:
+        """Guarda keywords generados por el LLM en ambos cachés."""
+        self._cache[self._generate_cache_key(source, region, profile_hash)] = keywords
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(
+                self.persistent_cache.make_key(
+                    profile_hash, source, region, base_keywords, num_keywords, self.skill_version
+                ),
+                keywords
+            )
     
     async def generate_keywords(
         self,
@@ -124,11 +177,10 @@ class KeywordGeneratorAgent:
         """
         # Verificar caché
         profile_hash = self._get_profile_hash(profile)
-        cache_key = self._generate_cache_key(source, region, profile_hash)
-        
-        if cache_key in self._cache:
+        cached = self._get_cached_keywords(profile_hash, source, region, base_keywords, num_keywords)
+        if cached is not None:
             logger.debug(f"Keywords obtenidos del caché para {source}/{region}")
-            return self._cache[cache_key]
+            return cached
         
         # Si no hay LLM, usar keywords base o por defecto
         if not self.llm or not self.prompt_template:
@@ -154,7 +206,7 @@ class KeywordGeneratorAgent:
             )
             
             # Llamar al LLM
-            response = await self.llm.ainvoke(prompt)
+            response = await self.scheduler.ainvoke(self.llm, prompt, priority=PRIORITY_NORMAL)
             
             # Parsear respuesta
             keywords = [
@@ -162,19 +214,11 @@ class KeywordGeneratorAgent:
                 for line in response.content.split('\n') 
                 if line.strip() and not line.strip().startswith(('1.', '2.', '3.', '-', '*', '#'))
             ]
-            
-            # Filtrar y limpiar
-            keywords = [
-                kw for kw in keywords 
-                if len(kw) > 3 and len(kw) < 100 and kw.replace(' ', '').isalnum()
-            ]
-            
-            # Limitar al número solicitado
-            keywords = keywords[:num_keywords]
+            keywords = self._clean_keywords(keywords, num_keywords)
             
             if keywords:
                 # Guardar en caché
-                self._cache[cache_key] = keywords
+                self._store_keywords(profile_hash, source, region, base_keywords, num_keywords, keywords)
                 logger.info(f"Generados {len(keywords)} keywords para {source}/{region}")
                 return keywords
             else:
@@ -185,6 +229,115 @@ class KeywordGeneratorAgent:
             logger.warning(f"Error generando keywords con LLM: {e}")
             return self._get_fallback_keywords(profile, base_keywords, num_keywords)
     
+    @staticmethod
+    def _clean_keywords(keywords: List[str], num_keywords: int) -> List[str]:
+        """Filtra keywords inválidos (longitud, caracteres) y limita al número solicitado."""
+        keywords = [
+            kw.strip() for kw in keywords
+            if isinstance(kw, str) and 3 < len(kw.strip()) < 100 and kw.strip().replace(' ', '').isalnum()
+        ]
+        return keywords[:num_keywords]
+    
+    async def _generate_matrix_with_llm(
+        self,
+        profile: Dict,
+        targets: List[Tuple[str, str]],
+        base_keywords: Optional[List[str]],
+        num_keywords: int
+    ) -> Dict[Tuple[str, str], List[str]]:
+        """
+        Genera los keywords de varias combinaciones fuente/región en una llamada LLM.
+        
+        Returns:
+            Keywords válidos por (fuente, región); las combinaciones que falten o
+            queden vacías tras la limpieza no se incluyen
+        """
+        prompt = self.matrix_prompt_template.format_messages(
+            profile_summary=self._create_profile_summary(profile),
+            base_keywords=", ".join(base_keywords) if base_keywords else "No especificados",
+            num_keywords=num_keywords,
+            targets="\n".join(f"- {source} / {region}" for source, region in targets),
+            target_count=len(targets)
+        )
+        response = await self.scheduler.ainvoke(
+            self.llm, prompt, priority=PRIORITY_NORMAL,
+            expected_output_tokens=DEFAULT_OUTPUT_TOKENS * len(targets)
+        )
+        parsed = json.loads(extract_json_content(response.content))
+        if not isinstance(parsed, dict):
+            raise ValueError("La respuesta no es un objeto {fuente: {región: [keywords]}}")
+        
+        parsed = {str(source).lower(): regions for source, regions in parsed.items() if isinstance(regions, dict)}
+        generated = {}
+        for source, region in targets:
+            regions = {str(name).lower(): value for name, value in parsed.get(source.lower(), {}).items()}
+            value = regions.get(region.lower())
+            keywords = self._clean_keywords(value, num_keywords) if isinstance(value, list) else []
+            if keywords:
+                generated[(source, region)] = keywords
+        return generated
+    
+    async def generate_keywords_matrix(
+        self,
+        profile: Dict,
+        sources: List[str],
+        regions: List[str],
+        base_keywords: Optional[List[str]] = None,
+        num_keywords: int = 8
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Genera keywords para todas las combinaciones fuente × región con una sola llamada LLM.
+        
+        El perfil y las instrucciones se envían una vez (skill keyword-generator-matrix)
+        y cada lista válida llena el caché de su par fuente/región. Las combinaciones
+        ya cacheadas no se piden; las que falten o no pasen la validación se generan
+        individualmente con generate_keywords.
+        
+        Args:
+            profile: Perfil del usuario
+            sources: Fuentes de búsqueda (linkedin, remoteok, etc.)
+            regions: Regiones objetivo (hispanic, english)
+            base_keywords: Keywords base opcionales del config
+            num_keywords: Número de keywords por combinación
+        
+        Returns:
+            Diccionario {fuente: {región: [keywords]}} con todas las combinaciones
+        """
+        profile_hash = self._get_profile_hash(profile)
+        matrix: Dict[str, Dict[str, List[str]]] = {source: {} for source in sources}
+        missing: List[Tuple[str, str]] = []
+        for source in sources:
+            for region in regions:
+                cached = self._get_cached_keywords(profile_hash, source, region, base_keywords, num_keywords)
+                if cached is not None:
+                    matrix[source][region] = cached
+                else:
+                    missing.append((source, region))
+        
+        if missing and self.llm and self.matrix_prompt_template:
+            try:
+                generated = await self._generate_matrix_with_llm(profile, missing, base_keywords, num_keywords)
+            except Exception as e:
+                logger.warning(f"Error generando keywords para {len(missing)} combinaciones en una llamada: {e}")
+                generated = {}
+            for (source, region), keywords in generated.items():
+                self._store_keywords(profile_hash, source, region, base_keywords, num_keywords, keywords)
+                matrix[source][region] = keywords
+            if generated:
+                logger.info(f"Generados keywords para {len(generated)}/{len(missing)} combinaciones en una llamada")
+            missing = [target for target in missing if target not in generated]
+        
+        # Combinaciones sin respuesta válida: generación individual (o fallback sin LLM)
+        if missing:
+            results = await asyncio.gather(*(
+                self.generate_keywords(profile, source, region, base_keywords, num_keywords)
+                for source, region in missing
+            ))
+            for (source, region), keywords in zip(missing, results):
+                matrix[source][region] = keywords
+        
+        return matrix
+    
     def _get_default_keywords(self, profile: Dict, num_keywords: int) -> List[str]:
         """Genera keywords por defecto basados en el perfil."""
         keywords = []
@@ -222,6 +375,6 @@ class KeywordGeneratorAgent:
         return self._get_default_keywords(profile, num_keywords)
     
     def clear_cache(self):
-        """Limpia el caché de keywords."""
+        """Limpia el caché de keywords en memoria (el persistente expira por TTL)."""
         self._cache.clear()
         logger.debug("Caché de keywords limpiado")
@@ -8,12 +8,14 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from tools.web_scraper import scrape_linkedin_jobs
-from config.settings import MAX_JOBS_PER_SOURCE
-import yaml
-from pathlib import Path
+from config.settings import MAX_JOBS_PER_SOURCE, BROWSER_MAX_CONTEXTS_PER_DOMAIN
+from config.config_loader import get_domain_concurrency
+from utils.agent_runtime import get_runtime
 
 logger = logging.getLogger(__name__)
 
+LINKEDIN_DOMAIN = "linkedin.com"
+
 
 class LinkedInAgent:
     """Agente para buscar trabajos en LinkedIn."""
@@ -21,14 +23,46 @@ class LinkedInAgent:
     def __init__(self):
         self.max_results = MAX_JOBS_PER_SOURCE
         self.config = self._load_config()
+        # Compartido entre regiones para que el límite por dominio sea global
+        self._domain_semaphore: Optional[asyncio.Semaphore] = None
     
     def _load_config(self) -> Dict:
-        """Carga configuración de job_sources.yaml."""
-        config_path = Path(__file__).parent.parent / "config" / "job_sources.yaml"
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f)
-        return {}
+        """Carga configuración de job_sources.yaml (cacheada por el runtime)."""
+        return get_runtime().config
+    
+    def _concurrent_countries_enabled(self) -> bool:
+        """Indica si la búsqueda por países debe hacerse en paralelo."""
+        linkedin_config = self.config.get('job_sources', {}).get('linkedin', {})
+        return bool(linkedin_config.get('concurrent_countries', False))
+    
+    def _get_domain_semaphore(self) -> asyncio.Semaphore:
+        """Semáforo compartido que limita búsquedas simultáneas contra LinkedIn."""
+        if self._domain_semaphore is None:
+            limit = get_domain_concurrency(LINKEDIN_DOMAIN, default=BROWSER_MAX_CONTEXTS_PER_DOMAIN)
+            self._domain_semaphore = asyncio.Semaphore(limit)
+        return self._domain_semaphore
+    
+    async def _search_country(self, keywords: List[str], country: str) -> List[Dict]:
+        """Busca en LinkedIn para un país y etiqueta los resultados con search_country."""
+        try:
+            jobs = await scrape_linkedin_jobs(keywords, self.max_results, location=country)
+        except Exception as e:
+            logger.warning(f"Error buscando en LinkedIn para país {country}: {e}")
+            return []
+        
+        # Enriquecer con información adicional
+        for job in jobs:
+            job['source'] = 'linkedin'
+            job['search_keywords'] = keywords
+            job['search_country'] = country
+            if not job.get('location'):
+                job['location'] = country or 'Remote'
+        return jobs
+    
+    async def _search_country_limited(self, keywords: List[str], country: str) -> List[Dict]:
+        """Igual que _search_country pero respetando el límite de concurrencia del dominio."""
+        async with self._get_domain_semaphore():
+            return await self._search_country(keywords, country)
     
     async def search(self, keywords: List[str], countries: Optional[List[str]] = None) -> List[Dict]:
         """Busca trabajos en LinkedIn, opcionalmente filtrado por países."""
@@ -40,22 +74,17 @@ class LinkedInAgent:
         try:
             all_jobs = []
             
-            if countries:
-                # Hacer búsqueda por cada país
+            if countries and self._concurrent_countries_enabled():
+                # Búsqueda concurrente por país; gather conserva el orden de los países
+                results = await asyncio.gather(
+                    *(self._search_country_limited(keywords, country) for country in countries)
+                )
+                for jobs in results:
+                    all_jobs.extend(jobs)
+            elif countries:
+                # Hacer búsqueda por cada país (secuencial)
                 for country in countries:
-                    try:
-                        jobs = await scrape_linkedin_jobs(keywords, self.max_results, location=country)
-                        # Enriquecer con información adicional
-                        for job in jobs:
-                            job['source'] = 'linkedin'
-                            job['search_keywords'] = keywords
-                            job['search_country'] = country
-                            if not job.get('location'):
-                                job['location'] = country or 'Remote'
-                        all_jobs.extend(jobs)
-                    except Exception as e:
-                        logger.warning(f"Error buscando en LinkedIn para país {country}: {e}")
-                        continue
+                    all_jobs.extend(await self._search_country(keywords, country))
             else:
                 # Búsqueda normal (sin filtro de país)
                 jobs = await scrape_linkedin_jobs(keywords, self.max_results)
@@ -1,25 +1,85 @@
 """Agente para matchear trabajos con el perfil del usuario usando embeddings."""
 
 import logging
-from typing import List, Dict, Optional
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_anthropic import ChatAnthropic
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from langchain_openai import OpenAIEmbeddings
 from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.documents import Document
 import json
-import yaml
+import numpy as np
 from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from config.settings import DATA_DIR, LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY, MIN_MATCH_SCORE
+from utils.agent_runtime import get_runtime, SharedLLM
+from utils.term_matcher import TermMatcher, TermOccurrences
+from utils.embedding_cache import EmbeddingCache, get_embedding_cache
+from utils.profile_index import ProfileIndex, get_profile_index, extract_tech_keywords
+from config.settings import (
+    DATA_DIR, LLM_PROVIDER, OPENAI_API_KEY, ANTHROPIC_API_KEY, MIN_MATCH_SCORE,
+    MATCHER_WORKERS, MATCHER_PARALLEL_MIN_JOBS, USE_EMBEDDING_MATCHING, EMBEDDING_MODEL, EMBEDDING_WEIGHT
+)
 
 logger = logging.getLogger(__name__)
 
+# Listas de language_preferences (job_sources.yaml) usadas en el score de idioma
+LANGUAGE_PREF_KEYS = ['fluent_english_required', 'acceptable_english', 'preferred_languages', 'preferred_regions']
+
+# Menciones genéricas de inglés (bonus si el trabajo no menciona ninguna)
+ENGLISH_MENTION_TERMS = ['english', 'inglés', 'anglais', 'englisch']
+
+# Atributos que necesita calculate_match_score (estado que se envía una vez a cada worker)
+SCORING_STATE_ATTRS = [
+    'profile_path', 'profile', 'min_score', 'language_prefs', 'matching_config', 'scoring_weights',
+    'employment_type_terms', 'employment_type_scores', 'location_terms', 'location_scores',
+    'experience_level_terms', 'experience_level_scores', 'relevant_keywords',
+    '_term_matcher', '_user_skills'
+]
+
+# Caracteres máximos del texto del trabajo que se envía al modelo de embeddings
+EMBEDDING_MAX_CHARS = 8000
+
+# Campos del trabajo que lee calculate_match_score (lo único que viaja a los workers)
+SCORING_INPUT_FIELDS = ['title', 'description', 'summary', 'location']
+
+# Campos que match_jobs agrega a cada trabajo
+SCORING_OUTPUT_FIELDS = ['match_score', 'is_relevant', 'match_factors', 'matched_skills', 'language_info']
+
+# Matcher del proceso worker, creado una sola vez por _init_scoring_worker
+_worker_agent: Optional['MatcherAgent'] = None
+
+
+def _init_scoring_worker(state: Dict) -> None:
+    """Inicializa un worker del pool con el estado compilado del matcher."""
+    global _worker_agent
+    agent = MatcherAgent.__new__(MatcherAgent)
+    agent.__dict__.update(state)
+    agent.embeddings = None
+    agent.llm = None
+    # El vocabulario ya viene compilado: asociarlo al índice del perfil de este proceso
+    agent._term_matcher_index = get_profile_index(agent.profile)
+    _worker_agent = agent
+
+
+def _score_shard(jobs: List[Dict]) -> List[Dict]:
+    """Calcula el score de un fragmento de trabajos en un worker del pool."""
+    results = []
+    for job in jobs:
+        score = _worker_agent.calculate_match_score(job)
+        job['match_score'] = score
+        job['is_relevant'] = score >= _worker_agent.min_score
+        results.append({field: job[field] for field in SCORING_OUTPUT_FIELDS})
+    return results
+
 
 class MatcherAgent:
     """Agente que calcula el match entre trabajos y perfil del usuario."""
     
+    llm = SharedLLM(temperature=0)
+    
     def __init__(self, profile_path: Optional[Path] = None):
         self.profile_path = profile_path or (DATA_DIR / "profile.json")
         self.profile = self._load_profile()
@@ -41,49 +101,41 @@ class MatcherAgent:
         self.experience_level_scores = self._get_experience_level_scores()
         self.relevant_keywords = self._get_relevant_keywords()
         
+        # Vocabulario de scoring compilado (se reconstruye si cambia el perfil)
+        self._term_matcher: Optional[TermMatcher] = None
+        self._term_matcher_index: Optional[ProfileIndex] = None
+        self._user_skills: List[str] = []
+        
         # Inicializar embeddings (requiere OpenAI para embeddings)
         if OPENAI_API_KEY:
-            self.embeddings = OpenAIEmbeddings()
+            self.embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
         else:
             logger.warning("No hay OpenAI API key, usando matching basado en keywords")
             self.embeddings = None
         
-        # Inicializar LLM para análisis semántico
+        # Inicializar LLM para análisis semántico (cliente compartido del runtime)
         if LLM_PROVIDER == "anthropic" and ANTHROPIC_API_KEY:
-            self.llm = ChatAnthropic(
-                model=LLM_MODEL if "claude" in LLM_MODEL.lower() else "claude-3-5-sonnet-20241022",
-                temperature=0
-            )
+            self.llm_provider = "anthropic"
         elif OPENAI_API_KEY:
-            self.llm = ChatOpenAI(model=LLM_MODEL, temperature=0)
+            self.llm_provider = "openai"
         else:
-            self.llm = None
+            self.llm_provider = None
     
     def _load_language_preferences(self) -> Dict:
         """Carga preferencias de idioma desde job_sources.yaml."""
-        config_path = Path(__file__).parent.parent / "config" / "job_sources.yaml"
-        if config_path.exists():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                return config.get('language_preferences', {})
-            except Exception as e:
-                logger.warning(f"Error cargando preferencias de idioma: {e}")
-                return {}
-        return {}
+        try:
+            return get_runtime().config.get('language_preferences', {})
+        except Exception as e:
+            logger.warning(f"Error cargando preferencias de idioma: {e}")
+            return {}
     
     def _load_matching_config(self) -> Dict:
         """Carga configuración de matching desde job_sources.yaml."""
-        config_path = Path(__file__).parent.parent / "config" / "job_sources.yaml"
-        if config_path.exists():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                return config.get('matching', {})
-            except Exception as e:
-                logger.warning(f"Error cargando configuración de matching: {e}")
-                return {}
-        return {}
+        try:
+            return get_runtime().config.get('matching', {})
+        except Exception as e:
+            logger.warning(f"Error cargando configuración de matching: {e}")
+            return {}
     
     def _get_scoring_weights(self) -> Dict[str, int]:
         """Obtiene pesos de scoring con valores por defecto."""
@@ -162,12 +214,9 @@ class MatcherAgent:
             return [kw.lower() for kw in configured_keywords]
         
         # Si no, inferir de keywords + skills_required del YAML principal
-        config_path = Path(__file__).parent.parent / "config" / "job_sources.yaml"
-        if config_path.exists():
-            try:
-                with open(config_path, 'r', encoding='utf-8') as f:
-                    config = yaml.safe_load(f)
-                
+        try:
+            config = get_runtime().config
+            if config:
                 keywords = config.get('keywords', [])
                 skills_required = config.get('skills_required', [])
                 
@@ -179,8 +228,8 @@ class MatcherAgent:
                     all_keywords.update(words)
                 
                 return list(all_keywords)
-            except Exception as e:
-                logger.warning(f"Error infiriendo keywords relevantes: {e}")
+        except Exception as e:
+            logger.warning(f"Error infiriendo keywords relevantes: {e}")
         
         # Fallback a la lista hardcodeada original
         return ['ai', 'machine learning', 'llm', 'llmops', 'mlops', 'python', 'aws', 'gcp']
@@ -194,79 +243,45 @@ class MatcherAgent:
         with open(self.profile_path, 'r', encoding='utf-8') as f:
             return json.load(f)
     
+    def _get_profile_index(self) -> ProfileIndex:
+        """Retorna el índice del perfil actual (se calcula una vez por perfil)."""
+        return get_profile_index(self.profile)
+    
     def _extract_skills_from_profile(self) -> List[str]:
-        """Extrae lista de skills del perfil."""
-        skills = []
-        
-        # Skills explícitas - manejar tanto diccionario como lista
-        skills_data = self.profile.get('skills', {})
-        if isinstance(skills_data, dict):
-            # Si es un diccionario, iterar sobre categorías
-            for category, items in skills_data.items():
-                if isinstance(items, list):
-                    for item in items:
-                        # Extraer tecnologías del texto
-                        if isinstance(item, str):
-                            techs = self._extract_tech_keywords(item)
-                            skills.extend(techs)
-                            # También agregar el item directamente si es un string
-                            skills.append(item)
-                elif isinstance(items, str):
-                    # Si el item es un string directo
-                    techs = self._extract_tech_keywords(items)
-                    skills.extend(techs)
-                    skills.append(items)
-        elif isinstance(skills_data, list):
-            # Si es una lista directa, procesar cada elemento
-            for item in skills_data:
-                if isinstance(item, str):
-                    # Agregar el string directamente como skill
-                    skills.append(item)
-                    # También extraer tecnologías del texto por si contiene más info
-                    techs = self._extract_tech_keywords(item)
-                    skills.extend(techs)
-                elif isinstance(item, dict):
-                    # Si el item es un diccionario, extraer tecnologías
-                    techs = self._extract_tech_keywords(str(item))
-                    skills.extend(techs)
-        
-        # Skills de experiencia
-        for exp in self.profile.get('experience', []):
-            if isinstance(exp, dict):
-                skills.extend(exp.get('technologies', []))
-            elif isinstance(exp, str):
-                # Si experience es una lista de strings, extraer tecnologías
-                techs = self._extract_tech_keywords(exp)
-                skills.extend(techs)
-        
-        # Skills de proyectos
-        for proj in self.profile.get('projects', []):
-            if isinstance(proj, dict):
-                skills.extend(proj.get('technologies', []))
-        
-        return list(set(skills))
+        """Extrae lista de skills del perfil (normalizadas, desde el ProfileIndex)."""
+        return list(self._get_profile_index().skills)
     
     def _extract_tech_keywords(self, text: str) -> List[str]:
         """Extrae keywords tecnológicos de un texto."""
-        tech_keywords = [
-            'Python', 'Django', 'Flask', 'FastAPI', 'Pandas', 'NumPy',
-            'TypeScript', 'JavaScript', 'Node.js', 'React', 'Java', 'Spring Boot',
-            'AWS', 'GCP', 'ECS', 'Lambda', 'S3', 'DynamoDB', 'CloudFormation',
-            'Docker', 'Kubernetes', 'K8s', 'GKE',
-            'n8n', 'Jupyter', 'LLM', 'MLOps', 'LLMOps', 'AI', 'Machine Learning',
-            'MySQL', 'PostgreSQL', 'MongoDB', 'Redshift',
-            'Git', 'GitHub', 'CI/CD', 'Jenkins'
-        ]
-        
-        found = []
-        text_lower = text.lower()
-        for tech in tech_keywords:
-            if tech.lower() in text_lower:
-                found.append(tech)
-        
-        return found
+        return extract_tech_keywords(text)
     
-    def _calculate_language_score(self, job_text: str, location: str = "") -> Dict:
+    def _build_term_matcher(self, user_skills: List[str]) -> TermMatcher:
+        """Compila todo el vocabulario de scoring (skills del perfil + términos configurados)."""
+        categories = {
+            'skills': user_skills,
+            'relevant_keywords': self.relevant_keywords,
+            'english_mention': ENGLISH_MENTION_TERMS
+        }
+        for emp_type, terms in self.employment_type_terms.items():
+            categories[f'employment_type.{emp_type}'] = terms
+        for location_type, terms in self.location_terms.items():
+            categories[f'location.{location_type}'] = terms
+        for level, terms in self.experience_level_terms.items():
+            categories[f'experience_level.{level}'] = terms
+        for pref in LANGUAGE_PREF_KEYS:
+            categories[f'language.{pref}'] = self.language_prefs.get(pref, []) or []
+        return TermMatcher(categories)
+    
+    def _get_term_matcher(self) -> TermMatcher:
+        """Retorna el matcher compilado, reconstruyéndolo si el perfil cambió."""
+        profile_index = self._get_profile_index()
+        if self._term_matcher is None or self._term_matcher_index is not profile_index:
+            self._user_skills = profile_index.skills_lower
+            self._term_matcher = self._build_term_matcher(self._user_skills)
+            self._term_matcher_index = profile_index
+        return self._term_matcher
+    
+    def _calculate_language_score(self, hits: Dict[str, List[str]]) -> Dict:
         """
         Calcula score basado en preferencias de idioma.
         
@@ -274,70 +289,47 @@ class MatcherAgent:
         - Bonifica trabajos en español o regiones LATAM
         - Bonifica trabajos que acepten inglés intermedio
         
+        Args:
+            hits: Términos encontrados en título, descripción y ubicación (TermMatcher.match)
+        
         Returns: Dict con score (0-15) y detalles
         """
         score = 7.5  # Score neutral (mitad de 15 puntos)
         details = []
         
-        # Combinar texto del trabajo y ubicación para análisis
-        full_text = f"{job_text} {location}".lower()
-        
-        # Obtener keywords de las preferencias
-        fluent_required = self.language_prefs.get('fluent_english_required', [])
-        acceptable_english = self.language_prefs.get('acceptable_english', [])
-        preferred_languages = self.language_prefs.get('preferred_languages', [])
-        preferred_regions = self.language_prefs.get('preferred_regions', [])
-        
         # 1. Penalizar si requiere inglés fluido (-7.5 puntos)
-        requires_fluent = False
-        for kw in fluent_required:
-            if kw.lower() in full_text:
-                requires_fluent = True
-                details.append(f"Requiere inglés fluido: '{kw}'")
-                break
-        
+        fluent_hits = hits.get('language.fluent_english_required', [])
+        requires_fluent = bool(fluent_hits)
         if requires_fluent:
+            details.append(f"Requiere inglés fluido: '{fluent_hits[0]}'")
             score -= 7.5
         
         # 2. Bonus si acepta inglés intermedio (+3 puntos)
-        accepts_intermediate = False
-        for kw in acceptable_english:
-            if kw.lower() in full_text:
-                accepts_intermediate = True
-                details.append(f"Acepta inglés intermedio: '{kw}'")
-                break
-        
+        acceptable_hits = hits.get('language.acceptable_english', [])
+        accepts_intermediate = bool(acceptable_hits)
         if accepts_intermediate:
+            details.append(f"Acepta inglés intermedio: '{acceptable_hits[0]}'")
             score += 3
         
         # 3. Bonus si es en español o menciona español (+5 puntos)
-        is_spanish = False
-        for kw in preferred_languages:
-            if kw.lower() in full_text:
-                is_spanish = True
-                details.append(f"Trabajo en español: '{kw}'")
-                break
-        
+        spanish_hits = hits.get('language.preferred_languages', [])
+        is_spanish = bool(spanish_hits)
         if is_spanish:
+            details.append(f"Trabajo en español: '{spanish_hits[0]}'")
             score += 5
         
         # 4. Bonus si es región LATAM/España (+2.5 puntos)
-        is_latam = False
-        for kw in preferred_regions:
-            if kw.lower() in full_text:
-                is_latam = True
-                details.append(f"Región preferida: '{kw}'")
-                break
-        
+        region_hits = hits.get('language.preferred_regions', [])
+        is_latam = bool(region_hits)
         if is_latam:
+            details.append(f"Región preferida: '{region_hits[0]}'")
             score += 2.5
         
         # 5. Bonus si NO se menciona inglés explícitamente (+3 puntos)
         no_english_mentioned = False
         if not requires_fluent and not accepts_intermediate:
             # Verificar que tampoco haya menciones genéricas de inglés
-            english_keywords = ['english', 'inglés', 'anglais', 'englisch']
-            has_any_english_mention = any(kw in full_text for kw in english_keywords)
+            has_any_english_mention = bool(hits.get('english_mention'))
             
             if not has_any_english_mention:
                 no_english_mentioned = True
@@ -357,53 +349,47 @@ class MatcherAgent:
             'details': details
         }
     
-    def _calculate_employment_type_score(self, job_text: str, max_score: int) -> int:
-        """Calcula score de tipo de empleo usando términos configurados."""
-        # Verificar full-time
-        for term in self.employment_type_terms['full_time']:
-            if term in job_text:
-                return self.employment_type_scores['full_time']
-        
-        # Verificar otros tipos
-        for emp_type in ['part_time', 'contract', 'freelance']:
-            for term in self.employment_type_terms[emp_type]:
-                if term in job_text:
-                    return self.employment_type_scores[emp_type]
+    def _calculate_employment_type_score(self, hits: Dict[str, List[str]], max_score: int) -> int:
+        """Calcula score de tipo de empleo a partir de los términos encontrados en el texto."""
+        # Verificar full-time y luego otros tipos
+        for emp_type in ['full_time', 'part_time', 'contract', 'freelance']:
+            if hits.get(f'employment_type.{emp_type}'):
+                return self.employment_type_scores[emp_type]
         
         # Neutral si no se encuentra nada
         return self.employment_type_scores['neutral']
     
-    def _calculate_location_score(self, location: str, job_text: str, max_score: int) -> int:
-        """Calcula score de ubicación usando términos configurados."""
-        # Verificar remote
-        for term in self.location_terms['remote']:
-            if term in location or term in job_text:
-                return self.location_scores['remote']
+    def _calculate_location_score(
+        self,
+        hits: Dict[str, List[str]],
+        full_hits: Dict[str, List[str]],
+        max_score: int
+    ) -> int:
+        """
+        Calcula score de ubicación a partir de los términos encontrados.
+        
+        Args:
+            hits: Términos encontrados en título y descripción
+            full_hits: Términos encontrados en título, descripción y ubicación
+            max_score: Peso máximo configurado
+        """
+        # Verificar remote (en la ubicación o en el texto)
+        if full_hits.get('location.remote'):
+            return self.location_scores['remote']
         
         # Verificar occasional travel
-        for term in self.location_terms['occasional_travel']:
-            if term in job_text:
-                return self.location_scores['occasional_travel']
+        if hits.get('location.occasional_travel'):
+            return self.location_scores['occasional_travel']
         
         # Otros
         return self.location_scores['other']
     
-    def _calculate_experience_level_score(self, job_text: str, max_score: int) -> int:
-        """Calcula score de nivel de experiencia usando términos configurados."""
-        # Verificar senior/lead
-        for term in self.experience_level_terms['senior']:
-            if term in job_text:
-                return self.experience_level_scores['senior']
-        
-        # Verificar mid-level
-        for term in self.experience_level_terms['mid']:
-            if term in job_text:
-                return self.experience_level_scores['mid']
-        
-        # Verificar junior
-        for term in self.experience_level_terms['junior']:
-            if term in job_text:
-                return self.experience_level_scores['junior']
+    def _calculate_experience_level_score(self, hits: Dict[str, List[str]], max_score: int) -> int:
+        """Calcula score de nivel de experiencia a partir de los términos encontrados."""
+        # Verificar senior/lead, mid-level y junior en ese orden
+        for level in ['senior', 'mid', 'junior']:
+            if hits.get(f'experience_level.{level}'):
+                return self.experience_level_scores[level]
         
         # Si no se encuentra, dar un score neutro (30% del máximo)
         return int(max_score * 0.3)
@@ -427,14 +413,19 @@ class MatcherAgent:
         job_text = f"{job.get('title', '')} {job.get('description', '')} {job.get('summary', '')}".lower()
         location = job.get('location', '').lower()
         
+        # Un solo recorrido del texto resuelve todas las categorías del vocabulario
+        term_matcher = self._get_term_matcher()
+        hits = term_matcher.match(job_text)
+        location_hits = term_matcher.match(location) if location else {}
+        full_hits = {
+            category: terms + [t for t in location_hits.get(category, []) if t not in terms]
+            for category, terms in hits.items()
+        }
+        
         # 1. Match de skills (usar peso configurado)
         weight_skills = self.scoring_weights['skills_match']
-        user_skills = [s.lower() for s in self._extract_skills_from_profile()]
-        
-        matched_skills = []
-        for skill in user_skills:
-            if skill in job_text:
-                matched_skills.append(skill)
+        user_skills = self._user_skills
+        matched_skills = hits['skills']
         
         skill_score = min(weight_skills, (len(matched_skills) / max(len(user_skills), 1)) * weight_skills)
         score += skill_score
@@ -442,26 +433,26 @@ class MatcherAgent:
         
         # 2. Tipo de trabajo (usar términos y scores configurados)
         weight_type = self.scoring_weights['employment_type']
-        type_score = self._calculate_employment_type_score(job_text, weight_type)
+        type_score = self._calculate_employment_type_score(hits, weight_type)
         score += type_score
         factors['type_match'] = type_score
         
         # 3. Ubicación (usar términos y scores configurados)
         weight_location = self.scoring_weights['location']
-        location_score = self._calculate_location_score(location, job_text, weight_location)
+        location_score = self._calculate_location_score(hits, full_hits, weight_location)
         score += location_score
         factors['location_match'] = location_score
         
         # 4. Nivel de experiencia (usar términos y scores configurados)
         weight_level = self.scoring_weights['experience_level']
-        level_score = self._calculate_experience_level_score(job_text, weight_level)
+        level_score = self._calculate_experience_level_score(hits, weight_level)
         score += level_score
         factors['level_match'] = level_score
         
         # 5. Keywords relevantes (usar keywords configurados/inferidos)
         weight_keywords = self.scoring_weights['relevant_keywords']
         relevant_keywords = self.relevant_keywords
-        keyword_matches = sum(1 for kw in relevant_keywords if kw in job_text)
+        keyword_matches = len(hits['relevant_keywords'])
         keyword_score = min(weight_keywords, (keyword_matches / max(len(relevant_keywords), 1)) * weight_keywords)
         
         score += keyword_score
@@ -469,7 +460,7 @@ class MatcherAgent:
         
         # 6. Idioma y Región (usar peso configurado)
         weight_language = self.scoring_weights['language_region']
-        language_result = self._calculate_language_score(job_text, location)
+        language_result = self._calculate_language_score(full_hits)
         # Escalar el score de idioma al peso configurado (actualmente es 0-15)
         language_score = (language_result['score'] / 15.0) * weight_language
         
@@ -499,12 +490,148 @@ class MatcherAgent:
             return 0
         return 1
     
-    def match_jobs(self, jobs: List[Dict]) -> List[Dict]:
-        """Matchea una lista de trabajos con el perfil."""
+    def _build_profile_embedding_text(self) -> str:
+        """Texto del perfil que se embebe (resumen, skills y roles con sus tecnologías)."""
+        profile_index = self._get_profile_index()
+        parts = []
+        summary = self.profile.get('summary')
+        if isinstance(summary, str) and summary.strip():
+            parts.append(summary.strip())
+        if profile_index.skills:
+            parts.append(f"Skills: {', '.join(profile_index.skills)}")
+        for exp in self.profile.get('experience', []) or []:
+            if isinstance(exp, dict):
+                role = exp.get('role', exp.get('title', ''))
+                techs = ', '.join(str(tech) for tech in exp.get('technologies', []) or [])
+                parts.append(f"{role} ({techs})" if techs else str(role))
+            elif isinstance(exp, str):
+                parts.append(exp)
+        return '\n'.join(part for part in parts if part)
+    
+    def _get_profile_embedding(self, cache: EmbeddingCache) -> np.ndarray:
+        """Embedding del perfil, calculado una vez por perfil (y persistido en el cache)."""
+        return self._get_profile_index().memo(
+            f'embedding:{cache.model}',
+            lambda: cache.embed([self._build_profile_embedding_text()], self.embeddings.embed_documents)[0]
+        )
+    
+    @staticmethod
+    def _job_embedding_text(job: Dict) -> str:
+        """Texto del trabajo que se embebe (título + descripción, limitado a EMBEDDING_MAX_CHARS)."""
+        description = job.get('description', '') or job.get('summary', '') or ''
+        return f"{job.get('title', '')}\n{description}"[:EMBEDDING_MAX_CHARS]
+    
+    def apply_embedding_scores(self, jobs: List[Dict]) -> None:
+        """
+        Combina la similitud de embeddings perfil-trabajo en match_score.
+        
+        Los trabajos se embeben en lotes (EMBEDDING_BATCH_SIZE) y solo los que no
+        estén en el cache de disco llaman a la API; la similitud es un producto
+        punto contra el embedding del perfil.
+        
+        Args:
+            jobs: Trabajos ya puntuados (se modifican en el lugar)
+        """
+        if not jobs or self.embeddings is None:
+            return
+        try:
+            cache = get_embedding_cache(EMBEDDING_MODEL)
+            profile_vector = self._get_profile_embedding(cache)
+            job_vectors = cache.embed([self._job_embedding_text(job) for job in jobs], self.embeddings.embed_documents)
+        except Exception as e:
+            logger.warning(f"Error calculando embeddings, se omite la similitud: {e}")
+            return
+        
+        # Similitud coseno (los vectores se normalizan por si el modelo no lo hace)
+        profile_norm = np.linalg.norm(profile_vector) or 1.0
+        job_norms = np.linalg.norm(job_vectors, axis=1)
+        job_norms[job_norms == 0] = 1.0
+        similarities = (job_vectors @ profile_vector) / (job_norms * profile_norm)
+        
+        for job, similarity in zip(jobs, similarities.tolist()):
+            embedding_score = max(0.0, similarity) * 100
+            job['embedding_similarity'] = round(similarity, 4)
+            job.setdefault('match_factors', {})['embedding_match'] = round(embedding_score, 1)
+            job['match_score'] = job['match_score'] * (1 - EMBEDDING_WEIGHT) + embedding_score * EMBEDDING_WEIGHT
+            job['is_relevant'] = job['match_score'] >= self.min_score
+    
+    def _finalize_matched_jobs(self, matched_jobs: List[Dict]) -> List[Dict]:
+        """Aplica la similitud de embeddings (si está habilitada) y ordena."""
+        if USE_EMBEDDING_MATCHING:
+            self.apply_embedding_scores(matched_jobs)
+        return self._sort_matched_jobs(matched_jobs)
+    
+    def _sort_matched_jobs(self, matched_jobs: List[Dict]) -> List[Dict]:
+        """Ordena por: región (1=hispanos), tipo de trabajo (full-time primero), score descendente."""
+        matched_jobs.sort(key=lambda x: (
+            x.get('region_priority', 999),  # Prioridad de región (menor es mejor, hispanos primero)
+            self._get_employment_type_priority(x),  # Full-time = 0, otros = 1
+            -x.get('match_score', 0)  # Score descendente (negativo para orden descendente)
+        ))
+        return matched_jobs
+    
+    def _scoring_state(self) -> Dict:
+        """Estado mínimo (y serializable) para calcular scores en otro proceso."""
+        self._get_term_matcher()  # Compilar el vocabulario antes de enviarlo
+        return {attr: getattr(self, attr) for attr in SCORING_STATE_ATTRS}
+    
+    def _match_jobs_parallel(self, jobs: List[Dict], workers: int) -> List[Dict]:
+        """
+        Calcula los scores repartiendo los trabajos entre procesos.
+        
+        Cada worker recibe el matcher compilado una sola vez (initializer); por
+        trabajo solo viajan los campos de texto y vuelven los campos de resultado.
+        
+        Args:
+            jobs: Trabajos a matchear (se enriquecen en el lugar)
+            workers: Número de procesos
+        
+        Returns:
+            Trabajos enriquecidos, en el orden original
+        """
+        payload = [{field: job[field] for field in SCORING_INPUT_FIELDS if field in job} for job in jobs]
+        # Varios fragmentos por worker para balancear la carga
+        shard_size = max(1, math.ceil(len(payload) / (workers * 4)))
+        shards = [payload[i:i + shard_size] for i in range(0, len(payload), shard_size)]
+        
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_scoring_worker,
+            initargs=(self._scoring_state(),)
+        ) as executor:
+            shard_results = list(executor.map(_score_shard, shards))
+        
+        results = [result for shard in shard_results for result in shard]
+        for job, result in zip(jobs, results):
+            job.update(result)
+        return list(jobs)
+    
+    def match_jobs(self, jobs: List[Dict], workers: Optional[int] = None) -> List[Dict]:
+        """
+        Matchea una lista de trabajos con el perfil.
+        
+        Args:
+            jobs: Trabajos a matchear
+            workers: Procesos para el scoring (default: MATCHER_WORKERS; 0 = todos
+                     los núcleos). El pool solo se usa con al menos
+                     MATCHER_PARALLEL_MIN_JOBS trabajos
+        
+        Returns:
+            Trabajos con match_score, ordenados por región, tipo de empleo y score
+        """
         # Recargar perfil si estaba vacío
         if not self.profile:
             self.profile = self._load_profile()
         
+        workers = MATCHER_WORKERS if workers is None else workers
+        if workers == 0:
+            workers = os.cpu_count() or 1
+        if workers > 1 and len(jobs) >= max(MATCHER_PARALLEL_MIN_JOBS, 2):
+            try:
+                return self._finalize_matched_jobs(self._match_jobs_parallel(jobs, workers))
+            except Exception as e:
+                logger.warning(f"Error en el scoring paralelo, usando scoring secuencial: {e}")
+        
         matched_jobs = []
         
         for job in jobs:
@@ -514,14 +641,206 @@ class MatcherAgent:
             
             matched_jobs.append(job)
         
-        # Ordenar por: región (1=hispanos), tipo de trabajo (full-time primero), score descendente
-        matched_jobs.sort(key=lambda x: (
-            x.get('region_priority', 999),  # Prioridad de región (menor es mejor, hispanos primero)
-            self._get_employment_type_priority(x),  # Full-time = 0, otros = 1
-            -x.get('match_score', 0)  # Score descendente (negativo para orden descendente)
-        ))
+        return self._finalize_matched_jobs(matched_jobs)
+    
+    def build_job_occurrences(self, jobs: List[Dict]) -> Tuple[TermOccurrences, TermOccurrences]:
+        """
+        Tokeniza cada trabajo una sola vez contra el vocabulario de scoring.
         
-        return matched_jobs
+        El resultado se puede guardar y reutilizar en match_jobs_batch mientras no
+        cambie el vocabulario (perfil o términos configurados): cambiar pesos o
+        scores no requiere volver a tokenizar.
+        
+        Args:
+            jobs: Trabajos a analizar
+        
+        Returns:
+            (ocurrencias en título+descripción+resumen, ocurrencias en ubicación)
+        """
+        term_matcher = self._get_term_matcher()
+        text_occurrences = term_matcher.occurrences(
+            f"{job.get('title', '')} {job.get('description', '')} {job.get('summary', '')}".lower()
+            for job in jobs
+        )
+        location_occurrences = term_matcher.occurrences(job.get('location', '').lower() for job in jobs)
+        return text_occurrences, location_occurrences
+    
+    def _score_occurrences(
+        self,
+        text_occurrences: TermOccurrences,
+        location_occurrences: TermOccurrences
+    ) -> Dict[str, np.ndarray]:
+        """
+        Calcula todos los factores del score como operaciones sobre arreglos.
+        
+        Reproduce exactamente calculate_match_score (mismas fórmulas, prioridades
+        y orden de las sumas), pero para todos los trabajos a la vez.
+        
+        Returns:
+            Dict factor -> arreglo por trabajo (más 'score' y los flags de idioma)
+        """
+        term_matcher = self._get_term_matcher()
+        
+        def in_text(category: str) -> np.ndarray:
+            return term_matcher.category_counts(text_occurrences, category) > 0
+        
+        def in_full(category: str) -> np.ndarray:
+            return in_text(category) | (term_matcher.category_counts(location_occurrences, category) > 0)
+        
+        def by_priority(conditions: List[Tuple[np.ndarray, float]], default: float) -> np.ndarray:
+            # La primera condición verdadera gana, igual que los if encadenados
+            return np.select([cond for cond, _ in conditions], [value for _, value in conditions], default=default)
+        
+        weights = self.scoring_weights
+        
+        # 1. Skills
+        weight_skills = weights['skills_match']
+        skill_counts = term_matcher.category_counts(text_occurrences, 'skills')
+        skill_score = np.minimum(weight_skills, (skill_counts / max(len(self._user_skills), 1)) * weight_skills)
+        
+        # 2. Tipo de trabajo
+        type_score = by_priority(
+            [(in_text(f'employment_type.{emp_type}'), self.employment_type_scores[emp_type])
+             for emp_type in ['full_time', 'part_time', 'contract', 'freelance']],
+            self.employment_type_scores['neutral']
+        )
+        
+        # 3. Ubicación (remote también cuenta en el campo ubicación)
+        location_score = by_priority(
+            [(in_full('location.remote'), self.location_scores['remote']),
+             (in_text('location.occasional_travel'), self.location_scores['occasional_travel'])],
+            self.location_scores['other']
+        )
+        
+        # 4. Nivel de experiencia
+        level_score = by_priority(
+            [(in_text(f'experience_level.{level}'), self.experience_level_scores[level])
+             for level in ['senior', 'mid', 'junior']],
+            int(weights['experience_level'] * 0.3)
+        )
+        
+        # 5. Keywords relevantes
+        weight_keywords = weights['relevant_keywords']
+        keyword_counts = term_matcher.category_counts(text_occurrences, 'relevant_keywords')
+        keyword_score = np.minimum(
+            weight_keywords, (keyword_counts / max(len(self.relevant_keywords), 1)) * weight_keywords
+        )
+        
+        # 6. Idioma y región (mismos pasos que _calculate_language_score)
+        requires_fluent = in_full('language.fluent_english_required')
+        accepts_intermediate = in_full('language.acceptable_english')
+        is_spanish = in_full('language.preferred_languages')
+        is_latam = in_full('language.preferred_regions')
+        no_english_mentioned = ~requires_fluent & ~accepts_intermediate & ~in_full('english_mention')
+        
+        raw_language = np.full(text_occurrences.n_docs, 7.5)
+        raw_language = raw_language - np.where(requires_fluent, 7.5, 0.0)
+        raw_language = raw_language + np.where(accepts_intermediate, 3, 0)
+        raw_language = raw_language + np.where(is_spanish, 5, 0)
+        raw_language = raw_language + np.where(is_latam, 2.5, 0.0)
+        raw_language = raw_language + np.where(no_english_mentioned, 3, 0)
+        language_score = (np.maximum(0, np.minimum(15, raw_language)) / 15.0) * weights['language_region']
+        
+        score = np.zeros(text_occurrences.n_docs)
+        for factor in (skill_score, type_score, location_score, level_score, keyword_score, language_score):
+            score = score + factor
+        
+        return {
+            'score': np.minimum(100, np.maximum(0, score)),
+            'skills_match': skill_score,
+            'type_match': type_score,
+            'location_match': location_score,
+            'level_match': level_score,
+            'keywords_match': keyword_score,
+            'language_match': language_score,
+            'requires_fluent_english': requires_fluent,
+            'accepts_intermediate': accepts_intermediate,
+            'is_spanish': is_spanish,
+            'is_latam_region': is_latam,
+            'no_english_mentioned': no_english_mentioned
+        }
+    
+    def match_jobs_batch(
+        self,
+        jobs: List[Dict],
+        occurrences: Optional[Tuple[TermOccurrences, TermOccurrences]] = None
+    ) -> List[Dict]:
+        """
+        Versión vectorizada de match_jobs para corpus grandes.
+        
+        Tokeniza todos los trabajos una vez (matriz dispersa trabajos x términos) y
+        calcula los factores con NumPy. El resultado (match_score, is_relevant,
+        match_factors, matched_skills, language_info y el orden) es idéntico al de
+        match_jobs.
+        
+        Args:
+            jobs: Trabajos a matchear
+            occurrences: Resultado previo de build_job_occurrences para estos mismos
+                         trabajos (se recalcula si el vocabulario cambió)
+        
+        Returns:
+            Trabajos enriquecidos y ordenados como en match_jobs
+        """
+        if not self.profile:
+            self.profile = self._load_profile()
+        if not jobs:
+            return []
+        
+        term_matcher = self._get_term_matcher()
+        if occurrences is not None and any(
+            occ.signature != term_matcher.signature or occ.n_docs != len(jobs) for occ in occurrences
+        ):
+            logger.info("Ocurrencias precalculadas no corresponden al vocabulario actual, recalculando")
+            occurrences = None
+        text_occurrences, location_occurrences = occurrences or self.build_job_occurrences(jobs)
+        
+        results = self._score_occurrences(text_occurrences, location_occurrences)
+        columns = {name: values.tolist() for name, values in results.items()}
+        
+        # Solo las categorías que se reportan término a término en el job
+        language_categories = [
+            ('requires_fluent_english', 'language.fluent_english_required', "Requiere inglés fluido: '{}'"),
+            ('accepts_intermediate', 'language.acceptable_english', "Acepta inglés intermedio: '{}'"),
+            ('is_spanish', 'language.preferred_languages', "Trabajo en español: '{}'"),
+            ('is_latam_region', 'language.preferred_regions', "Región preferida: '{}'")
+        ]
+        reported = ['skills'] + [category for _, category, _ in language_categories]
+        text_keys = text_occurrences.keys_by_doc()
+        location_keys = location_occurrences.keys_by_doc()
+        
+        for i, job in enumerate(jobs):
+            hits = term_matcher.hits_from_keys(text_keys[i], reported)
+            location_hits = term_matcher.hits_from_keys(location_keys[i], reported) if location_keys[i] else {}
+            
+            details = []
+            for flag, category, template in language_categories:
+                if columns[flag][i]:
+                    first = (hits[category] or location_hits[category])[0]
+                    details.append(template.format(first))
+            if columns['no_english_mentioned'][i]:
+                details.append("No menciona requisito de inglés explícitamente")
+            
+            job['language_info'] = {
+                'requires_fluent_english': columns['requires_fluent_english'][i],
+                'accepts_intermediate': columns['accepts_intermediate'][i],
+                'is_spanish': columns['is_spanish'][i],
+                'is_latam_region': columns['is_latam_region'][i],
+                'no_english_mentioned': columns['no_english_mentioned'][i],
+                'details': details
+            }
+            job['match_factors'] = {
+                'skills_match': round(columns['skills_match'][i], 1),
+                'type_match': columns['type_match'][i],
+                'location_match': columns['location_match'][i],
+                'level_match': columns['level_match'][i],
+                'keywords_match': round(columns['keywords_match'][i], 1),
+                'language_match': round(columns['language_match'][i], 1)
+            }
+            job['matched_skills'] = hits['skills']
+            job['match_score'] = columns['score'][i]
+            job['is_relevant'] = job['match_score'] >= self.min_score
+        
+        return self._finalize_matched_jobs(list(jobs))
     
     def get_match_summary(self, jobs: List[Dict]) -> Dict:
         """Genera resumen de matches."""
@@ -530,12 +849,14 @@ class MatcherAgent:
         avg_score = sum(j.get('match_score', 0) for j in jobs) / total if total > 0 else 0
         
         # Top skills requeridas
+        term_matcher = self._get_term_matcher()
+        profile_index = self._get_profile_index()
+        original_case = dict(zip(profile_index.skills_lower, profile_index.skills))
         all_required_skills = []
         for job in jobs[:20]:  # Top 20
             job_text = f"{job.get('title', '')} {job.get('description', '')}".lower()
-            for skill in self._extract_skills_from_profile():
-                if skill.lower() in job_text:
-                    all_required_skills.append(skill)
+            for skill in term_matcher.match(job_text)['skills']:
+                all_required_skills.append(original_case.get(skill, skill))
         
         from collections import Counter
         top_skills = [skill for skill, count in Counter(all_required_skills).most_common(10)]
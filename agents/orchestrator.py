@@ -3,10 +3,9 @@
 import logging
 import asyncio
 import sys
-from typing import TypedDict, List, Dict
+from typing import TypedDict, Callable, List, Dict, Tuple
 from pathlib import Path
 from langgraph.graph import StateGraph, END
-import yaml
 
 # Agregar directorio padre al path
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,6 +19,14 @@ from agents.email_extractor_agent import EmailExtractorAgent
 from agents.matcher_agent import MatcherAgent
 from agents.keyword_generator_agent import KeywordGeneratorAgent
 from agents.semantic_matcher_agent import SemanticMatcherAgent
+from tools.browser_pool import shutdown_browser_pool
+from utils.single_flight import get_single_flight
+from utils.agent_runtime import get_runtime
+from utils.job_store import get_job_store
+from utils.profile_index import get_profile_index
+from utils.local_relevance import cosine_relevance, profile_relevance_text, relevance_to_score
+from utils.near_duplicates import merge_duplicates
+from utils.candidate_selector import select_top_candidates
 from utils.cv_parser import CVParser
 from utils.progress_logger import get_progress_logger
 from utils.exceptions import CVParseError, ScrapingError, LLMError
@@ -27,11 +34,21 @@ from config.settings import (
     DATA_DIR, OUTPUT_DIR, 
     USE_ADAPTIVE_KEYWORDS, USE_SEMANTIC_MATCHING,
     SEMANTIC_MATCHING_THRESHOLD, SEMANTIC_MAX_JOBS,
-    SEMANTIC_WEIGHT, HEURISTIC_WEIGHT
+    SEMANTIC_MAX_JOBS_PER_REGION, SEMANTIC_MAX_JOBS_PER_SOURCE, SEMANTIC_TOKEN_BUDGET,
+    SEMANTIC_WEIGHT, HEURISTIC_WEIGHT, LOCAL_RELEVANCE_WEIGHT, INCREMENTAL_MODE,
+    EMAIL_LLM_MIN_SCORE, EMAIL_LLM_MAX_JOBS, USE_NEAR_DEDUP, NEAR_DEDUP_THRESHOLD
 )
 
 logger = logging.getLogger(__name__)
 
+# Campos que cada etapa guarda en el corpus persistente
+EMAIL_ENRICHMENT_FIELDS = ['contact_info', 'emails', 'application_email', 'email_used_llm']
+MATCH_ENRICHMENT_FIELDS = [
+    'match_score', 'is_relevant', 'match_factors', 'matched_skills', 'language_info',
+    'heuristic_score', 'semantic_score', 'semantic_analysis', 'used_semantic',
+    'semantic_profile_hash', 'local_relevance_score'
+]
+
 
 class JobSearchState(TypedDict):
     """Estado compartido del workflow de búsqueda de empleo."""
@@ -42,6 +59,7 @@ class JobSearchState(TypedDict):
     emails: List[str]
     summary: Dict
     errors: List[str]
+    store_stats: Dict
 
 
 class JobSearchOrchestrator:
@@ -58,14 +76,11 @@ class JobSearchOrchestrator:
         self.cv_parser = CVParser()
         self.keyword_generator = KeywordGeneratorAgent()
         self.semantic_matcher = SemanticMatcherAgent()
+        # Corpus persistente de trabajos (None si USE_JOB_STORE=false)
+        self.job_store = get_job_store()
         
-        # Cargar configuración
-        config_path = Path(__file__).parent.parent / "config" / "job_sources.yaml"
-        if config_path.exists():
-            with open(config_path, 'r', encoding='utf-8') as f:
-                self.config = yaml.safe_load(f)
-        else:
-            self.config = {}
+        # Configuración compartida (job_sources.yaml se parsea una vez por proceso)
+        self.config = get_runtime().config
         
         # Construir grafo
         self.graph = self._build_graph()
@@ -77,15 +92,21 @@ class JobSearchOrchestrator:
         # Agregar nodos
         workflow.add_node("parse_profile", self._parse_profile)
         workflow.add_node("search_all", self._search_all_parallel)
+        workflow.add_node("dedup_jobs", self._dedup_jobs)
+        workflow.add_node("score_jobs", self._score_jobs)
         workflow.add_node("extract_emails", self._extract_emails)
         workflow.add_node("match_jobs", self._match_jobs)
         workflow.add_node("generate_summary", self._generate_summary)
         
         # Definir flujo secuencial (la paralelización se hace dentro de search_all)
+        # Los casi duplicados se fusionan antes de gastar llamadas de emails/LLM en ellos
+        # El score heurístico va antes de los emails: solo los trabajos relevantes usan el LLM
         # Nota: _match_jobs ahora es async para análisis semántico
         workflow.set_entry_point("parse_profile")
         workflow.add_edge("parse_profile", "search_all")
-        workflow.add_edge("search_all", "extract_emails")
+        workflow.add_edge("search_all", "dedup_jobs")
+        workflow.add_edge("dedup_jobs", "score_jobs")
+        workflow.add_edge("score_jobs", "extract_emails")
         workflow.add_edge("extract_emails", "match_jobs")
         workflow.add_edge("match_jobs", "generate_summary")
         workflow.add_edge("generate_summary", END)
@@ -100,8 +121,8 @@ class JobSearchOrchestrator:
         keywords = state.get('keywords', [])
         profile = state.get('profile', {})
         
-        # Guardar perfil para uso en _search_by_region (keywords adaptativos)
-        self._current_profile = profile
+        # Keywords adaptativos de todas las fuentes y regiones (una sola llamada LLM)
+        self._adaptive_keywords = await self._generate_adaptive_keywords(profile, keywords)
         
         # Iniciar barra de progreso
         progress = progress_logger.start_progress()
@@ -138,8 +159,129 @@ class JobSearchOrchestrator:
             f"Total: {len(all_jobs)} trabajos (🇪🇸 {len(hispanic_jobs)} | 🇬🇧 {len(english_jobs)})"
         )
         
+        # Guardar en el corpus persistente (agrega job_key/first_seen/last_seen a cada trabajo)
+        if self.job_store:
+            try:
+                stats = self.job_store.upsert_jobs(all_jobs)
+                state['store_stats'] = stats
+                progress_logger.print_info(
+                    f"Corpus: {stats['new']} nuevos, {stats['changed']} modificados, "
+                    f"{stats['unchanged']} ya conocidos"
+                )
+            except Exception as e:
+                logger.warning(f"Error guardando trabajos en el corpus: {e}")
+        
         return state
     
+    def _persist_enrichment(self, jobs: List[Dict], fields: List[str]) -> None:
+        """Guarda en el corpus los campos producidos por una etapa para cada trabajo."""
+        if not self.job_store:
+            return
+        
+        enrichments = {
+            job['job_key']: {field: job[field] for field in fields if field in job}
+            for job in jobs
+            if job.get('job_key')
+        }
+        try:
+            self.job_store.update_enrichments(enrichments)
+        except Exception as e:
+            logger.warning(f"Error guardando resultados en el corpus: {e}")
+    
+    def _split_incremental(
+        self,
+        jobs: List[Dict],
+        is_reusable: Callable[[Dict, Dict], bool]
+    ) -> Tuple[List[Dict], List[Tuple[Dict, Dict]]]:
+        """
+        Separa los trabajos que deben procesarse de los que pueden reutilizar
+        el enriquecimiento guardado en el corpus (modo incremental).
+        
+        Solo se reutiliza un trabajo sin cambios ('corpus_status' == 'unchanged')
+        para el que is_reusable(trabajo, registro guardado) sea verdadero.
+        
+        Args:
+            jobs: Trabajos de la etapa
+            is_reusable: Indica si el registro guardado tiene lo que la etapa produce
+            
+        Returns:
+            Tupla (trabajos a procesar, pares (trabajo, registro guardado) a reutilizar)
+        """
+        if not (INCREMENTAL_MODE and self.job_store):
+            return list(jobs), []
+        
+        unchanged_keys = [
+            job['job_key'] for job in jobs
+            if job.get('corpus_status') == 'unchanged' and job.get('job_key')
+        ]
+        try:
+            stored = self.job_store.get_many(unchanged_keys) if unchanged_keys else {}
+        except Exception as e:
+            logger.warning(f"Error leyendo el corpus en modo incremental: {e}")
+            stored = {}
+        
+        to_process, reused = [], []
+        for job in jobs:
+            stored_job = stored.get(job.get('job_key')) if job.get('corpus_status') == 'unchanged' else None
+            if stored_job is not None and is_reusable(job, stored_job):
+                reused.append((job, stored_job))
+            else:
+                to_process.append(job)
+        return to_process, reused
+    
+    def _adaptive_keyword_sources(self) -> List[str]:
+        """Fuentes habilitadas que usan keywords adaptativos."""
+        job_sources = self.config.get('job_sources', {})
+        config_names = {
+            'linkedin': 'linkedin',
+            'remoteok': 'remoteok',
+            'stackoverflow': 'stack_overflow',
+            'findjobit': 'findjobit'
+        }
+        return [
+            source for source, config_name in config_names.items()
+            if job_sources.get(config_name, {}).get('enabled', True)
+        ]
+    
+    async def _generate_adaptive_keywords(
+        self,
+        profile: Dict,
+        keywords: List[str]
+    ) -> Dict[str, Dict[str, List[str]]]:
+        """
+        Genera los keywords adaptativos de cada fuente habilitada para ambas regiones.
+        
+        Args:
+            profile: Perfil del usuario
+            keywords: Keywords base
+        
+        Returns:
+            Diccionario {fuente: {región: [keywords]}}; vacío sin perfil o con
+            USE_ADAPTIVE_KEYWORDS deshabilitado (se usan los keywords base)
+        """
+        if not profile or not USE_ADAPTIVE_KEYWORDS:
+            return {}
+        
+        progress_logger = get_progress_logger()
+        sources = self._adaptive_keyword_sources()
+        progress_logger.print_info(f"Generando keywords adaptados para {len(sources)} fuentes y 2 regiones...")
+        try:
+            matrix = await self.keyword_generator.generate_keywords_matrix(
+                profile=profile,
+                sources=sources,
+                regions=['hispanic', 'english'],
+                base_keywords=keywords,
+                num_keywords=min(8, len(keywords) + 2)
+            )
+        except Exception as e:
+            logger.warning(f"Error generando keywords adaptativos: {e}")
+            return {}
+        
+        for source, regions in matrix.items():
+            for region, region_keywords in regions.items():
+                logger.info(f"Keywords para {source}/{region}: {region_keywords[:3]}...")
+        return matrix
+    
     async def _search_by_region(self, region_type: str, keywords: List[str]) -> List[Dict]:
         """Busca trabajos en una región específica con keywords adaptativos."""
         progress_logger = get_progress_logger()
@@ -154,57 +296,12 @@ class JobSearchOrchestrator:
         tasks = []
         source_names = []
         
-        # Generar keywords adaptativos por fuente (solo si está habilitado y hay perfil)
-        profile = getattr(self, '_current_profile', None)
-        adaptive_keywords = {}
-        
-        if profile and USE_ADAPTIVE_KEYWORDS:
-            progress_logger.print_info(f"Generando keywords adaptados para región {region_type}...")
-            # Generar keywords para cada fuente habilitada
-            sources_to_generate = []
-            if self.config.get('job_sources', {}).get('linkedin', {}).get('enabled', True):
-                sources_to_generate.append('linkedin')
-            if self.config.get('job_sources', {}).get('remoteok', {}).get('enabled', True):
-                sources_to_generate.append('remoteok')
-            if self.config.get('job_sources', {}).get('stack_overflow', {}).get('enabled', True):
-                sources_to_generate.append('stackoverflow')
-            if self.config.get('job_sources', {}).get('findjobit', {}).get('enabled', True):
-                sources_to_generate.append('findjobit')
-            
-            # Generar keywords en paralelo para todas las fuentes
-            keyword_tasks = [
-                self.keyword_generator.generate_keywords(
-                    profile=profile,
-                    source=source,
-                    region=region_type,
-                    base_keywords=keywords,
-                    num_keywords=min(8, len(keywords) + 2)
-                )
-                for source in sources_to_generate
-            ]
-            
-            try:
-                results = await asyncio.gather(*keyword_tasks, return_exceptions=True)
-                for source, result in zip(sources_to_generate, results):
-                    if isinstance(result, Exception):
-                        logger.warning(f"Error generando keywords para {source}: {result}")
-                        adaptive_keywords[source] = keywords  # Fallback a keywords base
-                    else:
-                        adaptive_keywords[source] = result
-                        logger.info(f"Keywords para {source}: {result[:3]}...")
-            except Exception as e:
-                logger.warning(f"Error generando keywords adaptativos: {e}")
-                # Usar keywords base para todas las fuentes
-                for source in sources_to_generate:
-                    adaptive_keywords[source] = keywords
-        else:
-            # Sin perfil, usar keywords base
-            adaptive_keywords = {
-                'linkedin': keywords,
-                'remoteok': keywords,
-                'stackoverflow': keywords,
-                'findjobit': keywords
-            }
+        # Keywords adaptativos por fuente (generados una vez para ambas regiones en
+        # _search_all_parallel); sin perfil se usan los keywords base
+        adaptive_keywords = {
+            source: regions.get(region_type, keywords)
+            for source, regions in getattr(self, '_adaptive_keywords', {}).items()
+        }
         
         # Ejecutar búsquedas en paralelo para todas las fuentes con keywords adaptativos
         if self.config.get('job_sources', {}).get('linkedin', {}).get('enabled', True):
@@ -358,6 +455,69 @@ class JobSearchOrchestrator:
         
         return state
     
+    def _dedup_jobs(self, state: JobSearchState) -> JobSearchState:
+        """Fusiona ofertas casi duplicadas entre fuentes y países (MinHash + LSH)."""
+        progress_logger = get_progress_logger()
+        jobs = state.get('jobs', [])
+        
+        if not jobs or not USE_NEAR_DEDUP:
+            return state
+        
+        try:
+            unique_jobs = merge_duplicates(jobs, threshold=NEAR_DEDUP_THRESHOLD)
+            removed = len(jobs) - len(unique_jobs)
+            state['jobs'] = unique_jobs
+            if removed:
+                progress_logger.print_info(
+                    f"Deduplicación: {removed} ofertas casi duplicadas fusionadas ({len(unique_jobs)} únicas)"
+                )
+        except Exception as e:
+            logger.warning(f"Error deduplicando trabajos, se continúa sin deduplicar: {e}")
+        
+        return state
+    
+    def _score_jobs(self, state: JobSearchState) -> JobSearchState:
+        """Calcula el score heurístico de todos los trabajos (rápido, sin LLM) y los ordena."""
+        progress_logger = get_progress_logger()
+        jobs = state.get('jobs', [])
+        
+        if not jobs:
+            return state
+        
+        try:
+            state['jobs'] = self.matcher.match_jobs(jobs)
+            progress_logger.print_success(f"Scores heurísticos calculados para {len(jobs)} trabajos")
+        except Exception as e:
+            progress_logger.print_error(f"Error calculando scores heurísticos: {e}")
+            logger.error(f"Error calculando scores heurísticos: {e}")
+            state['errors'].append(f"Error calculando scores heurísticos: {str(e)}")
+        
+        return state
+    
+    @staticmethod
+    def _email_llm_predicate(jobs: List[Dict]) -> Callable[[Dict], bool]:
+        """
+        Construye el predicado que decide qué trabajos usan el LLM para extraer emails.
+        
+        Solo los trabajos con score heurístico >= EMAIL_LLM_MIN_SCORE y dentro del
+        top EMAIL_LLM_MAX_JOBS (0 = sin límite); el resto se procesa solo con regex.
+        Si los trabajos aún no tienen score, todos usan el LLM.
+        
+        Args:
+            jobs: Trabajos con 'match_score'
+            
+        Returns:
+            Función job -> bool
+        """
+        if not any('match_score' in job for job in jobs):
+            return lambda job: True
+        
+        eligible = [job for job in jobs if job.get('match_score', 0) >= EMAIL_LLM_MIN_SCORE]
+        if EMAIL_LLM_MAX_JOBS > 0:
+            eligible = sorted(eligible, key=lambda job: -job.get('match_score', 0))[:EMAIL_LLM_MAX_JOBS]
+        selected = {id(job) for job in eligible}
+        return lambda job: id(job) in selected
+    
     async def _extract_emails(self, state: JobSearchState) -> JobSearchState:
         """Extrae emails de los trabajos encontrados (versión async paralela)."""
         progress_logger = get_progress_logger()
@@ -366,13 +526,47 @@ class JobSearchOrchestrator:
         if not jobs:
             return state
         
-        progress_logger.print_info(f"Extrayendo emails de {len(jobs)} trabajos en paralelo...")
+        # LLM solo para trabajos relevantes según el score heurístico; regex para el resto
+        use_llm = self._email_llm_predicate(jobs)
+        
+        # Modo incremental: los trabajos sin cambios reutilizan los emails guardados
+        # (salvo que antes se procesaran solo con regex y ahora califiquen para el LLM)
+        to_process, reused = self._split_incremental(
+            jobs,
+            lambda job, stored: 'contact_info' in stored
+            and (stored.get('email_used_llm', True) or not use_llm(job))
+        )
+        for job, stored_job in reused:
+            for field in EMAIL_ENRICHMENT_FIELDS:
+                if field in stored_job:
+                    job[field] = stored_job[field]
+        if reused:
+            progress_logger.print_info(
+                f"Modo incremental: {len(reused)} trabajos sin cambios reutilizan sus emails"
+            )
+        
+        llm_count = sum(1 for job in to_process if use_llm(job))
+        progress_logger.print_info(
+            f"Extrayendo emails de {len(to_process)} trabajos en paralelo "
+            f"({llm_count} con LLM, {len(to_process) - llm_count} solo regex)..."
+        )
         try:
             progress = progress_logger.start_progress()
             email_task = progress.add_task("[cyan]Extrayendo emails con LLM (paralelo)...", total=len(jobs))
             
             # Usar el método async paralelo
-            enriched_jobs = await self.email_extractor.extract_from_jobs(jobs)
+            processed_jobs = (
+                await self.email_extractor.extract_from_jobs(to_process, use_llm=use_llm)
+                if to_process else []
+            )
+            
+            # Reunir procesados y reutilizados conservando el orden original. El
+            # extractor retorna una lista alineada con to_process (a veces con copias),
+            # así que cada trabajo se ubica por su posición y no por job_key: las
+            # copias de una misma oferta (p.ej. una por región) no se colapsan
+            reused_ids = {id(job) for job, _ in reused}
+            processed_iter = iter(processed_jobs)
+            enriched_jobs = [job if id(job) in reused_ids else next(processed_iter) for job in jobs]
             
             # Recopilar todos los emails únicos
             all_emails = set()
@@ -385,6 +579,7 @@ class JobSearchOrchestrator:
             
             state['jobs'] = enriched_jobs
             state['emails'] = list(all_emails)
+            self._persist_enrichment(processed_jobs, EMAIL_ENRICHMENT_FIELDS)
             progress_logger.print_success(f"Extraídos {len(all_emails)} emails únicos")
         except LLMError as e:
             progress_logger.print_error(f"Error LLM extrayendo emails: {e}")
@@ -410,58 +605,99 @@ class JobSearchOrchestrator:
         progress_logger.print_info(f"Matcheando {len(jobs)} trabajos con perfil...")
         try:
             progress = progress_logger.start_progress()
-            match_task = progress.add_task("[cyan]Calculando scores heurísticos...", total=len(jobs))
             
-            # Paso 1: Matching heurístico (rápido)
-            matched_jobs = self.matcher.match_jobs(jobs)
-            progress.update(match_task, completed=len(jobs), description=f"[green]✓ Scores heurísticos calculados")
+            # Paso 1: Matching heurístico (ya calculado en score_jobs; se calcula aquí si faltó)
+            if all('match_score' in job for job in jobs):
+                matched_jobs = list(jobs)
+            else:
+                matched_jobs = self.matcher.match_jobs(jobs)
+            
+            # Relevancia local TF-IDF (sin red), tercer score opcional
+            use_local_relevance = LOCAL_RELEVANCE_WEIGHT > 0 and bool(profile)
+            if use_local_relevance:
+                self._score_local_relevance(matched_jobs, profile)
             
-            # Paso 2: Filtrar top trabajos para análisis semántico (si está habilitado)
-            # Solo analizar trabajos con score >= threshold o top N, lo que sea menor
+            # Paso 2: Elegir candidatos para análisis semántico (si está habilitado):
+            # los SEMANTIC_MAX_JOBS de mayor score >= threshold, con cuotas y presupuesto
             if USE_SEMANTIC_MATCHING:
-                top_jobs = [job for job in matched_jobs if job.get('match_score', 0) >= SEMANTIC_MATCHING_THRESHOLD]
-                if len(top_jobs) > SEMANTIC_MAX_JOBS:
-                    top_jobs = matched_jobs[:SEMANTIC_MAX_JOBS]
+                top_jobs = select_top_candidates(
+                    matched_jobs,
+                    k=SEMANTIC_MAX_JOBS,
+                    min_score=SEMANTIC_MATCHING_THRESHOLD,
+                    max_per_region=SEMANTIC_MAX_JOBS_PER_REGION,
+                    max_per_source=SEMANTIC_MAX_JOBS_PER_SOURCE,
+                    token_budget=SEMANTIC_TOKEN_BUDGET,
+                    estimate_tokens=lambda job: self.semantic_matcher.estimate_job_tokens(job, profile)
+                )
             else:
                 top_jobs = []
             
             if top_jobs and profile and USE_SEMANTIC_MATCHING:
-                progress_logger.print_info(f"Analizando semánticamente top {len(top_jobs)} trabajos...")
+                # Modo incremental: reutilizar el análisis guardado de trabajos sin cambios
+                # (solo si se hizo con el mismo perfil)
+                profile_hash = get_profile_index(profile).content_hash
+                to_analyze, reused = self._split_incremental(
+                    top_jobs,
+                    lambda job, stored: bool(stored.get('used_semantic'))
+                    and stored.get('semantic_profile_hash') == profile_hash
+                )
+                for job, stored_job in reused:
+                    job['semantic_analysis'] = stored_job.get('semantic_analysis', {})
+                    job['semantic_score'] = stored_job.get('semantic_score', 0)
+                if reused:
+                    progress_logger.print_info(
+                        f"Modo incremental: {len(reused)} trabajos sin cambios reutilizan su análisis semántico"
+                    )
+                
+                progress_logger.print_info(f"Analizando semánticamente top {len(to_analyze)} trabajos...")
                 semantic_task = progress.add_task(
-                    f"[cyan]Análisis semántico ({len(top_jobs)} trabajos)...",
+                    f"[cyan]Análisis semántico ({len(to_analyze)} trabajos)...",
                     total=len(top_jobs)
                 )
                 
                 # Análisis semántico en paralelo
-                analyzed_jobs = await self.semantic_matcher.analyze_batch(top_jobs, profile)
-
-                # Mapear resultados analizados para actualizar la lista original
-                analyzed_map = {}
+                analyzed_jobs = await self.semantic_matcher.analyze_batch(to_analyze, profile) if to_analyze else []
                 for job in analyzed_jobs:
-                    job_id = job.get('id') or job.get('url') or f"{job.get('title', '')}_{job.get('company', '')}"
-                    analyzed_map[job_id] = job
+                    job['semantic_profile_hash'] = profile_hash
+
+                # Mapear cada candidato (por identidad, no por URL) a su resultado:
+                # analyze_batch retorna una lista alineada con to_analyze
+                reused_ids = {id(job) for job, _ in reused}
+                analyzed_iter = iter(analyzed_jobs)
+                analyzed_map = {
+                    id(job): job if id(job) in reused_ids else next(analyzed_iter)
+                    for job in top_jobs
+                }
 
                 # Actualizar trabajos originales con análisis semántico
                 for job in matched_jobs:
-                    job_id = job.get('id') or job.get('url') or f"{job.get('title', '')}_{job.get('company', '')}"
-                    if job_id in analyzed_map:
-                        analyzed_job = analyzed_map[job_id]
+                    analyzed_job = analyzed_map.get(id(job))
+                    if analyzed_job is not None:
                         job['semantic_analysis'] = analyzed_job.get('semantic_analysis', {})
                         job['semantic_score'] = analyzed_job.get('semantic_score', 0)
                         job['heuristic_score'] = analyzed_job.get('match_score', job.get('match_score', 0))
                         job['used_semantic'] = True if job.get('semantic_score', 0) > 0 else False
+                        if 'semantic_profile_hash' in analyzed_job:
+                            job['semantic_profile_hash'] = analyzed_job['semantic_profile_hash']
 
                 # Combinar scores usando pesos configurados
                 for job in matched_jobs:
                     if job.get('used_semantic', False) and job.get('semantic_score', 0) > 0:
                         heuristic_score = job.get('heuristic_score', job.get('match_score', 0))
                         semantic_score = job.get('semantic_score', 0)
-                        combined_score = self.semantic_matcher.combine_scores(
-                            heuristic_score,
-                            semantic_score,
-                            heuristic_weight=HEURISTIC_WEIGHT,
-                            semantic_weight=SEMANTIC_WEIGHT
-                        )
+                        if use_local_relevance:
+                            combined_score = self._combine_weighted_scores([
+                                (heuristic_score, HEURISTIC_WEIGHT),
+                                (semantic_score, SEMANTIC_WEIGHT),
+                                (job.get('local_relevance_score', 0), LOCAL_RELEVANCE_WEIGHT)
+                            ])
+                        else:
+                            combined_score = self.semantic_matcher.combine_scores(
+                                heuristic_score,
+                                semantic_score,
+                                heuristic_weight=HEURISTIC_WEIGHT,
+                                semantic_weight=SEMANTIC_WEIGHT
+                            )
                         job['match_score'] = combined_score
                 
                 progress.update(semantic_task, completed=len(top_jobs), description="[green]✓ Análisis semántico completado")
@@ -483,9 +719,24 @@ class JobSearchOrchestrator:
                     f"{len(matched_jobs) - semantic_count} con solo heurístico"
                 )
             
+            # Trabajos sin análisis semántico: combinar heurístico + relevancia local
+            if use_local_relevance:
+                for job in matched_jobs:
+                    if not job.get('used_semantic', False):
+                        job['heuristic_score'] = job.get('match_score', 0)
+                        job['match_score'] = self._combine_weighted_scores([
+                            (job['heuristic_score'], HEURISTIC_WEIGHT),
+                            (job.get('local_relevance_score', 0), LOCAL_RELEVANCE_WEIGHT)
+                        ])
+                matched_jobs.sort(key=lambda x: (
+                    x.get('region_priority', 999),
+                    -x.get('match_score', 0)
+                ))
+            
             progress_logger.stop_progress()
             
             state['matched_jobs'] = matched_jobs
+            self._persist_enrichment(matched_jobs, MATCH_ENRICHMENT_FIELDS)
             progress_logger.print_success(f"Matcheados {len(matched_jobs)} trabajos")
         except Exception as e:
             progress_logger.print_error(f"Error matcheando trabajos: {e}")
@@ -495,6 +746,42 @@ class JobSearchOrchestrator:
         
         return state
     
+    @staticmethod
+    def _score_local_relevance(jobs: List[Dict], profile: Dict) -> None:
+        """
+        Calcula la relevancia TF-IDF perfil-trabajo (sin red) y la guarda en local_relevance_score.
+        
+        Args:
+            jobs: Trabajos a puntuar (se modifican en el lugar)
+            profile: Perfil del candidato (salida de CVParser)
+        """
+        profile_text = get_profile_index(profile).memo(
+            'local_relevance_text', lambda: profile_relevance_text(profile)
+        )
+        texts = [
+            f"{job.get('title', '')} {job.get('description', '') or job.get('summary', '')}"
+            for job in jobs
+        ]
+        for job, similarity in zip(jobs, cosine_relevance(profile_text, texts).tolist()):
+            job['local_relevance_score'] = relevance_to_score(similarity)
+    
+    @staticmethod
+    def _combine_weighted_scores(scores: List[Tuple[float, float]]) -> float:
+        """
+        Promedio ponderado de scores 0-100, renormalizando los pesos para que sumen 1.
+        
+        Args:
+            scores: Pares (score, peso)
+        
+        Returns:
+            Score combinado (0-100)
+        """
+        total_weight = sum(weight for _, weight in scores)
+        if total_weight <= 0:
+            return scores[0][0]
+        combined = sum(score * weight for score, weight in scores) / total_weight
+        return min(100, max(0, combined))
+    
     def _generate_summary(self, state: JobSearchState) -> JobSearchState:
         """Genera resumen de resultados."""
         progress_logger = get_progress_logger()
@@ -512,6 +799,16 @@ class JobSearchOrchestrator:
             summary['by_source'] = by_source
             summary['total_emails'] = len(state.get('emails', []))
             
+            # Estadísticas históricas leídas del corpus persistente
+            if self.job_store:
+                store_stats = state.get('store_stats', {})
+                summary['corpus'] = {
+                    'total_jobs': self.job_store.count(),
+                    'new_this_run': store_stats.get('new', 0),
+                    'changed_this_run': store_stats.get('changed', 0),
+                    'known_before': store_stats.get('unchanged', 0),
+                }
+            
             state['summary'] = summary
             logger.info(f"Resumen generado: {summary}")
         except Exception as e:
@@ -532,7 +829,8 @@ class JobSearchOrchestrator:
             'matched_jobs': [],
             'emails': [],
             'summary': {},
-            'errors': []
+            'errors': [],
+            'store_stats': {}
         }
         
         try:
@@ -546,3 +844,18 @@ class JobSearchOrchestrator:
             logger.error(f"Error ejecutando workflow: {e}")
             initial_state['errors'].append(f"Error en workflow: {str(e)}")
             return initial_state
+        finally:
+            # Cerrar una sola vez el navegador compartido por todos los scrapers
+            await shutdown_browser_pool()
+            await self._close_http_sessions()
+            await get_runtime().aclose()
+            # Los fetches compartidos solo valen para esta ejecución
+            get_single_flight().clear()
+    
+    async def _close_http_sessions(self) -> None:
+        """Cierra las sesiones HTTP asíncronas abiertas por los agentes de búsqueda."""
+        for agent in (self.remote_agent, self.tech_agent, self.findjobit_agent):
+            try:
+                await agent.close()
+            except Exception as e:
+                logger.debug(f"Error cerrando sesión HTTP de {type(agent).__name__}: {e}")
@@ -1,5 +1,6 @@
 """Agente especializado para buscar trabajos remotos en múltiples fuentes."""
 
+import copy
 import logging
 import asyncio
 from typing import List, Dict, Optional
@@ -10,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from tools.web_scraper import scrape_we_work_remotely
 from tools.api_clients import RemoteOKClient
 from config.settings import MAX_JOBS_PER_SOURCE
+from utils.single_flight import get_single_flight
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +35,7 @@ class RemoteJobsAgent:
         # 1. RemoteOK (API)
         try:
             logger.info("Buscando en RemoteOK...")
-            remoteok_jobs = self.remoteok_client.search_jobs(keywords, self.max_results)
+            remoteok_jobs = await self.remoteok_client.search_jobs_async(keywords, self.max_results)
             all_jobs.extend(remoteok_jobs)
             logger.info(f"Encontrados {len(remoteok_jobs)} trabajos en RemoteOK")
         except Exception as e:
@@ -42,7 +44,12 @@ class RemoteJobsAgent:
         # 2. We Work Remotely (Scraping)
         try:
             logger.info("Buscando en We Work Remotely...")
-            wwr_jobs = await scrape_we_work_remotely(self.max_results)
+            # Una sola descarga compartida entre regiones; copiar porque se enriquece abajo
+            shared_wwr_jobs = await get_single_flight().do(
+                ('we_work_remotely', self.max_results),
+                lambda: scrape_we_work_remotely(self.max_results)
+            )
+            wwr_jobs = copy.deepcopy(shared_wwr_jobs)
             all_jobs.extend(wwr_jobs)
             logger.info(f"Encontrados {len(wwr_jobs)} trabajos en We Work Remotely")
         except Exception as e:
@@ -60,3 +67,7 @@ class RemoteJobsAgent:
         
         logger.info(f"Total de trabajos remotos encontrados: {len(all_jobs)}")
         return all_jobs
+    
+    async def close(self) -> None:
+        """Cierra las sesiones HTTP asíncronas de los clientes."""
+        await self.remoteok_client.aclose()
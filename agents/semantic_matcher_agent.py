@@ -4,22 +4,35 @@ import asyncio
 import logging
 import json
 from typing import List, Dict, Optional
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.output_parsers import JsonOutputParser
 from pydantic import BaseModel, Field
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from utils.skill_loader import SkillLoader
+from utils.agent_runtime import get_runtime, SharedLLM
+from utils.llm_json import extract_json_content
+from utils.llm_scheduler import PRIORITY_HIGH
+from utils.profile_index import get_profile_index
 from config.settings import (
-    LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY,
-    EMAIL_EXTRACTION_CONCURRENCY  # Reusar el mismo límite de concurrencia
+    LLM_PROVIDER, OPENAI_API_KEY, ANTHROPIC_API_KEY,
+    LLM_MAX_CONCURRENCY, SEMANTIC_BATCH_SIZE
 )
 
 logger = logging.getLogger(__name__)
 
+# Campos que todo resultado semántico debe tener
+REQUIRED_RESULT_FIELDS = ['semantic_score', 'confidence', 'key_matches', 'concerns', 'recommendation']
+
+# Límite de caracteres de la descripción enviada al LLM
+MAX_DESCRIPTION_CHARS = 2000
+
+# Estimación de costo (aproximada, sin tokenizer): ~4 caracteres por token,
+# instrucciones del prompt y respuesta JSON por trabajo
+CHARS_PER_TOKEN = 4
+PROMPT_OVERHEAD_TOKENS = 600
+RESULT_TOKENS_PER_JOB = 150
+
 
 class SemanticMatchResult(BaseModel):
     """Modelo para el resultado del matching semántico."""
@@ -33,38 +46,50 @@ class SemanticMatchResult(BaseModel):
 class SemanticMatcherAgent:
     """Agente que usa LLM para análisis semántico de relevancia entre trabajos y perfil."""
     
+    llm = SharedLLM(temperature=0)  # Consistencia en análisis
+    
     def __init__(self):
-        # Inicializar LLM según configuración
+        # Inicializar LLM según configuración (cliente compartido del runtime)
+        runtime = get_runtime()
+        self.scheduler = runtime.scheduler
         if LLM_PROVIDER == "anthropic" and ANTHROPIC_API_KEY:
-            self.llm = ChatAnthropic(
-                model=LLM_MODEL if "claude" in LLM_MODEL.lower() else "claude-3-5-sonnet-20241022",
-                temperature=0  # Consistencia en análisis
-            )
+            self.llm_provider = "anthropic"
         elif OPENAI_API_KEY:
-            self.llm = ChatOpenAI(
-                model=LLM_MODEL,
-                temperature=0
-            )
+            self.llm_provider = "openai"
         else:
             logger.warning("No hay API key configurada, análisis semántico deshabilitado")
-            self.llm = None
+            self.llm_provider = None
         
         # Parser de salida JSON
         self.output_parser = JsonOutputParser(pydantic_object=SemanticMatchResult)
         
         # Cargar skill para template de prompt
-        skill_loader = SkillLoader()
+        skill_loader = runtime.skill_loader
         try:
             self.prompt_template = skill_loader.load_skill("semantic-matcher")
         except Exception as e:
             logger.warning(f"Error cargando skill semantic-matcher: {e}")
             self.prompt_template = None
+        
+        # Variante por lotes (K trabajos por llamada)
+        try:
+            self.batch_prompt_template = skill_loader.load_skill("semantic-matcher-batch")
+        except Exception as e:
+            logger.warning(f"Error cargando skill semantic-matcher-batch: {e}")
+            self.batch_prompt_template = None
     
     def _create_candidate_profile_summary(self, profile: Dict) -> str:
-        """Crea un resumen del perfil del candidato para el prompt."""
+        """Crea un resumen del perfil del candidato para el prompt (una vez por perfil)."""
         if not profile:
             return "Perfil no disponible"
         
+        return get_profile_index(profile).memo(
+            'semantic_candidate_summary',
+            lambda: self._build_candidate_profile_summary(profile)
+        )
+    
+    def _build_candidate_profile_summary(self, profile: Dict) -> str:
+        """Construye el resumen del perfil del candidato."""
         summary_parts = []
         
         # Skills
@@ -135,7 +160,7 @@ class SemanticMatcherAgent:
             job_title = job.get('title', 'N/A')
             job_company = job.get('company', 'N/A')
             job_location = job.get('location', 'N/A')
-            job_description = job.get('description', job.get('summary', 'N/A'))[:2000]  # Limitar tamaño
+            job_description = job.get('description', job.get('summary', 'N/A'))[:MAX_DESCRIPTION_CHARS]  # Limitar tamaño
             
             # Crear resumen del perfil
             candidate_profile = self._create_candidate_profile_summary(profile)
@@ -149,23 +174,20 @@ class SemanticMatcherAgent:
                 candidate_profile=candidate_profile
             )
             
-            # Llamar al LLM
-            response = await self.llm.ainvoke(prompt)
+            # Llamar al LLM (prioridad alta: los mejores candidatos se analizan primero)
+            response = await self.scheduler.ainvoke(
+                self.llm, prompt, priority=PRIORITY_HIGH, expected_output_tokens=RESULT_TOKENS_PER_JOB
+            )
             
             # Parsear respuesta JSON
             try:
                 # Extraer JSON del contenido (puede venir con markdown)
-                content = response.content.strip()
-                if "```json" in content:
-                    content = content.split("```json")[1].split("```")[0].strip()
-                elif "```" in content:
-                    content = content.split("```")[1].split("```")[0].strip()
+                content = extract_json_content(response.content)
                 
                 result = json.loads(content)
                 
                 # Validar campos requeridos
-                required_fields = ['semantic_score', 'confidence', 'key_matches', 'concerns', 'recommendation']
-                for field in required_fields:
+                for field in REQUIRED_RESULT_FIELDS:
                     if field not in result:
                         result[field] = 0.0 if field in ['semantic_score', 'confidence'] else []
                 
@@ -193,19 +215,125 @@ class SemanticMatcherAgent:
                 'recommendation': 'unknown'
             }
     
+    def estimate_job_tokens(self, job: Dict, profile: Dict, batch_size: Optional[int] = None) -> int:
+        """
+        Estima los tokens (entrada + salida) que consume analizar un trabajo.
+        
+        Las instrucciones y el resumen del perfil se reparten entre los
+        trabajos del lote.
+        
+        Args:
+            job: Trabajo a analizar
+            profile: Perfil del candidato
+            batch_size: Trabajos por llamada LLM (default: SEMANTIC_BATCH_SIZE)
+        
+        Returns:
+            Tokens estimados
+        """
+        if batch_size is None:
+            batch_size = SEMANTIC_BATCH_SIZE if self.batch_prompt_template else 1
+        shared_tokens = PROMPT_OVERHEAD_TOKENS + len(self._create_candidate_profile_summary(profile)) // CHARS_PER_TOKEN
+        job_tokens = len(self._format_jobs_block([job])) // CHARS_PER_TOKEN
+        return job_tokens + RESULT_TOKENS_PER_JOB + shared_tokens // max(1, batch_size)
+    
+    def _format_jobs_block(self, jobs: List[Dict]) -> str:
+        """Formatea los trabajos de un lote numerados desde 1 para el prompt por lotes."""
+        blocks = []
+        for index, job in enumerate(jobs, start=1):
+            description = job.get('description', job.get('summary', 'N/A')) or 'N/A'
+            blocks.append(
+                f"### Trabajo {index}\n"
+                f"Título: {job.get('title', 'N/A')}\n"
+                f"Empresa: {job.get('company', 'N/A')}\n"
+                f"Ubicación: {job.get('location', 'N/A')}\n"
+                f"Descripción: {description[:MAX_DESCRIPTION_CHARS]}"
+            )
+        return "\n\n".join(blocks)
+    
+    async def analyze_matches_batched(
+        self,
+        jobs: List[Dict],
+        profile: Dict
+    ) -> List[Optional[Dict]]:
+        """
+        Analiza varios trabajos en una sola llamada LLM (skill semantic-matcher-batch).
+        
+        El system prompt y el resumen del perfil se envían una vez por lote.
+        
+        Args:
+            jobs: Trabajos del lote
+            profile: Perfil del candidato
+        
+        Returns:
+            Lista alineada con jobs: el resultado de cada trabajo, o None si su
+            entrada falta o no se pudo parsear (el llamador debe re-analizarlo)
+        """
+        results: List[Optional[Dict]] = [None] * len(jobs)
+        if not jobs or not self.llm or not self.batch_prompt_template:
+            return results
+        
+        try:
+            prompt = self.batch_prompt_template.format_messages(
+                candidate_profile=self._create_candidate_profile_summary(profile),
+                jobs_block=self._format_jobs_block(jobs),
+                job_count=len(jobs)
+            )
+            response = await self.scheduler.ainvoke(
+                self.llm, prompt, priority=PRIORITY_HIGH,
+                expected_output_tokens=RESULT_TOKENS_PER_JOB * len(jobs)
+            )
+            parsed = json.loads(extract_json_content(response.content))
+        except Exception as e:
+            logger.warning(f"Error en análisis semántico por lotes ({len(jobs)} trabajos): {e}")
+            return results
+        
+        if isinstance(parsed, dict):
+            parsed = parsed.get('results', [parsed])
+        if not isinstance(parsed, list):
+            return results
+        
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get('job_index')) - 1
+                score = float(entry['semantic_score'])
+            except (TypeError, ValueError, KeyError):
+                continue
+            if not 0 <= index < len(jobs) or results[index] is not None:
+                continue
+            
+            result = {field: entry.get(field) for field in REQUIRED_RESULT_FIELDS}
+            result['semantic_score'] = min(100.0, max(0.0, score))
+            try:
+                result['confidence'] = float(entry.get('confidence', 0.0))
+            except (TypeError, ValueError):
+                result['confidence'] = 0.0
+            result['key_matches'] = result['key_matches'] or []
+            result['concerns'] = result['concerns'] or []
+            result['recommendation'] = result['recommendation'] or 'unknown'
+            results[index] = result
+        
+        return results
+    
     async def analyze_batch(
         self,
         jobs: List[Dict],
         profile: Dict,
-        concurrency_limit: Optional[int] = None
+        concurrency_limit: Optional[int] = None,
+        batch_size: Optional[int] = None
     ) -> List[Dict]:
         """
         Analiza semánticamente un lote de trabajos en paralelo.
         
+        Con batch_size > 1 se envían varios trabajos por llamada LLM; los que
+        fallen al parsearse se re-analizan con una llamada individual.
+        
         Args:
             jobs: Lista de trabajos a analizar
             profile: Perfil del candidato
-            concurrency_limit: Límite de llamadas paralelas (default: EMAIL_EXTRACTION_CONCURRENCY)
+            concurrency_limit: Límite de llamadas paralelas (default: LLM_MAX_CONCURRENCY)
+            batch_size: Trabajos por llamada LLM (default: SEMANTIC_BATCH_SIZE; 1 = uno por llamada)
         
         Returns:
             Lista de trabajos enriquecidos con análisis semántico
@@ -219,26 +347,63 @@ class SemanticMatcherAgent:
         
         # Usar límite de concurrencia configurado
         if concurrency_limit is None:
-            concurrency_limit = EMAIL_EXTRACTION_CONCURRENCY
+            concurrency_limit = LLM_MAX_CONCURRENCY
+        
+        if batch_size is None:
+            batch_size = SEMANTIC_BATCH_SIZE
+        if not self.batch_prompt_template:
+            batch_size = 1
         
         semaphore = asyncio.Semaphore(concurrency_limit)
         
+        def apply_result(job: Dict, semantic_result: Dict) -> Dict:
+            """Agrega el resultado semántico al job."""
+            job['semantic_analysis'] = semantic_result
+            job['semantic_score'] = semantic_result['semantic_score']
+            return job
+        
         async def process_job(job: Dict) -> Dict:
             """Procesa un trabajo individual con control de concurrencia."""
             async with semaphore:
                 semantic_result = await self.analyze_match(job, profile)
-                
-                # Agregar resultado semántico al job
-                job['semantic_analysis'] = semantic_result
-                job['semantic_score'] = semantic_result['semantic_score']
-                
-                return job
+            return apply_result(job, semantic_result)
         
-        logger.info(f"Analizando semánticamente {len(jobs)} trabajos en paralelo (concurrencia: {concurrency_limit})")
+        async def process_chunk(chunk: List[Dict]) -> List[Dict]:
+            """Procesa un lote en una llamada; re-analiza individualmente las entradas fallidas."""
+            async with semaphore:
+                batch_results = await self.analyze_matches_batched(chunk, profile)
+            
+            failed = [job for job, result in zip(chunk, batch_results) if result is None]
+            if failed:
+                logger.debug(f"Re-analizando individualmente {len(failed)}/{len(chunk)} trabajos del lote")
+                await asyncio.gather(*(process_job(job) for job in failed))
+            
+            for job, result in zip(chunk, batch_results):
+                if result is not None:
+                    apply_result(job, result)
+            return chunk
         
-        # Procesar todos los trabajos en paralelo
-        tasks = [process_job(job) for job in jobs]
-        enriched_jobs = await asyncio.gather(*tasks, return_exceptions=True)
+        if batch_size > 1:
+            logger.info(
+                f"Analizando semánticamente {len(jobs)} trabajos en lotes de {batch_size} "
+                f"(concurrencia: {concurrency_limit})"
+            )
+            chunks = [jobs[i:i + batch_size] for i in range(0, len(jobs), batch_size)]
+            chunk_results = await asyncio.gather(
+                *(process_chunk(chunk) for chunk in chunks), return_exceptions=True
+            )
+            enriched_jobs = []
+            for chunk, chunk_result in zip(chunks, chunk_results):
+                if isinstance(chunk_result, Exception):
+                    enriched_jobs.extend([chunk_result] * len(chunk))
+                else:
+                    enriched_jobs.extend(chunk_result)
+        else:
+            logger.info(f"Analizando semánticamente {len(jobs)} trabajos en paralelo (concurrencia: {concurrency_limit})")
+            
+            # Procesar todos los trabajos en paralelo
+            tasks = [process_job(job) for job in jobs]
+            enriched_jobs = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Filtrar excepciones y retornar trabajos
         result = []
@@ -34,23 +34,25 @@ class TechJobsAgent:
         # pero podemos marcar la región preferida
         location_param = None  # Stack Overflow y GitHub Jobs son principalmente remotos
         
-        # 1. Stack Overflow Jobs (RSS Feed)
-        try:
-            logger.info("Buscando en Stack Overflow Jobs...")
-            so_jobs = self.stackoverflow_client.search_jobs(keywords, self.max_results, location=location_param)
-            all_jobs.extend(so_jobs)
-            logger.info(f"Encontrados {len(so_jobs)} trabajos en Stack Overflow")
-        except Exception as e:
-            logger.error(f"Error buscando en Stack Overflow: {e}")
+        # 1. Stack Overflow Jobs (RSS Feed) y 2. GitHub Jobs (API), en paralelo
+        logger.info("Buscando en Stack Overflow Jobs y GitHub Jobs...")
+        so_result, gh_result = await asyncio.gather(
+            self.stackoverflow_client.search_jobs_async(keywords, self.max_results, location=location_param),
+            self.github_client.search_jobs_async(keywords, self.max_results),
+            return_exceptions=True
+        )
         
-        # 2. GitHub Jobs (API)
-        try:
-            logger.info("Buscando en GitHub Jobs...")
-            gh_jobs = self.github_client.search_jobs(keywords, self.max_results)
-            all_jobs.extend(gh_jobs)
-            logger.info(f"Encontrados {len(gh_jobs)} trabajos en GitHub Jobs")
-        except Exception as e:
-            logger.error(f"Error buscando en GitHub Jobs: {e}")
+        if isinstance(so_result, Exception):
+            logger.error(f"Error buscando en Stack Overflow: {so_result}")
+        else:
+            all_jobs.extend(so_result)
+            logger.info(f"Encontrados {len(so_result)} trabajos en Stack Overflow")
+        
+        if isinstance(gh_result, Exception):
+            logger.error(f"Error buscando en GitHub Jobs: {gh_result}")
+        else:
+            all_jobs.extend(gh_result)
+            logger.info(f"Encontrados {len(gh_result)} trabajos en GitHub Jobs")
         
         # Enriquecer todos los trabajos con metadata de región
         for job in all_jobs:
@@ -65,3 +67,8 @@ class TechJobsAgent:
         
         logger.info(f"Total de trabajos técnicos encontrados: {len(all_jobs)}")
         return all_jobs
+    
+    async def close(self) -> None:
+        """Cierra las sesiones HTTP asíncronas de los clientes."""
+        await self.stackoverflow_client.aclose()
+        await self.github_client.aclose()
@@ -110,6 +110,36 @@ def get_search_regions() -> Dict:
     return config.get('search_regions', {})
 
 
+def get_domain_concurrency(domain: str, default: int = 1) -> int:
+    """Obtiene la concurrencia máxima configurada para un dominio.
+    
+    Busca en domain_concurrency de job_sources.yaml comparando por sufijo,
+    de modo que "linkedin.com" aplica también a "www.linkedin.com".
+    
+    Args:
+        domain: Dominio o host (ej: 'www.linkedin.com')
+        default: Valor a usar si el dominio no está configurado
+    
+    Returns:
+        Número máximo de operaciones simultáneas para el dominio (>= 1)
+    """
+    config = load_job_sources_config()
+    limits = config.get('domain_concurrency') or {}
+    host = (domain or '').lower().split(':')[0]
+    
+    # El sufijo configurado más largo (más específico) tiene prioridad
+    for configured in sorted(limits, key=len, reverse=True):
+        suffix = str(configured).lower()
+        if host == suffix or host.endswith('.' + suffix):
+            try:
+                return max(1, int(limits[configured]))
+            except (TypeError, ValueError):
+                logger.warning(f"Valor inválido en domain_concurrency para {configured}: {limits[configured]}")
+                break
+    
+    return max(1, default)
+
+
 def clear_cache():
     """Limpia el cache de configuración."""
     global _cached_config
@@ -60,12 +60,15 @@ REMOTEOK_API_KEY: Optional[str] = os.getenv("REMOTEOK_API_KEY")
 # Search Configuration
 MAX_JOBS_PER_SOURCE: int = int(os.getenv("MAX_JOBS_PER_SOURCE", "50"))
 MIN_MATCH_SCORE: int = int(os.getenv("MIN_MATCH_SCORE", "60"))
+MATCHER_WORKERS: int = int(os.getenv("MATCHER_WORKERS", "1"))  # Procesos para el scoring heurístico (1 = sin pool, 0 = todos los núcleos)
+MATCHER_PARALLEL_MIN_JOBS: int = int(os.getenv("MATCHER_PARALLEL_MIN_JOBS", "2000"))  # Trabajos mínimos para usar el pool
 SEARCH_TIMEOUT: int = int(os.getenv("SEARCH_TIMEOUT", "30"))  # segundos
 
 # Scraping Configuration
 SCRAPING_DELAY: float = float(os.getenv("SCRAPING_DELAY", "2.0"))  # segundos entre requests
 MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
 HEADLESS_BROWSER: bool = os.getenv("HEADLESS_BROWSER", "true").lower() == "true"
+BROWSER_MAX_CONTEXTS_PER_DOMAIN: int = int(os.getenv("BROWSER_MAX_CONTEXTS_PER_DOMAIN", "2"))  # Contextos simultáneos por dominio en el navegador compartido
 
 # Anti-Bot Configuration
 USE_USER_AGENT_ROTATION: bool = os.getenv("USE_USER_AGENT_ROTATION", "true").lower() == "true"
@@ -94,8 +97,17 @@ USE_ADAPTIVE_KEYWORDS: bool = os.getenv("USE_ADAPTIVE_KEYWORDS", "true").lower()
 USE_SEMANTIC_MATCHING: bool = os.getenv("USE_SEMANTIC_MATCHING", "true").lower() == "true"  # Análisis semántico profundo de relevancia
 SEMANTIC_MATCHING_THRESHOLD: int = int(os.getenv("SEMANTIC_MATCHING_THRESHOLD", "50"))  # Score mínimo para análisis semántico
 SEMANTIC_MAX_JOBS: int = int(os.getenv("SEMANTIC_MAX_JOBS", "100"))  # Máximo de trabajos a analizar semánticamente
+SEMANTIC_MAX_JOBS_PER_REGION: int = int(os.getenv("SEMANTIC_MAX_JOBS_PER_REGION", "0"))  # Cuota por región de búsqueda (0 = sin límite)
+SEMANTIC_MAX_JOBS_PER_SOURCE: int = int(os.getenv("SEMANTIC_MAX_JOBS_PER_SOURCE", "0"))  # Cuota por fuente (0 = sin límite)
+SEMANTIC_TOKEN_BUDGET: int = int(os.getenv("SEMANTIC_TOKEN_BUDGET", "0"))  # Tokens estimados para el análisis semántico (0 = sin límite)
+SEMANTIC_BATCH_SIZE: int = max(1, int(os.getenv("SEMANTIC_BATCH_SIZE", "5")))  # Trabajos por llamada LLM (1 = uno por llamada)
 SEMANTIC_WEIGHT: float = float(os.getenv("SEMANTIC_WEIGHT", "0.6"))  # Peso del score semántico en score final (0-1)
 HEURISTIC_WEIGHT: float = float(os.getenv("HEURISTIC_WEIGHT", "0.4"))  # Peso del score heurístico en score final (0-1)
+LOCAL_RELEVANCE_WEIGHT: float = float(os.getenv("LOCAL_RELEVANCE_WEIGHT", "0.0"))  # Peso de la relevancia TF-IDF local en score final (0 = deshabilitada)
+USE_EMBEDDING_MATCHING: bool = os.getenv("USE_EMBEDDING_MATCHING", "false").lower() == "true"  # Similitud de embeddings perfil-trabajo en el score heurístico
+EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
+EMBEDDING_BATCH_SIZE: int = max(1, int(os.getenv("EMBEDDING_BATCH_SIZE", "256")))  # Textos por llamada a embed_documents
+EMBEDDING_WEIGHT: float = float(os.getenv("EMBEDDING_WEIGHT", "0.3"))  # Peso de la similitud en el score heurístico (0-1)
 
 # User Profile (REQUIRED - no default values for privacy)
 USER_EMAIL: Optional[str] = os.getenv("USER_EMAIL")
@@ -120,11 +132,38 @@ LOG_FILE: Optional[str] = os.getenv("LOG_FILE")
 # Cache Configuration
 USE_CACHE: bool = os.getenv("USE_CACHE", "true").lower() == "true"
 CACHE_EXPIRY_HOURS: int = int(os.getenv("CACHE_EXPIRY_HOURS", "24"))
+CACHE_MAX_SIZE_MB: int = int(os.getenv("CACHE_MAX_SIZE_MB", "200"))  # límite por archivo de cache
+CACHE_DIR: Path = DATA_DIR / "cache"
+# Cache persistente de respuestas LLM (mismo modelo + mismo prompt => misma respuesta)
+USE_LLM_CACHE: bool = os.getenv("USE_LLM_CACHE", "true").lower() == "true"
+LLM_CACHE_TTL_HOURS: int = int(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+
+# Scheduler global de llamadas LLM (límites por proveedor/modelo; 0 = sin límite)
+LLM_RPM_LIMIT: int = int(os.getenv("LLM_RPM_LIMIT", "500"))  # Requests por minuto
+LLM_TPM_LIMIT: int = int(os.getenv("LLM_TPM_LIMIT", "200000"))  # Tokens por minuto (estimados antes de enviar)
+LLM_MAX_CONCURRENCY: int = max(1, int(os.getenv("LLM_MAX_CONCURRENCY", "10")))  # Llamadas simultáneas
+LLM_RATE_LIMIT_RETRIES: int = int(os.getenv("LLM_RATE_LIMIT_RETRIES", "5"))  # Reintentos ante 429 (con backoff)
+# Cache persistente de keywords adaptativos (perfil + keywords base + fuente + región + versión del skill)
+USE_KEYWORD_CACHE: bool = os.getenv("USE_KEYWORD_CACHE", "true").lower() == "true"
+KEYWORD_CACHE_TTL_HOURS: int = int(os.getenv("KEYWORD_CACHE_TTL_HOURS", "168"))
+
+# Job Store (corpus persistente de trabajos entre ejecuciones)
+USE_JOB_STORE: bool = os.getenv("USE_JOB_STORE", "true").lower() == "true"
+JOB_STORE_PATH: Path = Path(os.getenv("JOB_STORE_PATH", str(DATA_DIR / "jobs.sqlite")))
+# Modo incremental: solo trabajos nuevos o modificados pasan por emails y análisis semántico
+INCREMENTAL_MODE: bool = os.getenv("INCREMENTAL_MODE", "false").lower() == "true"
+# Fusión de ofertas casi duplicadas entre fuentes/países antes del enriquecimiento
+USE_NEAR_DEDUP: bool = os.getenv("USE_NEAR_DEDUP", "true").lower() == "true"
+NEAR_DEDUP_THRESHOLD: float = float(os.getenv("NEAR_DEDUP_THRESHOLD", "0.8"))  # Similitud Jaccard mínima (0-1)
 
 # Performance Optimization Configuration
 FAST_MODE: bool = os.getenv("FAST_MODE", "false").lower() == "true"
 EMAIL_EXTRACTION_CONCURRENCY: int = int(os.getenv("EMAIL_EXTRACTION_CONCURRENCY", "10"))
-EMAIL_BATCH_SIZE: int = int(os.getenv("EMAIL_BATCH_SIZE", "5"))
+EMAIL_BATCH_SIZE: int = max(1, int(os.getenv("EMAIL_BATCH_SIZE", "5")))  # Descripciones por llamada LLM (1 = una por llamada)
+# Extracción de emails con LLM solo para trabajos relevantes (el resto usa regex)
+EMAIL_LLM_MIN_SCORE: int = int(os.getenv("EMAIL_LLM_MIN_SCORE", "40"))  # Score heurístico mínimo
+EMAIL_LLM_MAX_JOBS: int = int(os.getenv("EMAIL_LLM_MAX_JOBS", "100"))  # Top N por score (0 = sin límite)
+EMAIL_LLM_PRECHECK: bool = os.getenv("EMAIL_LLM_PRECHECK", "true").lower() == "true"  # Sin señal de contacto ambigua: solo regex
 
 # Timeouts (milliseconds for browser, seconds for requests)
 PAGE_LOAD_TIMEOUT: int = int(os.getenv("PAGE_LOAD_TIMEOUT", "30000"))  # milliseconds
@@ -170,6 +209,21 @@ if abs((SEMANTIC_WEIGHT + HEURISTIC_WEIGHT) - 1.0) > 0.001:
         "must sum to 1.0. Check your .env file or environment variables."
     )
 
+# LOCAL_RELEVANCE_WEIGHT solo debe ser >= 0: con peso > 0, _combine_weighted_scores
+# (orchestrator) renormaliza heurístico, semántico y local por la suma de sus pesos,
+# así que los tres no necesitan sumar 1
+if LOCAL_RELEVANCE_WEIGHT < 0:
+    raise ValueError(
+        f"LOCAL_RELEVANCE_WEIGHT ({LOCAL_RELEVANCE_WEIGHT}) must be >= 0. "
+        "Check your .env file or environment variables."
+    )
+
+if not (0 <= EMBEDDING_WEIGHT <= 1):
+    raise ValueError(
+        f"EMBEDDING_WEIGHT ({EMBEDDING_WEIGHT}) must be between 0 and 1. "
+        "Check your .env file or environment variables."
+    )
+
 # Validate configuration ranges
 if MIN_DELAY >= MAX_DELAY:
     raise ValueError(
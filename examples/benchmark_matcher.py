@@ -0,0 +1,121 @@
+"""
+Benchmark del matching heurístico: match_jobs (trabajo por trabajo) vs match_jobs_batch.
+
+Genera trabajos sintéticos con términos del vocabulario de scoring y mide:
+- match_jobs: calculate_match_score por trabajo
+- match_jobs_batch: tokenización + matriz de ocurrencias + scoring con NumPy
+- re-scoring: match_jobs_batch reutilizando la matriz de ocurrencias (p.ej. al
+  ajustar pesos en job_sources.yaml sobre el corpus histórico)
+- con --workers N: match_jobs repartido en N procesos (MATCHER_WORKERS)
+
+Uso:
+    python examples/benchmark_matcher.py --sizes 10000 100000
+    python examples/benchmark_matcher.py --sizes 100000 --workers 8
+"""
+
+import argparse
+import copy
+import random
+import sys
+import time
+from pathlib import Path
+
+# Agregar directorio padre al path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.matcher_agent import MatcherAgent
+
+SAMPLE_PROFILE = {
+    'skills': {
+        'AI/ML': ['Python', 'TensorFlow', 'LLM', 'Machine Learning', 'MLOps'],
+        'Cloud': ['AWS', 'GCP', 'Docker', 'Kubernetes'],
+        'Backend': ['Django', 'FastAPI', 'PostgreSQL', 'Node.js']
+    },
+    'experience': [
+        {'role': 'Senior AI Engineer', 'technologies': ['Python', 'AWS', 'LLM', 'FastAPI']}
+    ]
+}
+
+FILLER = (
+    'we are looking for a motivated engineer to join our growing team and build '
+    'reliable products with modern tooling collaboration ownership impact'
+).split()
+
+
+def generate_jobs(agent: MatcherAgent, count: int, seed: int = 42) -> list:
+    """Genera trabajos sintéticos (~2-3K caracteres) mezclando relleno y términos del vocabulario."""
+    rng = random.Random(seed)
+    vocabulary = list(agent._get_profile_index().skills) + list(agent.relevant_keywords)
+    for terms in (agent.employment_type_terms, agent.location_terms, agent.experience_level_terms):
+        for values in terms.values():
+            vocabulary.extend(values)
+    for key in ('fluent_english_required', 'acceptable_english', 'preferred_languages', 'preferred_regions'):
+        vocabulary.extend(agent.language_prefs.get(key, []) or [])
+    locations = ['Remote', 'Bogotá, Colombia', 'Madrid, España', 'New York, NY', 'Remote - LATAM', '']
+
+    jobs = []
+    for i in range(count):
+        words = [rng.choice(FILLER) for _ in range(rng.randint(250, 400))]
+        for _ in range(rng.randint(3, 15)):
+            words.insert(rng.randrange(len(words)), str(rng.choice(vocabulary)))
+        jobs.append({
+            'title': f"{rng.choice(['Senior', 'Junior', ''])} {rng.choice(vocabulary)} Engineer",
+            'description': ' '.join(words),
+            'location': rng.choice(locations),
+            'region_priority': rng.choice([1, 2, 3]),
+            'id': i
+        })
+    return jobs
+
+
+def run(sizes: list, workers: int = 1) -> None:
+    agent = MatcherAgent()
+    agent.profile = SAMPLE_PROFILE
+
+    header = f"{'trabajos':>10} {'match_jobs':>12} {'batch':>10} {'speedup':>8} {'re-scoring':>11} {'speedup':>8}"
+    if workers > 1:
+        header += f" {f'{workers} procesos':>12} {'speedup':>8}"
+    print(header)
+    for size in sizes:
+        jobs = generate_jobs(agent, size)
+
+        baseline_jobs = copy.deepcopy(jobs)
+        start = time.perf_counter()
+        expected = agent.match_jobs(baseline_jobs)
+        baseline = time.perf_counter() - start
+
+        batch_jobs = copy.deepcopy(jobs)
+        start = time.perf_counter()
+        batched = agent.match_jobs_batch(batch_jobs)
+        batch = time.perf_counter() - start
+
+        occurrences = agent.build_job_occurrences(jobs)
+        rescore_jobs = copy.deepcopy(jobs)
+        start = time.perf_counter()
+        agent.match_jobs_batch(rescore_jobs, occurrences)
+        rescore = time.perf_counter() - start
+
+        if batched != expected:
+            raise AssertionError("match_jobs_batch no coincide con match_jobs")
+
+        line = (f"{size:>10} {baseline:>11.2f}s {batch:>9.2f}s {baseline / batch:>7.1f}x "
+                f"{rescore:>10.2f}s {baseline / rescore:>7.1f}x")
+
+        if workers > 1:
+            parallel_jobs = copy.deepcopy(jobs)
+            start = time.perf_counter()
+            parallel = agent._sort_matched_jobs(agent._match_jobs_parallel(parallel_jobs, workers))
+            elapsed = time.perf_counter() - start
+            if parallel != expected:
+                raise AssertionError("match_jobs con procesos no coincide con match_jobs")
+            line += f" {elapsed:>11.2f}s {baseline / elapsed:>7.1f}x"
+
+        print(line)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark de match_jobs vs match_jobs_batch")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    parser.add_argument('--workers', type=int, default=1, help="Procesos para comparar match_jobs en paralelo")
+    args = parser.parse_args()
+    run(args.sizes, args.workers)
@@ -110,3 +110,84 @@ def test_results_dir(tmp_path: Path) -> Path:
     results_dir = tmp_path / "test_results"
     results_dir.mkdir(exist_ok=True)
     return results_dir
+
+
+@pytest.fixture(autouse=True)
+def isolated_response_cache(tmp_path: Path, monkeypatch):
+    """Usa un cache de respuestas HTTP temporal para que los tests no lean ni escriban en DATA_DIR."""
+    from utils import response_cache
+    from utils.disk_cache import DiskCache
+
+    cache = response_cache.ResponseCache(DiskCache(tmp_path / "http_responses.sqlite"))
+    monkeypatch.setattr(response_cache, "_response_cache", cache)
+    yield cache
+    cache.store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_llm_cache(tmp_path: Path, monkeypatch):
+    """Usa un cache LLM temporal para que los tests no lean ni escriban en DATA_DIR."""
+    from utils import llm_cache
+    from utils.disk_cache import DiskCache
+
+    cache = llm_cache.DiskLLMCache(DiskCache(tmp_path / "llm_responses.sqlite"))
+    monkeypatch.setattr(llm_cache, "_llm_cache", cache)
+    yield cache
+    cache.store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_agent_runtime(monkeypatch):
+    """Runtime nuevo por test: los clientes LLM compartidos usan el cache LLM temporal del test."""
+    from utils import agent_runtime
+
+    runtime = agent_runtime.AgentRuntime()
+    monkeypatch.setattr(agent_runtime, "_runtime", runtime)
+    yield runtime
+    runtime.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_keyword_cache(tmp_path: Path, monkeypatch):
+    """Usa un cache de keywords temporal para que los tests no lean ni escriban en DATA_DIR."""
+    from utils import keyword_cache
+    from utils.disk_cache import DiskCache
+
+    cache = keyword_cache.KeywordCache(DiskCache(tmp_path / "keywords.sqlite"))
+    monkeypatch.setattr(keyword_cache, "_keyword_cache", cache)
+    yield cache
+    cache.store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_single_flight(monkeypatch):
+    """Registro single-flight nuevo por test para no compartir resultados memorizados entre tests."""
+    from utils import single_flight
+
+    registry = single_flight.SingleFlight()
+    monkeypatch.setattr(single_flight, "_single_flight", registry)
+    return registry
+
+
+@pytest.fixture(autouse=True)
+def isolated_job_store(tmp_path: Path, monkeypatch):
+    """Corpus de trabajos temporal para que los tests no escriban en DATA_DIR."""
+    from utils import job_store
+
+    store = job_store.JobStore(tmp_path / "jobs.sqlite")
+    monkeypatch.setattr(job_store, "_job_store", store)
+    yield store
+    store.close()
+
+
+@pytest.fixture(autouse=True)
+def isolated_embedding_cache(tmp_path: Path, monkeypatch):
+    """Cache de embeddings temporal para que los tests no escriban en DATA_DIR."""
+    from utils import embedding_cache
+
+    caches = {}
+    monkeypatch.setattr(embedding_cache, "_embedding_caches", caches)
+    monkeypatch.setattr(embedding_cache, "CACHE_DIR", tmp_path / "cache")
+    yield caches
+    for cache in caches.values():
+        cache.close()
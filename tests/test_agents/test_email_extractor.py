@@ -1,6 +1,7 @@
 """Tests unitarios para el agente de extracción de emails."""
 
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from agents.email_extractor_agent import EmailExtractorAgent, ContactInfo
 
 
@@ -38,6 +39,69 @@ class TestEmailExtractorAgent:
         
         assert 'jobs@example.com' in result['emails']
     
+    def test_classify_contact_signal(self, agent):
+        """Test que el pre-clasificador separa descripciones sin señal, explícitas y ambiguas."""
+        classify = agent.validator.classify_contact_signal
+        
+        assert classify("Build APIs with Python and AWS. Remote, full-time.") == 'none'
+        assert classify("Send your CV to jobs@example.com") == 'explicit'
+        assert classify("Write to careers [at] acme [dot] com") == 'ambiguous'
+        assert classify("Escribe a talento arroba acme.co") == 'ambiguous'
+        assert classify("Email us at careers at acme dot com") == 'ambiguous'
+        assert classify("Para aplicar envía tu CV por correo al reclutador") == 'ambiguous'
+        # "at" + dominio en prosa técnica no es un email ofuscado
+        assert classify("Senior engineer, expert at Node.js and React") == 'none'
+        assert classify("Frontend dev at Vue.js shop, remote") == 'none'
+        assert classify("Join our Engineers at Booking.com") == 'none'
+    
+    @pytest.mark.asyncio
+    async def test_llm_only_called_for_ambiguous_descriptions(self, agent):
+        """Test que el LLM no se llama sin señal de contacto ni con emails explícitos."""
+        agent.llm = MagicMock()
+        agent.llm.ainvoke = AsyncMock(side_effect=RuntimeError("LLM no disponible"))
+        jobs = [
+            {'description': 'Python backend role, remote friendly'},
+            {'description': 'Apply at jobs@example.com'},
+            {'description': 'Contact hr [at] example [dot] com'},
+        ]
+        
+        result = await agent.extract_from_jobs(jobs)
+        
+        assert [job['email_used_llm'] for job in result] == [False, False, True]
+        assert result[1]['emails'] == ['jobs@example.com']
+        assert agent.llm.ainvoke.await_count == 1
+        
+        with patch('agents.email_extractor_agent.EMAIL_LLM_PRECHECK', False):
+            assert agent.needs_llm('Python backend role, remote friendly') is True
+    
+    @pytest.mark.asyncio
+    async def test_batched_extraction_demultiplexes_with_fallback(self, agent):
+        """Test que el modo por lotes hace una llamada por lote y re-procesa entradas inválidas."""
+        jobs = [
+            {'title': 'A', 'description': 'Send your CV to ana [at] acme [dot] com'},
+            {'title': 'B', 'description': 'Contact: hr (at) beta.io'},
+            {'title': 'C', 'description': 'Write to jobs [at] gamma [dot] dev'},
+            {'title': 'D', 'description': 'Python role, remote friendly'},
+        ]
+        batched_response = MagicMock(content=(
+            '```json\n[{"job_index": 1, "emails": ["ana@acme.com"], "application_email": "ana@acme.com", '
+            '"confidence": 0.9}, '
+            '{"job_index": 2, "emails": ["ana@acme.com"], "confidence": 0.8}, '
+            '{"job_index": 3, "emails": ["jobs@gamma.dev"], "confidence": 7}]\n```'
+        ))
+        single_response = MagicMock(content='{"emails": ["hr@beta.io"], "confidence": 0.7}')
+        agent.llm = MagicMock()
+        agent.llm.ainvoke = AsyncMock(side_effect=[batched_response, single_response, single_response])
+        
+        result = await agent.extract_from_jobs(jobs, batch_size=5)
+        
+        # 1 llamada por lote + 2 individuales (job 2 con email de otro trabajo, job 3 con confianza inválida)
+        assert agent.llm.ainvoke.await_count == 3
+        assert result[0]['emails'] == ['ana@acme.com']
+        assert result[0]['contact_info']['confidence'] == 0.9
+        assert result[1]['emails'] == ['hr@beta.io']
+        assert [job['email_used_llm'] for job in result] == [True, True, True, False]
+    
     @pytest.mark.asyncio
     async def test_extract_from_jobs_parallel(self, agent, sample_jobs):
         """Test extracción paralela de múltiples jobs."""
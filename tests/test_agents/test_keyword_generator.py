@@ -110,3 +110,57 @@ class TestKeywordGeneratorAgent:
         agent.clear_cache()
         
         assert len(agent._cache) == 0
+    
+    @pytest.mark.asyncio
+    async def test_generate_keywords_matrix_single_call(self, sample_profile):
+        """Test que una llamada genera todas las combinaciones y las inválidas se piden aparte."""
+        agent = KeywordGeneratorAgent()
+        matrix_response = Mock(content=(
+            '```json\n{"linkedin": {"hispanic": ["Ingeniero de IA", "Desarrollador Python"], '
+            '"english": ["Senior AI Engineer", "ML Engineer"]}, '
+            '"RemoteOK": {"hispanic": ["Remote Python Developer"], "english": ["!!", "a"]}}\n```'
+        ))
+        single_response = Mock(content="Remote AI Engineer\nRemote ML Engineer")
+        agent.llm = Mock()
+        agent.llm.ainvoke = AsyncMock(side_effect=[matrix_response, single_response])
+        
+        matrix = await agent.generate_keywords_matrix(
+            sample_profile, ['linkedin', 'remoteok'], ['hispanic', 'english'], num_keywords=2
+        )
+        
+        # 1 llamada para la matriz + 1 individual (remoteok/english sin keywords válidos)
+        assert agent.llm.ainvoke.await_count == 2
+        assert matrix['linkedin']['english'] == ['Senior AI Engineer', 'ML Engineer']
+        assert matrix['remoteok']['hispanic'] == ['Remote Python Developer']
+        assert matrix['remoteok']['english'] == ['Remote AI Engineer', 'Remote ML Engineer']
+        
+        # Las combinaciones quedan en caché: generate_keywords no vuelve a llamar al LLM
+        assert await agent.generate_keywords(sample_profile, 'linkedin', 'hispanic') == [
+            'Ingeniero de IA', 'Desarrollador Python'
+        ]
+        assert agent.llm.ainvoke.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_keywords_persist_across_instances(self, sample_profile):
+        """Test que otra instancia (otra ejecución) reutiliza los keywords sin llamar al LLM."""
+        first = KeywordGeneratorAgent()
+        first.llm = Mock()
+        first.llm.ainvoke = AsyncMock(return_value=Mock(content="Senior AI Engineer\nPython ML Engineer"))
+        keywords = await first.generate_keywords(sample_profile, 'linkedin', 'english', ['AI Engineer'], 2)
+        
+        second = KeywordGeneratorAgent()
+        second.llm = Mock()
+        second.llm.ainvoke = AsyncMock(side_effect=AssertionError("no debe llamarse al LLM"))
+        
+        # Keywords base iguales salvo mayúsculas/espacios: misma entrada
+        assert await second.generate_keywords(sample_profile, 'linkedin', 'english', [' ai  engineer'], 2) == keywords
+        
+        # Otro perfil o keywords base distintos: otra entrada
+        key = second.persistent_cache.make_key
+        profile_hash = second._get_profile_hash(sample_profile)
+        assert key(profile_hash, 'linkedin', 'english', ['AI Engineer'], 2, second.skill_version) != key(
+            profile_hash, 'linkedin', 'english', ['Data Engineer'], 2, second.skill_version
+        )
+        assert key(profile_hash, 'linkedin', 'english', ['AI Engineer'], 2, second.skill_version) != key(
+            second._get_profile_hash({'skills': ['Go']}), 'linkedin', 'english', ['AI Engineer'], 2, second.skill_version
+        )
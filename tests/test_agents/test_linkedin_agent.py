@@ -0,0 +1,64 @@
+"""Tests para LinkedInAgent."""
+
+import pytest
+import asyncio
+from unittest.mock import patch
+from agents.linkedin_agent import LinkedInAgent
+from config.config_loader import get_domain_concurrency
+
+
+class TestLinkedInAgent:
+    """Tests para la búsqueda por países de LinkedIn."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_respects_domain_limit(self):
+        """Test que la búsqueda concurrente no supera el límite por dominio y conserva el orden."""
+        agent = LinkedInAgent()
+        agent.config = {'job_sources': {'linkedin': {'concurrent_countries': True}}}
+        agent._domain_semaphore = asyncio.Semaphore(2)
+
+        active = 0
+        max_active = 0
+
+        async def fake_scrape(keywords, max_results, location=None):
+            nonlocal active, max_active
+            active += 1
+            max_active = max(max_active, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return [{'title': f'Job {location}', 'url': f'https://linkedin.com/{location}'}]
+
+        countries = ['Colombia', 'México', 'Chile', 'Perú', 'España']
+        with patch('agents.linkedin_agent.scrape_linkedin_jobs', side_effect=fake_scrape):
+            jobs = await agent.search(['AI Engineer'], countries=countries)
+
+        assert max_active == 2
+        assert [job['search_country'] for job in jobs] == countries
+        assert all(job['source'] == 'linkedin' for job in jobs)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_search_isolates_country_errors(self):
+        """Test que el fallo de un país no descarta los resultados de los demás."""
+        agent = LinkedInAgent()
+        agent.config = {'job_sources': {'linkedin': {'concurrent_countries': True}}}
+
+        async def fake_scrape(keywords, max_results, location=None):
+            if location == 'Chile':
+                raise RuntimeError("bloqueado")
+            return [{'title': 'Job', 'location': ''}]
+
+        with patch('agents.linkedin_agent.scrape_linkedin_jobs', side_effect=fake_scrape):
+            jobs = await agent.search(['AI Engineer'], countries=['Colombia', 'Chile'])
+
+        assert len(jobs) == 1
+        assert jobs[0]['search_country'] == 'Colombia'
+        assert jobs[0]['location'] == 'Colombia'
+
+    def test_domain_concurrency_suffix_match(self):
+        """Test que domain_concurrency aplica a subdominios y usa el default si no hay entrada."""
+        config = {'domain_concurrency': {'linkedin.com': 3}}
+        with patch('config.config_loader.load_job_sources_config', return_value=config):
+            assert get_domain_concurrency('www.linkedin.com', default=2) == 3
+            assert get_domain_concurrency('linkedin.com', default=2) == 3
+            assert get_domain_concurrency('notlinkedin.com', default=2) == 2
+            assert get_domain_concurrency('remoteok.com', default=5) == 5
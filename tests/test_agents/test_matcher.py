@@ -71,3 +71,99 @@ class TestMatcherAgent:
         filtered = [job for job in sample_jobs if job['match_score'] >= 60]
         
         assert all(job['match_score'] >= 60 for job in filtered)
+    
+    def test_terms_match_whole_words_only(self, agent):
+        """Test que los términos de scoring respetan límites de palabra ("ai" no está en "maintain")."""
+        agent.profile = {'skills': ['AI']}
+        
+        job = {'title': 'Maintenance technician', 'description': 'Maintain the seniority of machines', 'location': ''}
+        agent.calculate_match_score(job)
+        
+        assert job['matched_skills'] == []
+        assert job['match_factors']['level_match'] == int(agent.scoring_weights['experience_level'] * 0.3)
+        
+        job = {'title': 'Senior AI Engineer', 'description': 'Full-time', 'location': 'Remote'}
+        agent.calculate_match_score(job)
+        
+        assert job['matched_skills'] == ['ai']
+        assert job['match_factors']['level_match'] == agent.experience_level_scores['senior']
+        assert job['match_factors']['location_match'] == agent.location_scores['remote']
+    
+    def test_match_jobs_batch_equals_match_jobs(self, agent, sample_profile):
+        """Test que el modo vectorizado produce exactamente el mismo resultado que match_jobs."""
+        import copy
+        agent.profile = sample_profile
+        
+        jobs = [
+            {'title': 'Senior Python Developer', 'description': 'Full-time AI role, fluent English', 'location': 'Remote'},
+            {'title': 'Desarrollador Python', 'description': 'Trabajo en español, contrato', 'location': 'Bogotá, Colombia'},
+            {'title': 'Junior ML Engineer', 'description': 'Part-time, intermediate English', 'location': ''},
+            {'title': 'Data Analyst', 'description': 'occasional travel', 'summary': 'AWS LLM', 'location': 'Madrid'},
+            {'title': 'Chef', 'description': '', 'location': 'Remote - LATAM', 'region_priority': 1},
+        ]
+        expected = agent.match_jobs(copy.deepcopy(jobs))
+        batched = agent.match_jobs_batch(copy.deepcopy(jobs))
+        
+        assert batched == expected
+        
+        # Reutilizar la matriz de ocurrencias con otros pesos no requiere re-tokenizar
+        occurrences = agent.build_job_occurrences(jobs)
+        agent.scoring_weights = {**agent.scoring_weights, 'skills_match': 50}
+        assert agent.match_jobs_batch(copy.deepcopy(jobs), occurrences) == agent.match_jobs(copy.deepcopy(jobs))
+    
+    def test_match_jobs_parallel_equals_serial(self, agent, sample_profile, monkeypatch):
+        """Test que el scoring con pool de procesos produce el mismo resultado y orden."""
+        import copy
+        import agents.matcher_agent as matcher_module
+        agent.profile = sample_profile
+        
+        jobs = [
+            {'title': f'{level} Python Developer {i}', 'description': desc, 'location': location, 'id': i}
+            for i, (level, desc, location) in enumerate([
+                ('Senior', 'Full-time AI role, fluent English', 'Remote'),
+                ('Junior', 'Trabajo en español, contrato', 'Bogotá, Colombia'),
+                ('', 'Part-time, intermediate English', ''),
+                ('Mid', 'occasional travel AWS LLM', 'Madrid'),
+            ] * 3)
+        ]
+        expected = agent.match_jobs(copy.deepcopy(jobs), workers=1)
+        
+        parallel = agent._sort_matched_jobs(agent._match_jobs_parallel(copy.deepcopy(jobs), workers=2))
+        assert parallel == expected
+        
+        monkeypatch.setattr(matcher_module, 'MATCHER_PARALLEL_MIN_JOBS', 0)
+        assert agent.match_jobs(copy.deepcopy(jobs), workers=2) == expected
+    
+    def test_embedding_similarity_blends_into_score(self, agent, sample_profile, monkeypatch):
+        """Test que la similitud de embeddings se combina en el score y el perfil se embebe una sola vez."""
+        import agents.matcher_agent as matcher_module
+        
+        class FakeEmbeddings:
+            def __init__(self):
+                self.calls = []
+            
+            def embed_documents(self, texts):
+                self.calls.append(list(texts))
+                return [[1.0, 0.0] if 'Python' in text else [0.0, 1.0] for text in texts]
+        
+        agent.profile = sample_profile
+        agent.embeddings = FakeEmbeddings()
+        monkeypatch.setattr(matcher_module, 'USE_EMBEDDING_MATCHING', True)
+        monkeypatch.setattr(matcher_module, 'EMBEDDING_WEIGHT', 0.5)
+        
+        jobs = [
+            {'title': 'Python Developer', 'description': 'Backend', 'location': ''},
+            {'title': 'Chef', 'description': 'Kitchen', 'location': ''},
+        ]
+        heuristic = {job['title']: agent.calculate_match_score(dict(job)) for job in jobs}
+        matched = {job['title']: job for job in agent.match_jobs([dict(job) for job in jobs])}
+        
+        assert matched['Python Developer']['embedding_similarity'] == 1.0
+        assert matched['Python Developer']['match_score'] == heuristic['Python Developer'] * 0.5 + 50.0
+        assert matched['Chef']['match_factors']['embedding_match'] == 0.0
+        assert matched['Chef']['match_score'] == heuristic['Chef'] * 0.5
+        
+        # Segunda corrida: perfil y trabajos salen del cache, sin llamar al proveedor
+        calls = len(agent.embeddings.calls)
+        agent.match_jobs([dict(job) for job in jobs])
+        assert len(agent.embeddings.calls) == calls
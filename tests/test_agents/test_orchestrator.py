@@ -0,0 +1,189 @@
+"""Tests para el modo incremental de JobSearchOrchestrator."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from agents.orchestrator import JobSearchOrchestrator
+from utils.job_store import JobStore
+
+
+def _make_orchestrator(store: JobStore) -> JobSearchOrchestrator:
+    """Crea un orquestador sin inicializar agentes reales."""
+    orchestrator = JobSearchOrchestrator.__new__(JobSearchOrchestrator)
+    orchestrator.job_store = store
+    orchestrator.email_extractor = MagicMock()
+    orchestrator.email_extractor.extract_from_jobs = AsyncMock(
+        side_effect=lambda jobs, use_llm=None: [
+            {**job, 'contact_info': {}, 'emails': [f"hr{job['url'][-1]}@x.com"]} for job in jobs
+        ]
+    )
+    return orchestrator
+
+
+def _state(jobs):
+    return {'jobs': jobs, 'emails': [], 'errors': [], 'profile': {}, 'matched_jobs': []}
+
+
+class TestIncrementalMode:
+    """Tests para el procesamiento solo de trabajos nuevos o modificados."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_jobs_reuse_stored_emails(self, tmp_path):
+        """Test que solo los trabajos nuevos o modificados pasan por la extracción de emails."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        orchestrator = _make_orchestrator(store)
+
+        with patch('agents.orchestrator.INCREMENTAL_MODE', True):
+            first_run = [{'url': 'https://x.com/1', 'title': 'A'}, {'url': 'https://x.com/2', 'title': 'B'}]
+            store.upsert_jobs(first_run)
+            await orchestrator._extract_emails(_state(first_run))
+            assert orchestrator.email_extractor.extract_from_jobs.await_count == 1
+
+            second_run = [
+                {'url': 'https://x.com/1', 'title': 'A'},
+                {'url': 'https://x.com/2', 'title': 'B (editado)'},
+                {'url': 'https://x.com/3', 'title': 'C'},
+            ]
+            store.upsert_jobs(second_run)
+            state = await orchestrator._extract_emails(_state(second_run))
+
+        processed = orchestrator.email_extractor.extract_from_jobs.await_args.args[0]
+        assert [job['url'] for job in processed] == ['https://x.com/2', 'https://x.com/3']
+        assert [job['url'] for job in state['jobs']] == [job['url'] for job in second_run]
+        assert state['jobs'][0]['emails'] == ['hr1@x.com']
+        assert sorted(state['emails']) == ['hr1@x.com', 'hr2@x.com', 'hr3@x.com']
+
+    @pytest.mark.asyncio
+    async def test_changed_content_is_reprocessed_and_copies_kept(self, tmp_path):
+        """Test que una oferta editada no reutiliza los emails de la versión anterior y sus copias no se colapsan."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        orchestrator = _make_orchestrator(store)
+
+        with patch('agents.orchestrator.INCREMENTAL_MODE', True):
+            first_run = [
+                {'url': 'https://x.com/1', 'title': 'A', 'description': 'v1'},
+                {'url': 'https://x.com/2', 'title': 'B'},
+            ]
+            store.upsert_jobs(first_run)
+            await orchestrator._extract_emails(_state(first_run))
+            assert store.get(first_run[0]['job_key'])['emails'] == ['hr1@x.com']
+
+            # Segunda ejecución: la oferta cambió y llega una vez por región
+            second_run = [
+                {'url': 'https://x.com/1', 'title': 'A', 'description': 'v2', 'search_region': 'hispanic'},
+                {'url': 'https://x.com/2', 'title': 'B', 'search_region': 'hispanic'},
+                {'url': 'https://x.com/1', 'title': 'A', 'description': 'v2', 'search_region': 'english'},
+            ]
+            store.upsert_jobs(second_run)
+            orchestrator.email_extractor.extract_from_jobs.side_effect = lambda jobs, use_llm=None: [
+                {**job, 'contact_info': {}, 'emails': ['new@x.com']} for job in jobs
+            ]
+            state = await orchestrator._extract_emails(_state(second_run))
+
+        processed = orchestrator.email_extractor.extract_from_jobs.await_args.args[0]
+        assert [job['url'] for job in processed] == ['https://x.com/1', 'https://x.com/1']
+        assert [job['url'] for job in state['jobs']] == [job['url'] for job in second_run]
+        assert [job['emails'] for job in state['jobs']] == [['new@x.com'], ['hr2@x.com'], ['new@x.com']]
+        assert store.get(second_run[0]['job_key'])['emails'] == ['new@x.com']
+
+    def test_split_disabled_processes_everything(self, tmp_path):
+        """Test que sin INCREMENTAL_MODE todos los trabajos se procesan."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        orchestrator = _make_orchestrator(store)
+        jobs = [{'url': 'https://x.com/1', 'title': 'A'}]
+        store.upsert_jobs(jobs)
+        store.upsert_jobs(jobs)
+
+        with patch('agents.orchestrator.INCREMENTAL_MODE', False):
+            to_process, reused = orchestrator._split_incremental(jobs, lambda job, stored: True)
+
+        assert to_process == jobs
+        assert reused == []
+
+
+class TestMatchFirstPipeline:
+    """Tests para el score heurístico antes de la extracción de emails."""
+
+    def test_email_llm_predicate_uses_score_and_rank_cutoff(self):
+        """Test que solo los trabajos sobre el score mínimo y dentro del top N usan el LLM."""
+        jobs = [{'title': t, 'match_score': score} for t, score in [('a', 90), ('b', 70), ('c', 55), ('d', 10)]]
+
+        with patch('agents.orchestrator.EMAIL_LLM_MIN_SCORE', 50), \
+             patch('agents.orchestrator.EMAIL_LLM_MAX_JOBS', 2):
+            use_llm = JobSearchOrchestrator._email_llm_predicate(jobs)
+
+        assert [job['title'] for job in jobs if use_llm(job)] == ['a', 'b']
+
+    @pytest.mark.asyncio
+    async def test_low_score_jobs_use_regex_only(self, tmp_path):
+        """Test que los trabajos irrelevantes se procesan con regex, sin LLM."""
+        from agents.email_extractor_agent import EmailExtractorAgent
+
+        extractor = EmailExtractorAgent()
+        extractor.llm = MagicMock()
+        extractor.llm.ainvoke = AsyncMock(side_effect=AssertionError("no debe llamarse al LLM"))
+        jobs = [{'title': 'Irrelevante', 'description': 'Escribe a jobs@acme.com', 'match_score': 5}]
+
+        with patch('agents.orchestrator.EMAIL_LLM_MIN_SCORE', 50):
+            use_llm = JobSearchOrchestrator._email_llm_predicate(jobs)
+        result = await extractor.extract_from_jobs(jobs, use_llm=use_llm)
+
+        assert result[0]['emails'] == ['jobs@acme.com']
+        assert result[0]['email_used_llm'] is False
+
+
+class TestLocalRelevanceTier:
+    """Tests para la relevancia local como tercer score."""
+
+    @pytest.mark.asyncio
+    async def test_local_relevance_blends_and_reorders(self, tmp_path):
+        """Test que la relevancia local se combina con pesos renormalizados y re-ordena los trabajos."""
+        orchestrator = _make_orchestrator(JobStore(tmp_path / "jobs.sqlite"))
+        jobs = [
+            {'url': 'https://x.com/1', 'title': 'Nurse', 'description': 'Hospital night shifts', 'match_score': 60},
+            {'url': 'https://x.com/2', 'title': 'Python LLM Engineer', 'description': 'Python LLM on AWS', 'match_score': 50},
+        ]
+        state = {**_state(jobs), 'profile': {'skills': ['Python', 'LLM', 'AWS']}}
+
+        with patch('agents.orchestrator.USE_SEMANTIC_MATCHING', False), \
+             patch('agents.orchestrator.HEURISTIC_WEIGHT', 0.4), \
+             patch('agents.orchestrator.LOCAL_RELEVANCE_WEIGHT', 0.4):
+            state = await orchestrator._match_jobs(state)
+
+        nurse, engineer = sorted(state['matched_jobs'], key=lambda job: job['url'])
+        assert nurse['local_relevance_score'] == 0.0
+        assert nurse['heuristic_score'] == 60
+        assert nurse['match_score'] == pytest.approx(30.0)
+        assert engineer['local_relevance_score'] > 50
+        assert engineer['match_score'] == pytest.approx((50 + engineer['local_relevance_score']) / 2)
+        assert [job['url'] for job in state['matched_jobs']] == ['https://x.com/2', 'https://x.com/1']
+
+
+class TestRunLifecycle:
+    """Tests para el cierre de recursos al final de run()."""
+
+    @pytest.mark.asyncio
+    async def test_second_run_does_not_use_closed_llm_pool(self, isolated_agent_runtime):
+        """Test que tras cerrar el pool async en run() los agentes usan un cliente con pool abierto."""
+        from agents.email_extractor_agent import EmailExtractorAgent
+        from agents.semantic_matcher_agent import SemanticMatcherAgent
+
+        orchestrator = JobSearchOrchestrator.__new__(JobSearchOrchestrator)
+        orchestrator.email_extractor = EmailExtractorAgent()
+        orchestrator.semantic_matcher = SemanticMatcherAgent()
+        orchestrator.remote_agent = orchestrator.tech_agent = orchestrator.findjobit_agent = MagicMock(close=AsyncMock())
+        pools_closed = []
+
+        async def fake_graph(state):
+            for agent in (orchestrator.email_extractor, orchestrator.semantic_matcher):
+                pools_closed.append(agent.llm.http_async_client.is_closed)
+            return state
+
+        orchestrator.graph = MagicMock(ainvoke=fake_graph)
+
+        with patch('agents.orchestrator.shutdown_browser_pool', new_callable=AsyncMock):
+            await orchestrator.run()
+            await orchestrator.run()
+
+        assert pools_closed == [False] * 4
+        # El pool de la última ejecución también se cerró
+        assert isolated_agent_runtime._http_async_client is None
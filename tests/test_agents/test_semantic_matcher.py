@@ -52,6 +52,17 @@ class TestSemanticMatcherAgent:
         
         assert summary == "Perfil no disponible"
     
+    def test_estimate_job_tokens_amortizes_prompt_over_batch(self, sample_job, sample_profile):
+        """Test que el costo estimado crece con la descripción y baja con lotes más grandes."""
+        agent = SemanticMatcherAgent()
+        single = agent.estimate_job_tokens(sample_job, sample_profile, batch_size=1)
+        batched = agent.estimate_job_tokens(sample_job, sample_profile, batch_size=5)
+        longer = agent.estimate_job_tokens(
+            {**sample_job, 'description': sample_job['description'] * 10}, sample_profile, batch_size=1
+        )
+        
+        assert 0 < batched < single < longer
+    
     @pytest.mark.asyncio
     async def test_analyze_match_no_llm(self, sample_job, sample_profile):
         """Test análisis sin LLM (fallback)."""
@@ -127,3 +138,25 @@ class TestSemanticMatcherAgent:
             # Debe retornar trabajos sin modificar si no hay LLM
             assert len(result) == 1
             assert result == jobs
+    
+    @pytest.mark.asyncio
+    async def test_analyze_batch_batched_with_fallback(self, sample_profile):
+        """Test que el modo por lotes hace una llamada por lote y re-analiza entradas fallidas."""
+        agent = SemanticMatcherAgent()
+        jobs = [{'title': f'Job {i}', 'description': 'Python'} for i in range(3)]
+        batched_response = Mock(content=(
+            '```json\n[{"job_index": 1, "semantic_score": 80, "confidence": 90, '
+            '"key_matches": ["Python"], "concerns": [], "recommendation": "good_match"}, '
+            '{"job_index": 3, "semantic_score": "no-es-numero"}]\n```'
+        ))
+        single_response = Mock(content='{"semantic_score": 40, "confidence": 50, '
+                                       '"key_matches": [], "concerns": [], "recommendation": "fair_match"}')
+        agent.llm = Mock()
+        agent.llm.ainvoke = AsyncMock(side_effect=[batched_response, single_response, single_response])
+        
+        result = await agent.analyze_batch(jobs, sample_profile, batch_size=3)
+        
+        # 1 llamada por lote + 2 individuales (job 2 faltante, job 3 con score inválido)
+        assert agent.llm.ainvoke.await_count == 3
+        assert [job['semantic_score'] for job in result] == [80.0, 40, 40]
+        assert result[0]['semantic_analysis']['recommendation'] == 'good_match'
@@ -0,0 +1 @@
+"""Tests tools inicialización."""
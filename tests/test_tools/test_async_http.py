@@ -0,0 +1,125 @@
+"""Tests para la ruta HTTP asíncrona (AsyncHTTPScraper y API clients async)."""
+
+import pytest
+import requests
+from unittest.mock import patch, AsyncMock
+from tools.http_client_strategy import AsyncHTTPClientStrategy, HTTPResponse
+from tools.web_scraper import AsyncHTTPScraper
+from tools.api_clients import RemoteOKClient
+
+
+class FakeAsyncClient(AsyncHTTPClientStrategy):
+    """Cliente async que retorna respuestas predefinidas en orden."""
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = []
+        self.closed = False
+
+    async def get(self, url, params=None, headers=None, timeout=None, **kwargs):
+        self.calls.append({'url': url, 'params': params, 'headers': headers})
+        return self.responses.pop(0)
+
+    async def close(self):
+        self.closed = True
+
+
+class TestHTTPResponse:
+    """Tests para HTTPResponse."""
+
+    def test_raise_for_status_uses_requests_exception(self):
+        """Test que los errores HTTP se lanzan como requests.HTTPError con la respuesta."""
+        response = HTTPResponse(url="https://example.com", status_code=429)
+        with pytest.raises(requests.exceptions.HTTPError) as exc_info:
+            response.raise_for_status()
+        assert exc_info.value.response.status_code == 429
+
+    def test_json_and_text(self):
+        """Test de decodificación de contenido."""
+        response = HTTPResponse(url="https://example.com", status_code=200, content=b'{"a": 1}')
+        response.raise_for_status()
+        assert response.text == '{"a": 1}'
+        assert response.json() == {'a': 1}
+
+
+class TestAsyncHTTPScraper:
+    """Tests para AsyncHTTPScraper."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_uses_asyncio_sleep_and_records_success(self):
+        """Test que fetch retorna el HTML y aplica delays con asyncio.sleep."""
+        client = FakeAsyncClient([
+            HTTPResponse(url="https://findjobit.com", status_code=200, content=b"<html>ok</html>")
+        ])
+        scraper = AsyncHTTPScraper(http_client_strategy=client)
+        scraper.rate_limiter = None
+        scraper.delay_manager = None
+
+        with patch('tools.web_scraper.asyncio.sleep', new_callable=AsyncMock) as mock_sleep, \
+             patch('tools.web_scraper.time.sleep') as mock_time_sleep:
+            html = await scraper.fetch("https://findjobit.com")
+
+        assert html == "<html>ok</html>"
+        mock_sleep.assert_awaited()
+        mock_time_sleep.assert_not_called()
+        assert 'User-Agent' in client.calls[0]['headers']
+
+    @pytest.mark.asyncio
+    async def test_fetch_retries_after_rate_limit(self):
+        """Test que un 429 se reintenta con backoff asíncrono."""
+        client = FakeAsyncClient([
+            HTTPResponse(url="https://example.com", status_code=429),
+            HTTPResponse(url="https://example.com", status_code=200, content=b"ok")
+        ])
+        scraper = AsyncHTTPScraper(http_client_strategy=client)
+        scraper.circuit_breaker = None
+
+        with patch('tools.web_scraper.asyncio.sleep', new_callable=AsyncMock):
+            html = await scraper.fetch("https://example.com/jobs")
+
+        assert html == "ok"
+        assert len(client.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_closes_client(self):
+        """Test que el context manager cierra la sesión HTTP."""
+        client = FakeAsyncClient([])
+        async with AsyncHTTPScraper(http_client_strategy=client):
+            pass
+        assert client.closed
+
+
+class TestRemoteOKClientAsync:
+    """Tests para RemoteOKClient.search_jobs_async."""
+
+    @pytest.mark.asyncio
+    async def test_search_jobs_async_filters_keywords(self):
+        """Test que la ruta async filtra y normaliza igual que la síncrona."""
+        client = RemoteOKClient()
+        client.async_http_client = FakeAsyncClient([
+            HTTPResponse(
+                url="https://remoteok.com/api",
+                status_code=200,
+                content=b'[{"legal": "x"}, {"id": 1, "position": "Python Dev", "company": "A", "url": "u1"},'
+                        b' {"id": 2, "position": "Designer", "company": "B", "url": "u2"}]'
+            )
+        ])
+
+        client.delay_manager = None
+        with patch('asyncio.sleep', new_callable=AsyncMock):
+            jobs = await client.search_jobs_async(["python"], max_results=10)
+
+        assert [job['url'] for job in jobs] == ['u1']
+        assert jobs[0]['source'] == 'remoteok'
+
+    @pytest.mark.asyncio
+    async def test_search_jobs_async_returns_empty_on_error(self):
+        """Test que un error HTTP retorna lista vacía."""
+        client = RemoteOKClient()
+        client.async_http_client = FakeAsyncClient([
+            HTTPResponse(url="https://remoteok.com/api", status_code=500)
+        ])
+
+        jobs = await client.search_jobs_async(["python"])
+
+        assert jobs == []
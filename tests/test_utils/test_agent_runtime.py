@@ -0,0 +1,50 @@
+"""Tests para AgentRuntime."""
+
+import pytest
+from unittest.mock import patch
+from agents.email_extractor_agent import EmailExtractorAgent
+from agents.semantic_matcher_agent import SemanticMatcherAgent
+from agents.keyword_generator_agent import KeywordGeneratorAgent
+from agents.linkedin_agent import LinkedInAgent
+from config import config_loader
+
+
+class TestAgentRuntime:
+    """Tests para los recursos compartidos entre agentes."""
+
+    def test_agents_share_llm_clients_and_skill_loader(self, isolated_agent_runtime):
+        """Test que los agentes con la misma temperatura reutilizan el cliente y las conexiones."""
+        extractor = EmailExtractorAgent()
+        semantic = SemanticMatcherAgent()
+        keywords = KeywordGeneratorAgent()
+
+        assert extractor.llm is semantic.llm
+        assert keywords.llm is not extractor.llm
+        assert keywords.llm.http_async_client is extractor.llm.http_async_client
+
+        # Los templates compilados se construyen una sola vez por proceso
+        loader = isolated_agent_runtime.skill_loader
+        assert loader.load_skill("semantic-matcher") is semantic.prompt_template
+
+    def test_config_parsed_once(self):
+        """Test que job_sources.yaml se parsea una vez para todos los agentes."""
+        config_loader.clear_cache()
+        with patch('config.config_loader.yaml.safe_load', wraps=config_loader.yaml.safe_load) as safe_load:
+            first = LinkedInAgent()
+            second = LinkedInAgent()
+
+        assert safe_load.call_count == 1
+        assert first.config is second.config
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_async_pool(self, isolated_agent_runtime):
+        """Test que aclose cierra el pool async y los clientes siguientes usan uno nuevo."""
+        llm = isolated_agent_runtime.get_llm("openai")
+        pool = llm.http_async_client
+
+        await isolated_agent_runtime.aclose()
+
+        assert pool.is_closed
+        new_llm = isolated_agent_runtime.get_llm("openai")
+        assert new_llm is not llm
+        assert not new_llm.http_async_client.is_closed
@@ -0,0 +1,43 @@
+"""Tests para la selección top-K de candidatos semánticos."""
+
+from utils.candidate_selector import select_top_candidates
+
+
+def _jobs():
+    return [
+        {'id': 1, 'match_score': 55, 'search_region': 'hispanic', 'source': 'linkedin'},
+        {'id': 2, 'match_score': 90, 'search_region': 'english', 'source': 'linkedin'},
+        {'id': 3, 'match_score': 80, 'search_region': 'english', 'source': 'indeed'},
+        {'id': 4, 'match_score': 40, 'search_region': 'hispanic', 'source': 'indeed'},
+        {'id': 5, 'match_score': 80, 'search_region': 'hispanic', 'source': 'linkedin'},
+    ]
+
+
+class TestCandidateSelector:
+    """Tests para select_top_candidates."""
+
+    def test_top_k_by_score_regardless_of_list_order(self):
+        """Test que elige por score (no por el orden región/tipo de la lista) y respeta el mínimo."""
+        ids = [job['id'] for job in select_top_candidates(_jobs(), k=3, min_score=50)]
+
+        # Empate 80/80: gana el que aparece primero
+        assert ids == [2, 3, 5]
+        assert [job['id'] for job in select_top_candidates(_jobs(), k=10, min_score=50)] == [2, 3, 5, 1]
+        assert select_top_candidates(_jobs(), k=0) == []
+
+    def test_region_and_source_quotas(self):
+        """Test que una región o fuente llena cede el lugar al siguiente trabajo por score."""
+        by_region = select_top_candidates(_jobs(), k=3, max_per_region=1)
+        by_source = select_top_candidates(_jobs(), k=3, max_per_source=1)
+
+        assert [job['id'] for job in by_region] == [2, 5]
+        assert [job['id'] for job in by_source] == [2, 3]
+
+    def test_token_budget_skips_jobs_that_do_not_fit(self):
+        """Test que el presupuesto se llena en orden de score, saltando trabajos demasiado caros."""
+        costs = {1: 100, 2: 300, 3: 500, 4: 100, 5: 200}
+        selected = select_top_candidates(
+            _jobs(), k=10, token_budget=600, estimate_tokens=lambda job: costs[job['id']]
+        )
+
+        assert [job['id'] for job in selected] == [2, 5, 1]
@@ -0,0 +1,98 @@
+"""Tests para DiskCache y ResponseCache."""
+
+import time
+import pytest
+from unittest.mock import patch
+from utils.disk_cache import DiskCache
+from utils.response_cache import ResponseCache
+from tools.http_client_strategy import HTTPResponse
+
+
+class TestDiskCache:
+    """Tests para DiskCache."""
+
+    def test_set_and_get(self, tmp_path):
+        """Test de escritura y lectura básica."""
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        cache.set("a", b"valor")
+        assert cache.get("a") == b"valor"
+        assert cache.get("missing") is None
+
+    def test_ttl_expiry(self, tmp_path):
+        """Test que las entradas expiradas no se retornan."""
+        cache = DiskCache(tmp_path / "cache.sqlite", default_ttl_seconds=10)
+        cache.set("a", b"valor")
+
+        with patch("utils.disk_cache.time.time", return_value=time.time() + 11):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction_respects_size_cap(self, tmp_path):
+        """Test que se desaloja la entrada usada hace más tiempo al superar el límite."""
+        cache = DiskCache(tmp_path / "cache.sqlite", max_size_bytes=20)
+        cache.set("a", b"x" * 8)
+        time.sleep(0.01)
+        cache.set("b", b"x" * 8)
+        time.sleep(0.01)
+        assert cache.get("a") is not None  # "a" pasa a ser la más reciente
+        time.sleep(0.01)
+        cache.set("c", b"x" * 8)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+        assert cache.total_size() <= 20
+
+    def test_persists_across_instances(self, tmp_path):
+        """Test que el contenido sobrevive a reabrir el archivo."""
+        path = tmp_path / "cache.sqlite"
+        DiskCache(path).set("a", b"valor")
+        assert DiskCache(path).get("a") == b"valor"
+
+
+class TestResponseCache:
+    """Tests para ResponseCache."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        return ResponseCache(DiskCache(tmp_path / "responses.sqlite"))
+
+    def test_key_ignores_param_order_and_rotating_headers(self):
+        """Test que el orden de params y los headers anti-bot no cambian la clave."""
+        key1 = ResponseCache.make_key("GET", "https://x.com", {"a": 1, "b": 2},
+                                      {"User-Agent": "UA1", "Accept": "*/*"})
+        key2 = ResponseCache.make_key("GET", "https://x.com", {"b": 2, "a": 1},
+                                      {"User-Agent": "UA2", "accept": "*/*", "Referer": "r"})
+        key3 = ResponseCache.make_key("GET", "https://x.com", {"a": 1, "b": 2},
+                                      {"Accept": "application/json"})
+        assert key1 == key2
+        assert key1 != key3
+
+    def test_roundtrip_only_successful_responses(self, cache):
+        """Test que solo se guardan respuestas 200 y se reconstruyen fielmente."""
+        ok = HTTPResponse(url="https://x.com/api", status_code=200, content=b'[{"id": 1}]')
+        error = HTTPResponse(url="https://x.com/err", status_code=500, content=b"boom")
+        cache.set("GET", "https://x.com/api", None, None, ok)
+        cache.set("GET", "https://x.com/err", None, None, error)
+
+        cached = cache.get("GET", "https://x.com/api")
+        assert cached.json() == [{"id": 1}]
+        assert cache.get("GET", "https://x.com/err") is None
+
+    def test_api_client_cache_hit_skips_network_and_delay(self, isolated_response_cache):
+        """Test que un hit en BaseAPIClient._make_request no hace request ni delay."""
+        from tools.api_clients import RemoteOKClient
+
+        client = RemoteOKClient()
+        isolated_response_cache.set(
+            "GET", "https://remoteok.com/api", None, client.session.headers,
+            HTTPResponse(url="https://remoteok.com/api", status_code=200,
+                         content=b'[{"id": 1, "position": "Python Dev", "url": "u1"}]')
+        )
+        with patch.object(client.session, "get") as mock_get, \
+             patch.object(client, "_apply_delay") as mock_delay:
+            jobs = client.search_jobs(["python"])
+
+        mock_get.assert_not_called()
+        mock_delay.assert_not_called()
+        assert [job["url"] for job in jobs] == ["u1"]
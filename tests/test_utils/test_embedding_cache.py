@@ -0,0 +1,71 @@
+"""Tests para EmbeddingCache."""
+
+import numpy as np
+import pytest
+from utils.embedding_cache import EmbeddingCache
+
+
+class CountingEmbedder:
+    """embed_documents determinístico que registra los lotes recibidos."""
+
+    def __init__(self, dim: int = 4):
+        self.dim = dim
+        self.batches = []
+
+    def embed_documents(self, texts):
+        self.batches.append(list(texts))
+        return [[float(len(text)), float(sum(map(ord, text)) % 97), 1.0, float(i)][:self.dim] for i, text in enumerate(texts)]
+
+
+class TestEmbeddingCache:
+    """Tests para el cache de embeddings en disco."""
+
+    def test_roundtrip_survives_reopen(self, tmp_path):
+        """Test que los vectores guardados se leen desde otra instancia y por modelo."""
+        cache = EmbeddingCache(tmp_path, "model-a")
+        cache.put_many(["python", "java"], [[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]])
+        cache.close()
+
+        reopened = EmbeddingCache(tmp_path, "model-a")
+        python, missing, java = reopened.get_many(["python", "rust", "java"])
+
+        assert python.dtype == np.float32
+        assert python.tolist() == [1.0, 2.0, 3.0]
+        assert java.tolist() == [4.0, 5.0, 6.0]
+        assert missing is None
+        assert EmbeddingCache(tmp_path, "model-b").get_many(["python"]) == [None]
+
+    def test_embed_only_computes_missing_in_batches(self, tmp_path):
+        """Test que embed solo llama al proveedor con los textos faltantes, sin duplicados y en lotes."""
+        cache = EmbeddingCache(tmp_path, "model-a")
+        embedder = CountingEmbedder()
+
+        first = cache.embed(["a", "bb", "a", "ccc"], embedder.embed_documents, batch_size=2)
+        assert embedder.batches == [["a", "bb"], ["ccc"]]
+        assert first.shape == (4, 4)
+        assert first[0].tolist() == first[2].tolist()
+
+        second = cache.embed(["ccc", "dddd", "a"], embedder.embed_documents, batch_size=2)
+        assert embedder.batches[-1] == ["dddd"]
+        assert second[0].tolist() == first[3].tolist()
+        assert second[2].tolist() == first[0].tolist()
+        assert cache.count() == 4
+
+    def test_dimension_mismatch_raises(self, tmp_path):
+        """Test que no se mezclan vectores de distinta dimensión en el mismo archivo."""
+        cache = EmbeddingCache(tmp_path, "model-a")
+        cache.put_many(["a"], [[1.0, 2.0]])
+
+        with pytest.raises(ValueError):
+            cache.put_many(["b"], [[1.0, 2.0, 3.0]])
+
+    def test_partial_row_is_discarded(self, tmp_path):
+        """Test que una fila incompleta (escritura interrumpida) no desalinea el archivo."""
+        cache = EmbeddingCache(tmp_path, "model-a")
+        cache.put_many(["a"], [[1.0, 2.0]])
+        with open(cache.vectors_path, 'ab') as f:
+            f.write(b'\x00\x00')
+
+        cache.put_many(["b"], [[3.0, 4.0]])
+
+        assert [v.tolist() for v in cache.get_many(["a", "b"])] == [[1.0, 2.0], [3.0, 4.0]]
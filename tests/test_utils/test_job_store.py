@@ -0,0 +1,112 @@
+"""Tests para JobStore."""
+
+from datetime import datetime, timedelta
+from utils.job_store import JobStore, canonical_job_key, canonical_url, job_content_hash
+
+
+class TestCanonicalKey:
+    """Tests para la clave canónica de trabajos."""
+
+    def test_canonical_url_strips_tracking_and_noise(self):
+        """Test que www, fragmentos, barra final y tracking no cambian la URL canónica."""
+        assert canonical_url("http://www.LinkedIn.com/jobs/view/123/?refId=abc&trk=x#top") == \
+            "https://linkedin.com/jobs/view/123"
+        assert canonical_url("https://remoteok.com/jobs/1?utm_source=feed&id=7") == \
+            "https://remoteok.com/jobs/1?id=7"
+
+    def test_key_uses_url_or_title_company(self):
+        """Test que la clave usa la URL, o título+empresa si no hay URL."""
+        assert canonical_job_key({'url': 'https://www.x.com/job/1/'}) == \
+            canonical_job_key({'url': 'https://x.com/job/1?utm_medium=email', 'title': 'Otro'})
+        assert canonical_job_key({'title': 'AI Engineer ', 'company': 'ACME'}) == \
+            canonical_job_key({'title': 'ai  engineer', 'company': 'acme'})
+
+    def test_content_hash_ignores_metadata(self):
+        """Test que el hash de contenido ignora metadata de búsqueda."""
+        job = {'title': 'AI Engineer', 'company': 'ACME', 'description': 'Python'}
+        assert job_content_hash(job) == job_content_hash({**job, 'search_region': 'english'})
+        assert job_content_hash(job) != job_content_hash({**job, 'description': 'Go'})
+
+
+class TestJobStore:
+    """Tests para el almacén persistente."""
+
+    def test_upsert_keeps_first_seen_and_counts(self, tmp_path):
+        """Test de semántica upsert: first_seen se conserva, last_seen avanza."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        day1 = datetime(2024, 1, 1, 10, 0, 0)
+        day2 = day1 + timedelta(days=1)
+
+        stats1 = store.upsert_jobs([{'url': 'https://x.com/1', 'title': 'A', 'source': 'remoteok'}], seen_at=day1)
+        jobs = [
+            {'url': 'https://x.com/1/', 'title': 'A', 'source': 'remoteok'},
+            {'url': 'https://x.com/2', 'title': 'B', 'source': 'linkedin'},
+        ]
+        stats2 = store.upsert_jobs(jobs, seen_at=day2)
+
+        assert stats1 == {'new': 1, 'changed': 0, 'unchanged': 0}
+        assert stats2 == {'new': 1, 'changed': 0, 'unchanged': 1}
+        assert jobs[0]['first_seen'] == day1.isoformat()
+        assert jobs[0]['last_seen'] == day2.isoformat()
+        assert [job['corpus_status'] for job in jobs] == ['unchanged', 'new']
+
+        stored = store.get(jobs[0]['job_key'])
+        assert stored['seen_count'] == 2
+        assert store.count() == 2
+        assert store.count(first_seen_since=day2) == 1
+
+    def test_content_change_detected(self, tmp_path):
+        """Test que un cambio de contenido se cuenta como 'changed'."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        store.upsert_jobs([{'url': 'https://x.com/1', 'title': 'A', 'description': 'v1'}])
+        stats = store.upsert_jobs([{'url': 'https://x.com/1', 'title': 'A', 'description': 'v2'}])
+        assert stats['changed'] == 1
+
+    def test_changed_content_clears_enrichment_and_duplicates_share_status(self, tmp_path):
+        """Test que un cambio de contenido descarta el enriquecimiento y las copias del lote tienen el mismo estado."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        jobs = [{'url': 'https://x.com/1', 'title': 'A', 'description': 'v1'}]
+        store.upsert_jobs(jobs)
+        key = jobs[0]['job_key']
+        store.update_enrichment(key, {'emails': ['old@x.com']})
+
+        # El mismo trabajo editado llega dos veces (p.ej. un feed buscado en ambas regiones)
+        copies = [
+            {'url': 'https://x.com/1', 'title': 'A', 'description': 'v2', 'search_region': 'hispanic'},
+            {'url': 'https://x.com/1', 'title': 'A', 'description': 'v2', 'search_region': 'english'},
+        ]
+        stats = store.upsert_jobs(copies)
+
+        assert stats == {'new': 0, 'changed': 1, 'unchanged': 0}
+        assert [job['corpus_status'] for job in copies] == ['changed', 'changed']
+        stored = store.get(key)
+        assert 'emails' not in stored
+        assert stored['seen_count'] == 2
+
+    def test_enrichment_merges_and_survives_upsert(self, tmp_path):
+        """Test que el enriquecimiento se combina y no se pierde al volver a ver el trabajo."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        jobs = [{'url': 'https://x.com/1', 'title': 'A'}]
+        store.upsert_jobs(jobs)
+        key = jobs[0]['job_key']
+
+        store.update_enrichment(key, {'emails': ['hr@x.com']})
+        store.update_enrichment(key, {'match_score': 80})
+        store.upsert_jobs([{'url': 'https://x.com/1', 'title': 'A'}])
+
+        stored = store.get(key)
+        assert stored['emails'] == ['hr@x.com']
+        assert stored['match_score'] == 80
+
+    def test_query_by_source_and_company(self, tmp_path):
+        """Test de consultas por columnas indexadas."""
+        store = JobStore(tmp_path / "jobs.sqlite")
+        store.upsert_jobs([
+            {'url': 'https://x.com/1', 'source': 'remoteok', 'company': 'ACME'},
+            {'url': 'https://x.com/2', 'source': 'linkedin', 'company': 'ACME'},
+            {'url': 'https://x.com/3', 'source': 'linkedin', 'company': 'Other'},
+        ])
+
+        assert len(store.query(source='linkedin')) == 2
+        assert [j['url'] for j in store.query(source='linkedin', company='ACME')] == ['https://x.com/2']
+        assert len(store.query(limit=1)) == 1
@@ -0,0 +1,41 @@
+"""Tests para DiskLLMCache."""
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from langchain_core.outputs import ChatGeneration
+from langchain_core.messages import AIMessage
+from utils.disk_cache import DiskCache
+from utils.llm_cache import DiskLLMCache
+
+
+class TestDiskLLMCache:
+    """Tests para el cache persistente de completions."""
+
+    def test_roundtrip_survives_reopen(self, tmp_path):
+        """Test que una completion guardada se recupera desde otra instancia (otra ejecución)."""
+        db_path = tmp_path / "llm.sqlite"
+        cache = DiskLLMCache(DiskCache(db_path))
+        generation = ChatGeneration(message=AIMessage(content='{"score": 80}'))
+        cache.update("prompt", "model-a", [generation])
+        cache.store.close()
+
+        reopened = DiskLLMCache(DiskCache(db_path))
+        cached = reopened.lookup("prompt", "model-a")
+
+        assert cached is not None
+        assert cached[0].message.content == '{"score": 80}'
+        assert reopened.lookup("prompt", "model-b") is None
+
+    @pytest.mark.asyncio
+    async def test_identical_prompt_skips_llm(self, tmp_path):
+        """Test que el mismo prompt con el mismo modelo no vuelve a llamar al LLM."""
+        cache = DiskLLMCache(DiskCache(tmp_path / "llm.sqlite"))
+        llm = FakeListChatModel(responses=["primera", "segunda"], cache=cache)
+
+        first = await llm.ainvoke("Analiza este trabajo")
+        second = await llm.ainvoke("Analiza este trabajo")
+        other = await llm.ainvoke("Otro prompt")
+
+        assert first.content == second.content == "primera"
+        assert other.content == "segunda"
+        assert cache.hits == 1
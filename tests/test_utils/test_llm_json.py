@@ -0,0 +1,13 @@
+"""Tests para las utilidades de respuestas JSON de LLM."""
+
+from utils.llm_json import extract_json_content
+
+
+class TestExtractJsonContent:
+    """Tests para extract_json_content."""
+
+    def test_strips_markdown_fences(self):
+        """Test que extrae el JSON de bloques ```json y ``` o lo deja tal cual."""
+        assert extract_json_content('Aquí está:\n```json\n{"a": 1}\n```\nFin') == '{"a": 1}'
+        assert extract_json_content('```\n[1]\n```') == '[1]'
+        assert extract_json_content('  [1, 2]  ') == '[1, 2]'
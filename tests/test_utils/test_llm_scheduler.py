@@ -0,0 +1,113 @@
+"""Tests para LLMScheduler."""
+
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+from utils.disk_cache import DiskCache
+from utils.llm_cache import DiskLLMCache
+from utils.llm_scheduler import (
+    LLMScheduler, TokenBucket, PRIORITY_HIGH, PRIORITY_LOW, estimate_prompt_tokens
+)
+
+
+class RateLimitError(Exception):
+    """Error 429 como los de los SDK de OpenAI/Anthropic."""
+    status_code = 429
+
+
+class TestTokenBucket:
+    """Tests para el token bucket."""
+
+    def test_refill_and_wait_time(self):
+        """Test que el bucket se vacía, calcula la espera y se rellena con el tiempo."""
+        now = [0.0]
+        bucket = TokenBucket(60, clock=lambda: now[0])  # 1 unidad por segundo
+
+        assert bucket.time_until(60) == 0
+        bucket.consume(60)
+        assert bucket.time_until(10) == pytest.approx(10.0)
+        # Un pedido mayor que la capacidad espera a tener el bucket lleno, no para siempre
+        assert bucket.time_until(500) == pytest.approx(60.0)
+
+        now[0] = 5.0
+        assert bucket.time_until(10) == pytest.approx(5.0)
+        assert TokenBucket(0).time_until(10 ** 9) == 0
+
+
+class TestLLMScheduler:
+    """Tests para el scheduler de llamadas LLM."""
+
+    @pytest.mark.asyncio
+    async def test_priority_order_when_saturated(self):
+        """Test que con la capacidad ocupada se despacha primero la mayor prioridad."""
+        scheduler = LLMScheduler(rpm_limit=0, tpm_limit=0, max_concurrency=1)
+        order = []
+        release = asyncio.Event()
+
+        async def call(prompt):
+            order.append(prompt)
+            if prompt == 'first':
+                await release.wait()
+            return Mock(content=prompt)
+
+        llm = Mock()
+        llm.ainvoke = call
+
+        first = asyncio.create_task(scheduler.ainvoke(llm, 'first'))
+        await asyncio.sleep(0)
+        low = asyncio.create_task(scheduler.ainvoke(llm, 'email', priority=PRIORITY_LOW))
+        high = asyncio.create_task(scheduler.ainvoke(llm, 'semantic', priority=PRIORITY_HIGH))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(first, low, high)
+
+        assert order == ['first', 'semantic', 'email']
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried_with_backoff(self):
+        """Test que un 429 se reintenta en lugar de degradar el resultado."""
+        scheduler = LLMScheduler(rpm_limit=0, tpm_limit=0, max_retries=2, backoff_base_seconds=0)
+        llm = Mock()
+        llm.ainvoke = AsyncMock(side_effect=[RateLimitError("429"), Mock(content="ok")])
+
+        response = await scheduler.ainvoke(llm, 'prompt')
+
+        assert response.content == "ok"
+        assert llm.ainvoke.await_count == 2
+        assert scheduler.rate_limited == 1
+
+        # Otros errores y 429 persistentes se propagan al agente
+        llm.ainvoke = AsyncMock(side_effect=RateLimitError("429"))
+        with pytest.raises(RateLimitError):
+            await scheduler.ainvoke(llm, 'prompt')
+        assert llm.ainvoke.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_token_budget_estimated_and_corrected(self):
+        """Test que el TPM se reserva con la estimación y se corrige con el uso real."""
+        scheduler = LLMScheduler(rpm_limit=0, tpm_limit=10000)
+        llm = Mock()
+        llm.ainvoke = AsyncMock(return_value=Mock(content="ok", usage_metadata={'total_tokens': 100}))
+
+        await scheduler.ainvoke(llm, 'x' * 4000, expected_output_tokens=200)
+
+        state = scheduler._get_state(llm)
+        assert estimate_prompt_tokens('x' * 4000) == 1001
+        assert state.tokens.level == pytest.approx(9900, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_cached_prompt_skips_buckets(self, tmp_path):
+        """Test que una respuesta cacheada no espera a los buckets ni consume cupo."""
+        now = [0.0]  # Reloj detenido: el bucket no se rellena
+        scheduler = LLMScheduler(rpm_limit=1, tpm_limit=0, clock=lambda: now[0])
+        cache = DiskLLMCache(DiskCache(tmp_path / "llm.sqlite"))
+        llm = FakeListChatModel(responses=["primera", "segunda"], cache=cache)
+
+        first = await scheduler.ainvoke(llm, 'Analiza este trabajo')
+        # Sin cupo RPM: solo un hit del cache puede responder sin esperar
+        second = await asyncio.wait_for(scheduler.ainvoke(llm, 'Analiza este trabajo'), timeout=1)
+
+        assert first.content == second.content == "primera"
+        assert scheduler._get_state(llm).requests.level == 0
+        assert cache.hits == 1
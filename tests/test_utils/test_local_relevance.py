@@ -0,0 +1,48 @@
+"""Tests para la relevancia local TF-IDF."""
+
+from utils.local_relevance import cosine_relevance, profile_relevance_text, relevance_to_score
+
+
+PROFILE = {
+    'summary': 'Senior AI engineer building LLM applications',
+    'skills': {'AI': ['Python', 'LLM', 'Machine Learning'], 'Cloud': ['AWS', 'Docker']},
+    'experience': [{'title': 'AI Engineer', 'description': 'FastAPI services on AWS', 'technologies': ['Python']}],
+    'projects': [{'name': 'RAG assistant', 'description': 'Retrieval with embeddings', 'technologies': ['LLM']}]
+}
+
+
+class TestLocalRelevance:
+    """Tests para el score de relevancia sin red."""
+
+    def test_profile_text_includes_cv_sections(self):
+        """Test que el texto del perfil incluye resumen, skills, experiencia y proyectos."""
+        text = profile_relevance_text(PROFILE)
+
+        for fragment in ['Senior AI engineer', 'Docker', 'FastAPI services on AWS', 'RAG assistant']:
+            assert fragment in text
+
+    def test_related_jobs_rank_above_unrelated(self):
+        """Test que los trabajos relacionados con el perfil tienen mayor similitud."""
+        documents = [
+            'Registered nurse for hospital night shifts',
+            'Senior Python engineer building LLM applications on AWS with Docker',
+            'Machine learning engineer working with Python',
+            '',
+        ]
+        similarities = cosine_relevance(profile_relevance_text(PROFILE), documents)
+
+        assert similarities[1] > similarities[2] > similarities[0]
+        assert similarities[0] == 0.0
+        assert similarities[3] == 0.0
+        assert all(0.0 <= value <= 1.0 for value in similarities)
+
+    def test_empty_inputs(self):
+        """Test que sin documentos o sin texto de perfil no hay similitud."""
+        assert cosine_relevance('python', []).size == 0
+        assert cosine_relevance('', ['python developer']).tolist() == [0.0]
+
+    def test_relevance_to_score(self):
+        """Test de la conversión de similitud a score 0-100."""
+        assert relevance_to_score(0.0) == 0.0
+        assert relevance_to_score(0.25) == 50.0
+        assert relevance_to_score(1.5) == 100.0
@@ -0,0 +1,73 @@
+"""Tests para la detección de casi duplicados entre fuentes."""
+
+from utils.near_duplicates import (
+    find_duplicate_clusters, jaccard, merge_duplicates, minhash_signature, shingle_hashes
+)
+
+DESCRIPTION = (
+    "We are hiring a senior Python engineer to design and build LLM powered products on AWS. "
+    "You will own backend services end to end, mentor engineers, review code, improve observability "
+    "and work closely with product and data teams. Requirements: five years of Python, FastAPI or "
+    "Django, Docker, Kubernetes, PostgreSQL and experience deploying machine learning models."
+)
+
+
+def _job(**fields):
+    job = {'title': 'Senior Python Engineer', 'company': 'Acme Inc.', 'description': DESCRIPTION}
+    job.update(fields)
+    return job
+
+
+class TestNearDuplicates:
+    """Tests para MinHash + LSH."""
+
+    def test_signature_and_jaccard(self):
+        """Test que la firma es determinística, vacía sin palabras, y el Jaccard exacto."""
+        shingles = shingle_hashes(DESCRIPTION)
+        assert (minhash_signature(shingles) == minhash_signature(shingle_hashes(DESCRIPTION))).all()
+        assert minhash_signature(shingle_hashes('  ...  ')) is None
+        assert jaccard(shingle_hashes('a b c'), shingle_hashes('a b c d')) == 2 / 3
+
+    def test_cross_source_copies_are_clustered(self):
+        """Test que la misma oferta con título/URL ligeramente distintos se agrupa, y otras no."""
+        jobs = [
+            _job(source='linkedin', url='https://linkedin.com/1'),
+            _job(title='Sr. Python Engineer (Remote)', company='ACME, Inc',
+                 description=DESCRIPTION + ' Apply now.', source='remoteok', url='https://remoteok.com/9'),
+            _job(company='Other Corp', source='linkedin', url='https://linkedin.com/2'),
+            _job(title='Nurse', company='Hospital', description='Night shifts at the hospital', url='https://x.com/3'),
+        ]
+
+        assert find_duplicate_clusters(jobs) == [[0, 1], [2], [3]]
+
+    def test_jobs_without_company_or_description_are_not_merged(self):
+        """Test que dos títulos genéricos sin empresa ni descripción no se consideran la misma oferta."""
+        jobs = [
+            {'title': 'Python Developer', 'company': '', 'url': 'https://a.com/1'},
+            {'title': 'Python Developer', 'company': '', 'url': 'https://b.com/2'},
+        ]
+
+        assert find_duplicate_clusters(jobs) == [[0], [1]]
+
+    def test_merge_keeps_richest_copy_with_combined_metadata(self):
+        """Test que queda la copia con más descripción, con fuentes, países y la mejor región."""
+        jobs = [
+            _job(description=DESCRIPTION[:300], source='linkedin', search_country='Colombia',
+                 url='https://linkedin.com/co', region_priority=2, search_region='english'),
+            _job(source='linkedin', search_country='Mexico', url='https://linkedin.com/mx',
+                 region_priority=1, search_region='hispanic'),
+            _job(title='Nurse', company='Hospital', description='Night shifts', url='https://x.com/3'),
+        ]
+
+        unique = merge_duplicates(jobs)
+
+        assert len(unique) == 2
+        merged = unique[0]
+        assert merged['url'] == 'https://linkedin.com/mx'
+        assert merged['sources'] == ['linkedin']
+        assert merged['search_countries'] == ['Colombia', 'Mexico']
+        assert merged['duplicate_urls'] == ['https://linkedin.com/co']
+        assert merged['duplicate_count'] == 1
+        assert merged['region_priority'] == 1
+        assert merged['search_region'] == 'hispanic'
+        assert unique[1]['title'] == 'Nurse'
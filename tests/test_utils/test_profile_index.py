@@ -0,0 +1,42 @@
+"""Tests para ProfileIndex."""
+
+from utils.profile_index import ProfileIndex, get_profile_index
+
+
+class TestProfileIndex:
+    """Tests para el índice precalculado del perfil."""
+
+    def test_skills_are_normalized(self, sample_profile):
+        """Test que las skills se deduplican sin distinguir mayúsculas y se extraen tecnologías."""
+        profile = {
+            'skills': {'Backend': ['Python and  Django', 'python'], 'Cloud': 'AWS'},
+            'experience': [{'technologies': ['Docker', 'AWS', None]}],
+            'projects': [{'technologies': ['React']}]
+        }
+
+        index = ProfileIndex(profile)
+
+        assert index.skills == ['Python', 'Django', 'Python and Django', 'AWS', 'Docker', 'React']
+        assert index.skill_set == {'python', 'django', 'python and django', 'aws', 'docker', 'react'}
+        assert {'Python', 'Django', 'AWS', 'Docker', 'React'} <= index.tech_keywords
+
+    def test_content_hash_is_stable(self, sample_profile):
+        """Test que el hash depende del contenido y no del orden de las claves."""
+        reordered = dict(reversed(list(sample_profile.items())))
+
+        assert ProfileIndex(sample_profile).content_hash == ProfileIndex(reordered).content_hash
+        assert ProfileIndex(sample_profile).content_hash != ProfileIndex({'skills': ['Go']}).content_hash
+
+    def test_index_is_shared_per_profile_object(self, sample_profile):
+        """Test que el índice y sus valores memorizados se calculan una vez por perfil."""
+        calls = []
+
+        def build():
+            calls.append(1)
+            return "resumen"
+
+        first = get_profile_index(sample_profile)
+        assert get_profile_index(sample_profile) is first
+        assert first.memo('summary', build) == first.memo('summary', build) == "resumen"
+        assert len(calls) == 1
+        assert get_profile_index(dict(sample_profile)) is not first
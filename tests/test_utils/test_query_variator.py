@@ -0,0 +1,65 @@
+"""Tests para QueryVariator."""
+
+import pytest
+from unittest.mock import Mock, AsyncMock
+from utils.query_variator import QueryVariator
+
+
+class TestQueryVariatorBatch:
+    """Tests para la generación de variaciones por lotes."""
+
+    @pytest.mark.asyncio
+    async def test_one_call_for_all_keywords_and_persistent_cache(self):
+        """Test que una llamada async sirve todos los keywords y otra instancia reutiliza el caché."""
+        first = QueryVariator()
+        first.llm = Mock()
+        first.llm.invoke = Mock(side_effect=AssertionError("no debe usarse la llamada bloqueante"))
+        first.llm.ainvoke = AsyncMock(return_value=Mock(content=(
+            '```json\n[{"keyword_index": 1, "variations": ["Python developer jobs", "Remote Python engineer"]}, '
+            '{"keyword_index": 2, "variations": ["!", ""]}]\n```'
+        )))
+
+        result = await first.agenerate_variations_batch(['Python Developer', 'ML Engineer', 'Python Developer'], 2)
+
+        assert first.llm.ainvoke.await_count == 1
+        assert result['Python Developer'] == ['Python Developer', 'Python developer jobs', 'Remote Python engineer']
+        # Entrada sin variaciones válidas: fallback simple con el original primero
+        assert result['ML Engineer'][0] == 'ML Engineer'
+
+        second = QueryVariator()
+        second.llm = Mock()
+        second.llm.ainvoke = AsyncMock(return_value=Mock(content='[{"keyword_index": 1, "variations": ["ML engineer roles"]}]'))
+
+        result = await second.agenerate_variations_batch(['python  developer', 'ML Engineer'], 2)
+
+        # Solo se pide el keyword sin variaciones cacheadas
+        assert second.llm.ainvoke.await_count == 1
+        assert '1. ML Engineer' in second.llm.ainvoke.await_args.args[0][-1].content
+        assert 'Python developer jobs' in result['python  developer']
+        assert result['ML Engineer'] == ['ML Engineer', 'ML engineer roles']
+
+    @pytest.mark.asyncio
+    async def test_llm_error_falls_back_to_simple_variations(self):
+        """Test que un error del LLM no interrumpe la búsqueda."""
+        variator = QueryVariator()
+        variator.llm = Mock()
+        variator.llm.ainvoke = AsyncMock(side_effect=RuntimeError("timeout"))
+
+        result = await variator.agenerate_variations_batch(['Data Engineer'], 2)
+
+        assert result['Data Engineer'] == variator._simple_variations('Data Engineer', 2)
+
+    @pytest.mark.asyncio
+    async def test_without_batch_skill_each_keyword_goes_through_scheduler(self):
+        """Test que sin skill por lotes cada keyword usa una llamada async (vía el scheduler), no la bloqueante."""
+        variator = QueryVariator()
+        variator.batch_prompt_template = None
+        variator.llm = Mock()
+        variator.llm.invoke = Mock(side_effect=AssertionError("no debe usarse la llamada bloqueante"))
+        variator.llm.ainvoke = AsyncMock(return_value=Mock(content="Python developer jobs\nRemote Python roles"))
+        variator.scheduler.ainvoke = AsyncMock(wraps=variator.scheduler.ainvoke)
+
+        result = await variator.agenerate_variations_batch(['Python Developer', 'ML Engineer'], 2)
+
+        assert variator.scheduler.ainvoke.await_count == 2
+        assert result['Python Developer'] == ['Python Developer', 'Python developer jobs', 'Remote Python roles']
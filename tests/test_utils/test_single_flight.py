@@ -0,0 +1,107 @@
+"""Tests para SingleFlight."""
+
+import asyncio
+import pytest
+from unittest.mock import patch
+from utils.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """Tests para el registro single-flight."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """Test que llamadas concurrentes con la misma clave ejecutan la fábrica una vez."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return ["job"]
+
+        results = await asyncio.gather(*(flight.do("feed", fetch) for _ in range(5)))
+
+        assert calls == 1
+        assert all(result == ["job"] for result in results)
+        assert flight.executions == 1
+        assert flight.shared == 4
+
+    @pytest.mark.asyncio
+    async def test_later_calls_reuse_memoized_result(self):
+        """Test que una llamada posterior reutiliza el resultado sin volver a ejecutar."""
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert await flight.do("feed", fetch) == 1
+        assert await flight.do("feed", fetch) == 1
+        assert await flight.do("other", fetch) == 2
+
+        flight.clear()
+        assert await flight.do("feed", fetch) == 3
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_are_not_memoized(self):
+        """Test que un error llega a todos los que esperaban y se reintenta después."""
+        flight = SingleFlight()
+        attempts = 0
+
+        async def failing():
+            nonlocal attempts
+            attempts += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("503")
+
+        results = await asyncio.gather(
+            flight.do("feed", failing), flight.do("feed", failing), return_exceptions=True
+        )
+        assert attempts == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+
+        async def ok():
+            return "ok"
+
+        assert await flight.do("feed", ok) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_remote_jobs_agents_share_remoteok_and_wwr(self):
+        """Test que dos regiones concurrentes comparten una sola descarga de RemoteOK y WWR."""
+        from agents.remote_jobs_agent import RemoteJobsAgent
+
+        feed_calls = 0
+        wwr_calls = 0
+
+        async def fake_feed(self):
+            nonlocal feed_calls
+            feed_calls += 1
+            await asyncio.sleep(0.01)
+            return [{"id": 1, "position": "Python Dev", "url": "u1"},
+                    {"id": 2, "position": "Go Dev", "url": "u2"}]
+
+        async def fake_wwr(max_results):
+            nonlocal wwr_calls
+            wwr_calls += 1
+            await asyncio.sleep(0.01)
+            return [{"title": "WWR", "url": "w1", "source": "we_work_remotely", "keywords": []}]
+
+        agent = RemoteJobsAgent()
+        with patch("tools.api_clients.RemoteOKClient._fetch_feed_async", fake_feed), \
+             patch("agents.remote_jobs_agent.scrape_we_work_remotely", side_effect=fake_wwr):
+            hispanic, english = await asyncio.gather(
+                agent.search(["python"], region_type="hispanic"),
+                agent.search(["go"], region_type="english")
+            )
+
+        assert feed_calls == 1
+        assert wwr_calls == 1
+        assert [job["url"] for job in hispanic] == ["u1", "w1"]
+        assert [job["url"] for job in english] == ["u2", "w1"]
+        # Cada región recibe su propia copia de los trabajos compartidos
+        assert hispanic[-1]["search_region"] == "hispanic"
+        assert english[-1]["search_region"] == "english"
@@ -0,0 +1,36 @@
+"""Tests para TermMatcher."""
+
+from utils.term_matcher import TermMatcher, tokenize
+
+
+class TestTermMatcher:
+    """Tests para el matcher multi-término por categorías."""
+
+    def test_tokenize_splits_words_and_symbols(self):
+        """Test que la tokenización separa palabras y signos."""
+        assert tokenize("Full-Time C++ / Node.js, Inglés") == \
+            ['full', '-', 'time', 'c', '+', '+', '/', 'node', '.', 'js', ',', 'inglés']
+
+    def test_word_boundaries(self):
+        """Test que los términos solo coinciden como palabras completas."""
+        matcher = TermMatcher({'skills': ['ai', 'java'], 'level': ['senior']})
+
+        hits = matcher.match("we maintain javascript services with seniority")
+
+        assert hits == {'skills': [], 'level': []}
+        assert matcher.match("Senior AI engineer (Java)") == {'skills': ['ai', 'java'], 'level': ['senior']}
+
+    def test_all_categories_in_one_pass(self):
+        """Test que frases, símbolos y términos compartidos se resuelven juntos y en orden configurado."""
+        matcher = TermMatcher({
+            'skills': ['python', 'machine learning', 'c++', 'ci/cd'],
+            'keywords': ['learning', 'python'],
+            'remote': ['work from home', 'remote'],
+        })
+
+        hits = matcher.match("Remote role: C++ and Python for machine learning, CI/CD pipelines. Work  from home!")
+
+        assert hits['skills'] == ['python', 'machine learning', 'c++', 'ci/cd']
+        assert hits['keywords'] == ['learning', 'python']
+        assert hits['remote'] == ['work from home', 'remote']
+        assert matcher.match("machine shop learning")['skills'] == []
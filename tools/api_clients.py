@@ -1,5 +1,6 @@
 """Clientes para APIs de job boards."""
 
+import asyncio
 import requests
 import logging
 import random
@@ -12,9 +13,11 @@ from config.settings import (
     LINKEDIN_API_KEY, INDEED_API_KEY, REMOTEOK_API_KEY, 
     DESCRIPTION_MAX_LENGTH, REQUEST_TIMEOUT,
     USE_USER_AGENT_ROTATION, RANDOM_DELAY_ENABLED,
-    MIN_DELAY, MAX_DELAY
+    MIN_DELAY, MAX_DELAY, SCRAPING_DELAY
 )
+from xml.etree import ElementTree as ET
 from tools.base_api_client import BaseAPIClient
+from utils.single_flight import get_single_flight
 from utils.user_agent_rotator import UserAgentRotator
 from utils.delay_manager import DelayManager
 import time
@@ -39,70 +42,90 @@ class RemoteOKClient(BaseAPIClient):
         Returns:
             Lista de trabajos encontrados
         """
-        jobs = []
-        
         try:
             # Usar método base para hacer request
             response = self._make_request(self.base_url, timeout=REQUEST_TIMEOUT)
-            data = response.json()
-            
-            # Filtrar por keywords
-            for job in data[:max_results]:
-                if isinstance(job, dict) and job.get('id'):
-                    title = job.get('position', '')
-                    description = job.get('description', '')
-                    
-                    # Verificar si coincide con keywords
-                    matches_keyword = False
-                    if keywords:
-                        text_to_search = f"{title} {description}".lower()
-                        for keyword in keywords:
-                            if keyword.lower() in text_to_search:
-                                matches_keyword = True
-                                break
-                    else:
-                        matches_keyword = True
-                    
-                    if matches_keyword:
-                        jobs.append({
-                            'title': title,
-                            'company': job.get('company', ''),
-                            'location': 'Remote',
-                            'url': job.get('url', ''),
-                            'description': description[:DESCRIPTION_MAX_LENGTH],
-                            'source': 'remoteok',
-                            'keywords': keywords,
-                            'tags': job.get('tags', [])
-                        })
-            
-        except requests.exceptions.HTTPError as e:
+            return self._parse_jobs(response.json(), keywords, max_results)
+        except Exception as e:
+            self._log_search_error(e)
+            return []
+    
+    async def search_jobs_async(self, keywords: List[str], max_results: int = 100) -> List[Dict]:
+        """Versión asíncrona de search_jobs (no bloquea el event loop).
+        
+        Args:
+            keywords: Lista de keywords de búsqueda
+            max_results: Número máximo de resultados
+        
+        Returns:
+            Lista de trabajos encontrados
+        """
+        try:
+            # El feed es el mismo para todas las búsquedas: las regiones concurrentes
+            # comparten una sola descarga y filtran por sus keywords después
+            data = await get_single_flight().do(('GET', self.base_url), self._fetch_feed_async)
+            return self._parse_jobs(data, keywords, max_results)
+        except Exception as e:
+            self._log_search_error(e)
+            return []
+    
+    async def _fetch_feed_async(self) -> List:
+        """Descarga y parsea el feed completo de RemoteOK."""
+        response = await self._make_request_async(self.base_url, timeout=REQUEST_TIMEOUT)
+        return response.json()
+    
+    def _parse_jobs(self, data: List, keywords: List[str], max_results: int) -> List[Dict]:
+        """Filtra por keywords y normaliza los trabajos del feed de RemoteOK."""
+        jobs = []
+        
+        # Filtrar por keywords
+        for job in data[:max_results]:
+            if isinstance(job, dict) and job.get('id'):
+                title = job.get('position', '')
+                description = job.get('description', '')
+                
+                # Verificar si coincide con keywords
+                matches_keyword = False
+                if keywords:
+                    text_to_search = f"{title} {description}".lower()
+                    for keyword in keywords:
+                        if keyword.lower() in text_to_search:
+                            matches_keyword = True
+                            break
+                else:
+                    matches_keyword = True
+                
+                if matches_keyword:
+                    jobs.append({
+                        'title': title,
+                        'company': job.get('company', ''),
+                        'location': 'Remote',
+                        'url': job.get('url', ''),
+                        'description': description[:DESCRIPTION_MAX_LENGTH],
+                        'source': 'remoteok',
+                        'keywords': keywords,
+                        'tags': job.get('tags', [])
+                    })
+        
+        return jobs
+    
+    def _log_search_error(self, e: Exception) -> None:
+        """Registra el error de búsqueda según su tipo."""
+        if isinstance(e, requests.exceptions.HTTPError):
             logger.error(f"Error obteniendo trabajos de RemoteOK: {e}")
-        except requests.exceptions.Timeout as e:
+        elif isinstance(e, (requests.exceptions.Timeout, asyncio.TimeoutError)):
             logger.error(f"Timeout obteniendo trabajos de RemoteOK: {e}")
-        except ValueError as e:
+        elif isinstance(e, ValueError):
             logger.error(f"Error parseando JSON de RemoteOK: {e}")
-        except Exception as e:
+        else:
             logger.error(f"Error inesperado obteniendo trabajos de RemoteOK: {e}")
-        
-        return jobs
 
 
-class StackOverflowJobsClient:
+class StackOverflowJobsClient(BaseAPIClient):
     """Cliente para Stack Overflow Jobs (RSS feed)."""
     
     def __init__(self):
-        self.base_url = "https://stackoverflow.com/jobs/feed"
-        self.session = requests.Session()
-        self.ua_rotator = UserAgentRotator() if USE_USER_AGENT_ROTATION else None
-        self.delay_manager = DelayManager(MIN_DELAY, MAX_DELAY) if RANDOM_DELAY_ENABLED else None
-        
-        # Configurar headers iniciales
-        if self.ua_rotator:
-            self.session.headers.update(self.ua_rotator.get_realistic_headers())
-        else:
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
+        super().__init__(base_url="https://stackoverflow.com/jobs/feed")
     
     def search_jobs(self, keywords: List[str], max_results: int = 50, location: Optional[str] = None) -> List[Dict]:
         """Busca trabajos en Stack Overflow Jobs usando RSS feed.
@@ -115,55 +138,82 @@ class StackOverflowJobsClient:
         Returns:
             Lista de trabajos encontrados
         """
-        jobs = []
-        
         try:
-            params = {
-                'q': ' OR '.join(keywords) if keywords else '',
-                'l': location or 'Remote',
-                'd': '20',  # Últimos 20 días
-                'u': 'Miles'
-            }
-            
+            params = self._build_params(keywords, location)
             response = self._make_request(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
-            
-            # Parsear RSS XML
-            from xml.etree import ElementTree as ET
-            root = ET.fromstring(response.content)
-            
-            items = root.findall('.//item')[:max_results]
-            
-            for item in items:
-                try:
-                    title = item.find('title')
-                    link = item.find('link')
-                    description = item.find('description')
-                    company = item.find('a10:author', {'a10': 'http://www.w3.org/2005/Atom'})
-                    
-                    if title is not None and link is not None:
-                        jobs.append({
-                            'title': title.text if title.text else '',
-                            'company': company.text if company is not None and company.text else '',
-                            'location': 'Remote',
-                            'url': link.text if link.text else '',
-                            'description': description.text[:DESCRIPTION_MAX_LENGTH] if description is not None and description.text else '',
-                            'source': 'stack_overflow',
-                            'keywords': keywords
-                        })
-                except Exception as e:
-                    logger.warning(f"Error procesando item de Stack Overflow: {e}")
-                    continue
-            
-        except requests.exceptions.HTTPError as e:
+            return self._parse_feed(response.content, keywords, max_results)
+        except Exception as e:
+            self._log_search_error(e)
+            return []
+    
+    async def search_jobs_async(self, keywords: List[str], max_results: int = 50, location: Optional[str] = None) -> List[Dict]:
+        """Versión asíncrona de search_jobs (no bloquea el event loop).
+        
+        Args:
+            keywords: Lista de keywords de búsqueda
+            max_results: Número máximo de resultados
+            location: Ubicación opcional (default: 'Remote')
+        
+        Returns:
+            Lista de trabajos encontrados
+        """
+        try:
+            params = self._build_params(keywords, location)
+            response = await self._make_request_async(self.base_url, params=params, timeout=REQUEST_TIMEOUT)
+            return self._parse_feed(response.content, keywords, max_results)
+        except Exception as e:
+            self._log_search_error(e)
+            return []
+    
+    def _build_params(self, keywords: List[str], location: Optional[str]) -> Dict:
+        """Construye los parámetros de query del feed."""
+        return {
+            'q': ' OR '.join(keywords) if keywords else '',
+            'l': location or 'Remote',
+            'd': '20',  # Últimos 20 días
+            'u': 'Miles'
+        }
+    
+    def _parse_feed(self, content: bytes, keywords: List[str], max_results: int) -> List[Dict]:
+        """Parsea el RSS XML de Stack Overflow Jobs."""
+        jobs = []
+        
+        root = ET.fromstring(content)
+        items = root.findall('.//item')[:max_results]
+        
+        for item in items:
+            try:
+                title = item.find('title')
+                link = item.find('link')
+                description = item.find('description')
+                company = item.find('a10:author', {'a10': 'http://www.w3.org/2005/Atom'})
+                
+                if title is not None and link is not None:
+                    jobs.append({
+                        'title': title.text if title.text else '',
+                        'company': company.text if company is not None and company.text else '',
+                        'location': 'Remote',
+                        'url': link.text if link.text else '',
+                        'description': description.text[:DESCRIPTION_MAX_LENGTH] if description is not None and description.text else '',
+                        'source': 'stack_overflow',
+                        'keywords': keywords
+                    })
+            except Exception as e:
+                logger.warning(f"Error procesando item de Stack Overflow: {e}")
+                continue
+        
+        return jobs
+    
+    def _log_search_error(self, e: Exception) -> None:
+        """Registra el error de búsqueda según su tipo."""
+        if isinstance(e, requests.exceptions.HTTPError):
             logger.error(f"Error HTTP obteniendo trabajos de Stack Overflow: {e}")
-        except requests.exceptions.Timeout as e:
+        elif isinstance(e, (requests.exceptions.Timeout, asyncio.TimeoutError)):
             logger.error(f"Timeout obteniendo trabajos de Stack Overflow: {e}")
-        except ET.ParseError as e:
+        elif isinstance(e, ET.ParseError):
             logger.error(f"Error parseando XML de Stack Overflow: {e}")
-        except Exception as e:
+        else:
             logger.error(f"Error inesperado obteniendo trabajos de Stack Overflow: {e}")
-        
-        return jobs
 
 
 class GitHubJobsClient(BaseAPIClient):
@@ -174,47 +224,46 @@ class GitHubJobsClient(BaseAPIClient):
     
     def search_jobs(self, keywords: List[str], max_results: int = 30) -> List[Dict]:
         """Busca trabajos en GitHub Jobs."""
-        jobs = []
-        
         try:
-            params = {
-                'description': ' OR '.join(keywords) if keywords else '',
-                'location': 'Remote'
-            }
-            
-            response = self.session.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            for job in data[:max_results]:
-                jobs.append({
-                    'title': job.get('title', ''),
-                    'company': job.get('company', ''),
-                    'location': job.get('location', 'Remote'),
-                    'url': job.get('url', ''),
-                    'description': job.get('description', '')[:500],
-                    'source': 'github_jobs',
-                    'keywords': keywords,
-                    'type': job.get('type', '')
-                })
-            
-            # Delay aleatorio después del request exitoso
-            if self.delay_manager:
-                self.delay_manager.wait_sync()
-            else:
-                time.sleep(SCRAPING_DELAY)
-            
-        except requests.exceptions.HTTPError as e:
-            if e.response and e.response.status_code in [403, 429]:
-                # Rotar User-Agent si hay bloqueo
-                if self.ua_rotator:
-                    self.ua_rotator.rotate()
-                    self.session.headers.update(self.ua_rotator.get_realistic_headers())
-                logger.warning(f"Bloqueo detectado (403/429) en GitHub Jobs, rotando User-Agent...")
+            params = self._build_params(keywords)
+            response = self._make_request(self.base_url, params=params, timeout=30)
+            return self._parse_jobs(response.json(), keywords, max_results)
+        except Exception as e:
             logger.error(f"Error obteniendo trabajos de GitHub Jobs: {e}")
+            return []
+    
+    async def search_jobs_async(self, keywords: List[str], max_results: int = 30) -> List[Dict]:
+        """Versión asíncrona de search_jobs (no bloquea el event loop)."""
+        try:
+            params = self._build_params(keywords)
+            response = await self._make_request_async(self.base_url, params=params, timeout=30)
+            return self._parse_jobs(response.json(), keywords, max_results)
         except Exception as e:
             logger.error(f"Error obteniendo trabajos de GitHub Jobs: {e}")
+            return []
+    
+    def _build_params(self, keywords: List[str]) -> Dict:
+        """Construye los parámetros de query de la API."""
+        return {
+            'description': ' OR '.join(keywords) if keywords else '',
+            'location': 'Remote'
+        }
+    
+    def _parse_jobs(self, data: List, keywords: List[str], max_results: int) -> List[Dict]:
+        """Normaliza los trabajos retornados por GitHub Jobs."""
+        jobs = []
+        
+        for job in data[:max_results]:
+            jobs.append({
+                'title': job.get('title', ''),
+                'company': job.get('company', ''),
+                'location': job.get('location', 'Remote'),
+                'url': job.get('url', ''),
+                'description': job.get('description', '')[:500],
+                'source': 'github_jobs',
+                'keywords': keywords,
+                'type': job.get('type', '')
+            })
         
         return jobs
 
@@ -29,6 +29,7 @@ class BaseAPIClient(ABC):
         self.base_url = base_url
         self.api_key = api_key
         self.session = requests.Session()
+        self.async_http_client = None  # AiohttpClientStrategy, se crea en el primer request async
         self.ua_rotator = None
         self.delay_manager = None
         
@@ -82,16 +83,28 @@ class BaseAPIClient(ABC):
             timeout: Timeout en segundos
         
         Returns:
-            Response object
+            Response object (HTTPResponse si proviene del cache de respuestas)
         
         Raises:
             requests.exceptions.HTTPError: Si hay un error HTTP
             requests.exceptions.Timeout: Si hay timeout
         """
+        from utils.response_cache import get_response_cache
+        
+        # Respuesta cacheada: sin red ni delays
+        response_cache = get_response_cache()
+        if response_cache:
+            cached = response_cache.get('GET', url, params, self.session.headers)
+            if cached is not None:
+                return cached
+        
         try:
             response = self.session.get(url, params=params, timeout=timeout)
             response.raise_for_status()
             
+            if response_cache:
+                response_cache.set('GET', url, params, self.session.headers, response)
+            
             # Aplicar delay después de request exitoso
             self._apply_delay()
             
@@ -102,6 +115,65 @@ class BaseAPIClient(ABC):
                 self._handle_rate_limit_error(url)
             raise
     
+    async def _make_request_async(self, url: str, params: Optional[Dict] = None,
+                                  timeout: int = 30):
+        """Versión asíncrona de _make_request (aiohttp, no bloquea el event loop).
+        
+        Usa los mismos headers que la sesión síncrona (incluida la rotación
+        de User-Agent) y asyncio.sleep para el delay posterior.
+        
+        Args:
+            url: URL del request
+            params: Parámetros de query opcionales
+            timeout: Timeout en segundos
+        
+        Returns:
+            HTTPResponse con el contenido ya leído
+        
+        Raises:
+            requests.exceptions.HTTPError: Si hay un error HTTP
+            asyncio.TimeoutError: Si hay timeout
+        """
+        from config.settings import SCRAPING_DELAY
+        from utils.http_helpers import wait_with_delay
+        from tools.http_client_strategy import AiohttpClientStrategy
+        from utils.response_cache import get_response_cache
+        
+        # Respuesta cacheada: sin red ni delays
+        response_cache = get_response_cache()
+        if response_cache:
+            cached = response_cache.get('GET', url, params, self.session.headers)
+            if cached is not None:
+                return cached
+        
+        if self.async_http_client is None:
+            self.async_http_client = AiohttpClientStrategy(headers=dict(self.session.headers))
+        
+        try:
+            response = await self.async_http_client.get(
+                url, params=params, headers=dict(self.session.headers), timeout=timeout
+            )
+            response.raise_for_status()
+            
+            if response_cache:
+                response_cache.set('GET', url, params, self.session.headers, response)
+            
+            # Aplicar delay después de request exitoso
+            await wait_with_delay(self.delay_manager, SCRAPING_DELAY, use_async=True)
+            
+            return response
+            
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code in [403, 429]:
+                self._handle_rate_limit_error(url)
+            raise
+    
+    async def aclose(self) -> None:
+        """Cierra la sesión HTTP asíncrona si fue creada."""
+        if self.async_http_client is not None:
+            await self.async_http_client.close()
+            self.async_http_client = None
+    
     @abstractmethod
     def search_jobs(self, keywords: List[str], **kwargs) -> List[Dict]:
         """Busca trabajos usando los keywords proporcionados.
@@ -0,0 +1,173 @@
+"""Pool compartido de navegador Playwright para todo el scraping del proceso."""
+
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from playwright.async_api import async_playwright, Browser, BrowserContext, Page
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import (
+    HEADLESS_BROWSER, ENABLE_BROWSER_STEALTH, BROWSER_MAX_CONTEXTS_PER_DOMAIN
+)
+from config.config_loader import get_domain_concurrency
+
+logger = logging.getLogger(__name__)
+
+# Argumentos de lanzamiento anti-detección para Chromium
+STEALTH_LAUNCH_ARGS = [
+    '--disable-blink-features=AutomationControlled',
+    '--disable-dev-shm-usage',
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-web-security',
+    '--disable-features=IsolateOrigins,site-per-process',
+    '--disable-infobars',
+]
+
+
+class BrowserPool:
+    """
+    Pool de un único navegador Chromium compartido por todos los scrapers.
+
+    - Lanza el navegador de forma perezosa en el primer préstamo
+    - Presta contextos y páginas aislados (cookies/headers propios por préstamo)
+    - Limita el número de contextos simultáneos por dominio
+    - Se cierra una sola vez (ver shutdown_browser_pool)
+    """
+
+    def __init__(
+        self,
+        headless: Optional[bool] = None,
+        max_contexts_per_domain: Optional[int] = None
+    ):
+        """
+        Inicializa el pool sin lanzar el navegador.
+
+        Args:
+            headless: Ejecutar sin interfaz (usa HEADLESS_BROWSER si es None)
+            max_contexts_per_domain: Contextos simultáneos por dominio no listado en
+                                     domain_concurrency de job_sources.yaml
+                                     (usa BROWSER_MAX_CONTEXTS_PER_DOMAIN si es None)
+        """
+        self.headless = HEADLESS_BROWSER if headless is None else headless
+        self.max_contexts_per_domain = max(1, max_contexts_per_domain or BROWSER_MAX_CONTEXTS_PER_DOMAIN)
+        self.launch_count = 0  # Número de arranques de Chromium (útil para diagnóstico)
+
+        self._playwright = None
+        self._browser: Optional[Browser] = None
+        self._launch_lock: Optional[asyncio.Lock] = None
+        self._domain_semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    @property
+    def is_running(self) -> bool:
+        """True si el navegador está lanzado y conectado."""
+        return self._browser is not None and self._browser.is_connected()
+
+    async def _ensure_browser(self) -> Browser:
+        """Lanza el navegador si aún no existe (una sola vez aunque haya llamadas concurrentes)."""
+        if self.is_running:
+            return self._browser
+
+        if self._launch_lock is None:
+            self._launch_lock = asyncio.Lock()
+
+        async with self._launch_lock:
+            if not self.is_running:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                launch_args = STEALTH_LAUNCH_ARGS if ENABLE_BROWSER_STEALTH else []
+                self._browser = await self._playwright.chromium.launch(
+                    headless=self.headless,
+                    args=launch_args
+                )
+                self.launch_count += 1
+                logger.info(f"Navegador compartido lanzado (arranque #{self.launch_count})")
+
+        return self._browser
+
+    def _get_domain_semaphore(self, domain: str) -> asyncio.Semaphore:
+        """Retorna el semáforo que limita contextos simultáneos para un dominio."""
+        if domain not in self._domain_semaphores:
+            limit = get_domain_concurrency(domain, default=self.max_contexts_per_domain)
+            self._domain_semaphores[domain] = asyncio.Semaphore(limit)
+        return self._domain_semaphores[domain]
+
+    @asynccontextmanager
+    async def context(self, domain: str, **context_options) -> AsyncIterator[BrowserContext]:
+        """
+        Presta un contexto de navegador aislado para un dominio.
+
+        Args:
+            domain: Dominio objetivo (para el límite de concurrencia)
+            **context_options: Opciones de Browser.new_context (viewport, user_agent, etc.)
+
+        Yields:
+            BrowserContext que se cierra al salir del bloque
+        """
+        async with self._get_domain_semaphore(domain):
+            browser = await self._ensure_browser()
+            browser_context = await browser.new_context(**context_options)
+            try:
+                yield browser_context
+            finally:
+                try:
+                    await browser_context.close()
+                except Exception as e:
+                    logger.debug(f"Error cerrando contexto para {domain}: {e}")
+
+    @asynccontextmanager
+    async def page(self, domain: str, **context_options) -> AsyncIterator[Page]:
+        """
+        Presta una página nueva dentro de un contexto aislado para un dominio.
+
+        Args:
+            domain: Dominio objetivo (para el límite de concurrencia)
+            **context_options: Opciones de Browser.new_context
+
+        Yields:
+            Page lista para navegar; se cierra junto con su contexto
+        """
+        async with self.context(domain, **context_options) as browser_context:
+            yield await browser_context.new_page()
+
+    async def close(self) -> None:
+        """Cierra el navegador y Playwright. El pool puede relanzarse después."""
+        if self._browser is not None:
+            try:
+                await self._browser.close()
+            except Exception as e:
+                logger.debug(f"Error cerrando navegador compartido: {e}")
+        if self._playwright is not None:
+            try:
+                await self._playwright.stop()
+            except Exception as e:
+                logger.debug(f"Error deteniendo Playwright: {e}")
+
+        self._browser = None
+        self._playwright = None
+        self._launch_lock = None
+        self._domain_semaphores.clear()
+
+
+# Instancia única por proceso
+_browser_pool: Optional[BrowserPool] = None
+
+
+def get_browser_pool() -> BrowserPool:
+    """Retorna el pool de navegador compartido del proceso (lo crea si no existe)."""
+    global _browser_pool
+    if _browser_pool is None:
+        _browser_pool = BrowserPool()
+    return _browser_pool
+
+
+async def shutdown_browser_pool() -> None:
+    """Cierra el navegador compartido si fue lanzado. Seguro de llamar varias veces."""
+    global _browser_pool
+    if _browser_pool is not None:
+        await _browser_pool.close()
+        _browser_pool = None
+        logger.debug("Pool de navegador compartido cerrado")
@@ -20,6 +20,51 @@ class EmailValidator:
         'mailer', 'automated', 'notification'
     }
     
+    # Menciones de contacto que pueden acompañar un email escrito de otra forma
+    CONTACT_KEYWORDS_PATTERN = re.compile(
+        r'\b(e-?mail|correo|contact[oa]?|contactar|mailto|'
+        r'send (?:your |us your )?(?:cv|resume)|env[ií]a(?:nos)? (?:tu )?(?:cv|hoja de vida))\b',
+        re.IGNORECASE
+    )
+    
+    # Emails ofuscados: "name [at] domain", "name arroba domain.com", "name at domain dot com".
+    # Un "at" suelto solo cuenta con "dot"/"punto" deletreado: "expert at Node.js" o
+    # "Engineers at Booking.com" son prosa normal en las ofertas
+    OBFUSCATED_EMAIL_PATTERN = re.compile(
+        r'[\[({<]\s*(?:at|arroba|dot|punto)\s*[\])}>]'
+        r'|\w\s+arroba\s+[\w-]+(?:\.|\s+(?:dot|punto)\s+)[a-z]{2,}\b'
+        r'|\w\s+at\s+[\w-]+\s+(?:dot|punto)\s+[a-z]{2,}\b'
+        r'|&#0*64;|＠',
+        re.IGNORECASE
+    )
+    
+    def classify_contact_signal(self, text: str) -> str:
+        """
+        Clasifica qué tan claro es el contacto por email de un texto.
+        
+        Args:
+            text: Descripción del trabajo
+        
+        Returns:
+            'none': sin "@", sin menciones de contacto ni formas ofuscadas
+            'explicit': emails válidos escritos normalmente (el regex basta)
+            'ambiguous': formas ofuscadas, "@" sueltos o menciones de contacto
+                         sin un email legible
+        """
+        if not text:
+            return 'none'
+        if self.OBFUSCATED_EMAIL_PATTERN.search(text):
+            return 'ambiguous'
+        
+        emails = self.extract_emails(text)
+        if text.count('@') > len(emails):
+            return 'ambiguous'
+        if self.filter_valid_emails(emails):
+            return 'explicit'
+        if self.CONTACT_KEYWORDS_PATTERN.search(text):
+            return 'ambiguous'
+        return 'none'
+    
     def extract_emails(self, text: str) -> List[str]:
         """Extrae todos los emails de un texto."""
         emails = self.EMAIL_PATTERN.findall(text)
@@ -1,8 +1,11 @@
 """Interfaz y estrategias para HTTP clients (SOLID: Interface Segregation)."""
 
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from typing import Dict, Optional, Any
+import json
 import requests
+import aiohttp
 import logging
 
 logger = logging.getLogger(__name__)
@@ -137,3 +140,157 @@ class TLSClientStrategy(HTTPClientStrategy):
                 timeout=timeout or 30,
                 **kwargs
             )
+
+
+@dataclass
+class HTTPResponse:
+    """
+    Respuesta HTTP ya leída, independiente del cliente que la produjo.
+    
+    Expone la parte de la interfaz de requests.Response que usan scrapers y
+    API clients (status_code, text, content, json(), raise_for_status()).
+    """
+    url: str
+    status_code: int
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    cookies: Dict[str, str] = field(default_factory=dict)
+    encoding: str = "utf-8"
+    
+    @property
+    def text(self) -> str:
+        """Contenido decodificado como texto."""
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+    
+    def json(self) -> Any:
+        """Parsea el contenido como JSON (lanza ValueError si no es válido)."""
+        return json.loads(self.text)
+    
+    def raise_for_status(self) -> None:
+        """
+        Lanza requests.exceptions.HTTPError si el status es 4xx/5xx.
+        
+        Se usa la misma excepción que requests para que el manejo de errores
+        existente (403/429, logging) funcione igual en la ruta async.
+        """
+        if 400 <= self.status_code < 600:
+            raise requests.exceptions.HTTPError(
+                f"{self.status_code} Error for url: {self.url}",
+                response=self
+            )
+
+
+class AsyncHTTPClientStrategy(ABC):
+    """
+    Interfaz para estrategias de HTTP client asíncronas (Dependency Inversion).
+    
+    Equivalente async de HTTPClientStrategy para no bloquear el event loop.
+    """
+    
+    @abstractmethod
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> HTTPResponse:
+        """
+        Ejecuta GET request de forma asíncrona.
+        
+        Args:
+            url: URL objetivo
+            params: Parámetros de query string
+            headers: Headers HTTP
+            timeout: Timeout en segundos
+            **kwargs: Argumentos adicionales específicos de la implementación
+        
+        Returns:
+            HTTPResponse con el contenido ya leído
+        """
+        pass
+    
+    async def close(self) -> None:
+        """Libera recursos del cliente (sesiones, conexiones)."""
+        pass
+
+
+class AiohttpClientStrategy(AsyncHTTPClientStrategy):
+    """Estrategia asíncrona usando aiohttp con sesión y cookies persistentes."""
+    
+    def __init__(self, headers: Optional[Dict] = None, default_timeout: float = 30):
+        """
+        Inicializa estrategia aiohttp. La sesión se crea de forma perezosa
+        dentro del event loop en el primer request.
+        
+        Args:
+            headers: Headers por defecto de la sesión
+            default_timeout: Timeout por defecto en segundos
+        """
+        self.headers: Dict[str, str] = dict(headers or {})
+        self.default_timeout = default_timeout
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._pending_cookies: Dict[str, str] = {}
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Retorna la sesión aiohttp, creándola si no existe o fue cerrada."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(headers=self.headers)
+            if self._pending_cookies:
+                self._session.cookie_jar.update_cookies(self._pending_cookies)
+                self._pending_cookies = {}
+        return self._session
+    
+    def update_cookies(self, cookies: Dict[str, str]) -> None:
+        """
+        Agrega cookies a la sesión (se aplican al crearla si aún no existe).
+        
+        Args:
+            cookies: Dict nombre -> valor
+        """
+        if not cookies:
+            return
+        if self._session is None or self._session.closed:
+            self._pending_cookies.update(cookies)
+        else:
+            self._session.cookie_jar.update_cookies(cookies)
+    
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict] = None,
+        headers: Optional[Dict] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> HTTPResponse:
+        """
+        Ejecuta GET request usando aiohttp y lee el cuerpo completo.
+        
+        Returns:
+            HTTPResponse
+        """
+        session = self._get_session()
+        client_timeout = aiohttp.ClientTimeout(total=timeout or self.default_timeout)
+        async with session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=client_timeout,
+            **kwargs
+        ) as response:
+            content = await response.read()
+            return HTTPResponse(
+                url=str(response.url),
+                status_code=response.status,
+                content=content,
+                headers=dict(response.headers),
+                cookies={name: morsel.value for name, morsel in response.cookies.items()},
+                encoding=response.get_encoding() if content else "utf-8"
+            )
+    
+    async def close(self) -> None:
+        """Cierra la sesión aiohttp si está abierta."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
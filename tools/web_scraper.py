@@ -6,7 +6,7 @@ import logging
 import random
 from typing import List, Dict, Optional
 from urllib.parse import urlencode, urljoin, urlparse
-from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from bs4 import BeautifulSoup
 import requests
 import sys
@@ -31,7 +31,12 @@ from utils.fingerprint_manager import FingerprintManager
 from utils.adaptive_rate_limiter import AdaptiveRateLimiter
 from utils.session_warmup import SessionWarmup
 from utils.exceptions import ScrapingError, RateLimitError
-from tools.http_client_strategy import HTTPClientStrategy, RequestsClientStrategy, TLSClientStrategy
+from tools.http_client_strategy import (
+    HTTPClientStrategy, RequestsClientStrategy, TLSClientStrategy,
+    AsyncHTTPClientStrategy, AiohttpClientStrategy
+)
+from tools.browser_pool import BrowserPool, get_browser_pool
+from utils.response_cache import get_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +48,8 @@ class WebScraper:
         self,
         circuit_breaker: Optional[CircuitBreaker] = None,
         fingerprint_manager: Optional[FingerprintManager] = None,
-        rate_limiter: Optional[AdaptiveRateLimiter] = None
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        browser_pool: Optional[BrowserPool] = None
     ):
         """
         Inicializa WebScraper con inyección de dependencias (SOLID: Dependency Inversion).
@@ -52,11 +58,13 @@ class WebScraper:
             circuit_breaker: Circuit breaker para detectar bloqueos (opcional)
             fingerprint_manager: Gestor de fingerprint (opcional)
             rate_limiter: Rate limiter adaptativo (opcional)
+            browser_pool: Pool de navegador (opcional, usa el pool compartido del proceso)
         """
         self.delay = SCRAPING_DELAY
         self.max_retries = MAX_RETRIES
         self.headless = HEADLESS_BROWSER
-        self.browser: Optional[Browser] = None
+        self._browser_pool = browser_pool
+        self.browser_pool: Optional[BrowserPool] = None
         
         # Inyección de dependencias
         self.circuit_breaker = circuit_breaker if USE_CIRCUIT_BREAKER else None
@@ -79,34 +87,18 @@ class WebScraper:
         self.delay_manager = DelayManager(MIN_DELAY, MAX_DELAY) if RANDOM_DELAY_ENABLED else None
         
     async def __aenter__(self):
-        """Context manager entry con configuración anti-detección."""
-        self.playwright = await async_playwright().start()
+        """
+        Context manager entry: toma el pool de navegador compartido.
         
-        # Configuración anti-detección para Playwright
-        launch_args = []
-        if ENABLE_BROWSER_STEALTH:
-            launch_args = [
-                '--disable-blink-features=AutomationControlled',
-                '--disable-dev-shm-usage',
-                '--no-sandbox',
-                '--disable-setuid-sandbox',
-                '--disable-web-security',
-                '--disable-features=IsolateOrigins,site-per-process',
-                '--disable-infobars',
-                '--disable-blink-features=AutomationControlled'
-            ]
-        
-        self.browser = await self.playwright.chromium.launch(
-            headless=self.headless,
-            args=launch_args
-        )
+        El navegador se lanza de forma perezosa en el primer fetch_page y se
+        reutiliza entre scrapers; no se cierra al salir del bloque.
+        """
+        self.browser_pool = self._browser_pool or get_browser_pool()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit."""
-        if self.browser:
-            await self.browser.close()
-        await self.playwright.stop()
+        """Context manager exit (el pool compartido se cierra con shutdown_browser_pool)."""
+        self.browser_pool = None
     
     async def _simulate_human_behavior(self, page: Page):
         """Simula comportamiento humano en la página para evitar detección."""
@@ -161,6 +153,97 @@ class WebScraper:
         except Exception:
             return 'unknown'
     
+    async def _load_page(self, page: Page, url: str, wait_selector: Optional[str] = None) -> str:
+        """Configura fingerprint/stealth en una página prestada, navega y retorna su HTML."""
+        # Obtener fingerprint consistente
+        if self.fingerprint_manager:
+            fingerprint = self.fingerprint_manager.get_current_fingerprint()
+            
+            # Configurar viewport consistente con fingerprint
+            viewport = fingerprint['viewport']
+            await page.set_viewport_size({"width": viewport['width'], "height": viewport['height']})
+            
+            # Headers basados en fingerprint
+            if self.ua_rotator:
+                headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent'])
+            else:
+                headers = {'User-Agent': fingerprint['user_agent']}
+            
+            await page.set_extra_http_headers(headers)
+        elif self.ua_rotator:
+            headers = self.ua_rotator.get_realistic_headers()
+            await page.set_extra_http_headers(headers)
+        
+        # Scripts de stealth mejorados
+        if ENABLE_BROWSER_STEALTH:
+            await page.add_init_script("""
+                // Ocultar propiedades de automatización
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => undefined
+                });
+                
+                // Simular plugins
+                Object.defineProperty(navigator, 'plugins', {
+                    get: () => [1, 2, 3, 4, 5]
+                });
+                
+                // Simular languages
+                Object.defineProperty(navigator, 'languages', {
+                    get: () => ['es-ES', 'es', 'en-US', 'en']
+                });
+                
+                // Ocultar Chrome automation
+                window.navigator.chrome = {
+                    runtime: {},
+                    loadTimes: function() {},
+                    csi: function() {},
+                    app: {}
+                };
+                
+                // Simular permisos
+                const originalQuery = window.navigator.permissions.query;
+                window.navigator.permissions.query = (parameters) => (
+                    parameters.name === 'notifications' ?
+                        Promise.resolve({ state: Notification.permission }) :
+                        originalQuery(parameters)
+                );
+                
+                // Ocultar propiedad automation
+                Object.defineProperty(navigator, 'webdriver', {
+                    get: () => false
+                });
+                
+                // Simular hardwareConcurrency
+                Object.defineProperty(navigator, 'hardwareConcurrency', {
+                    get: () => 8
+                });
+                
+                // Simular deviceMemory
+                Object.defineProperty(navigator, 'deviceMemory', {
+                    get: () => 8
+                });
+            """)
+        
+        # Navegar a la URL
+        await page.goto(url, wait_until="networkidle", timeout=30000)
+        
+        # Simular comportamiento humano antes de esperar selector
+        if SIMULATE_HUMAN_BEHAVIOR:
+            await self._simulate_human_behavior(page)
+        
+        # Esperar selector específico si se proporciona
+        if wait_selector:
+            await page.wait_for_selector(wait_selector, timeout=10000)
+        
+        # Esperar un poco más para que cargue JavaScript (reducido en FAST_MODE)
+        if FAST_MODE:
+            await asyncio.sleep(random.uniform(0.5, 1.0))
+        else:
+            await asyncio.sleep(random.uniform(1.5, 3.0))
+        
+        # Obtener HTML
+        return await page.content()
+    
     async def fetch_page(self, url: str, wait_selector: Optional[str] = None) -> str:
         """
         Obtiene el contenido HTML de una página con técnicas anti-detección avanzadas.
@@ -172,8 +255,16 @@ class WebScraper:
         - Scripts de stealth mejorados
         - Viewport consistente con fingerprint
         """
-        if not self.browser:
-            raise RuntimeError("Browser no inicializado. Usa 'async with WebScraper()'")
+        if not self.browser_pool:
+            raise RuntimeError("Pool de navegador no inicializado. Usa 'async with WebScraper()'")
+        
+        # Página ya renderizada en una ejecución reciente: sin navegador ni delays
+        response_cache = get_response_cache()
+        cache_params = {'wait_selector': wait_selector or ''}
+        if response_cache:
+            cached_html = response_cache.get_text('BROWSER', url, cache_params)
+            if cached_html is not None:
+                return cached_html
         
         domain = self._get_domain(url)
         start_time = time.time()
@@ -185,100 +276,15 @@ class WebScraper:
         
         for attempt in range(self.max_retries):
             try:
-                page = await self.browser.new_page()
-                
-                # Obtener fingerprint consistente
-                if self.fingerprint_manager:
-                    fingerprint = self.fingerprint_manager.get_current_fingerprint()
-                    
-                    # Configurar viewport consistente con fingerprint
-                    viewport = fingerprint['viewport']
-                    await page.set_viewport_size({"width": viewport['width'], "height": viewport['height']})
-                    
-                    # Headers basados en fingerprint
-                    if self.ua_rotator:
-                        headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent'])
-                    else:
-                        headers = {'User-Agent': fingerprint['user_agent']}
-                    
-                    await page.set_extra_http_headers(headers)
-                elif self.ua_rotator:
-                    headers = self.ua_rotator.get_realistic_headers()
-                    await page.set_extra_http_headers(headers)
-                
-                # Scripts de stealth mejorados
-                if ENABLE_BROWSER_STEALTH:
-                    await page.add_init_script("""
-                        // Ocultar propiedades de automatización
-                        Object.defineProperty(navigator, 'webdriver', {
-                            get: () => undefined
-                        });
-                        
-                        // Simular plugins
-                        Object.defineProperty(navigator, 'plugins', {
-                            get: () => [1, 2, 3, 4, 5]
-                        });
-                        
-                        // Simular languages
-                        Object.defineProperty(navigator, 'languages', {
-                            get: () => ['es-ES', 'es', 'en-US', 'en']
-                        });
-                        
-                        // Ocultar Chrome automation
-                        window.navigator.chrome = {
-                            runtime: {},
-                            loadTimes: function() {},
-                            csi: function() {},
-                            app: {}
-                        };
-                        
-                        // Simular permisos
-                        const originalQuery = window.navigator.permissions.query;
-                        window.navigator.permissions.query = (parameters) => (
-                            parameters.name === 'notifications' ?
-                                Promise.resolve({ state: Notification.permission }) :
-                                originalQuery(parameters)
-                        );
-                        
-                        // Ocultar propiedad automation
-                        Object.defineProperty(navigator, 'webdriver', {
-                            get: () => false
-                        });
-                        
-                        // Simular hardwareConcurrency
-                        Object.defineProperty(navigator, 'hardwareConcurrency', {
-                            get: () => 8
-                        });
-                        
-                        // Simular deviceMemory
-                        Object.defineProperty(navigator, 'deviceMemory', {
-                            get: () => 8
-                        });
-                    """)
-                
-                # Navegar a la URL
-                await page.goto(url, wait_until="networkidle", timeout=30000)
-                
-                # Simular comportamiento humano antes de esperar selector
-                if SIMULATE_HUMAN_BEHAVIOR:
-                    await self._simulate_human_behavior(page)
-                
-                # Esperar selector específico si se proporciona
-                if wait_selector:
-                    await page.wait_for_selector(wait_selector, timeout=10000)
-                
-                # Esperar un poco más para que cargue JavaScript (reducido en FAST_MODE)
-                if FAST_MODE:
-                    await asyncio.sleep(random.uniform(0.5, 1.0))
-                else:
-                    await asyncio.sleep(random.uniform(1.5, 3.0))
-                
-                # Obtener HTML
-                content = await page.content()
-                await page.close()
+                # Tomar página del pool compartido (respeta límite de contextos por dominio)
+                async with self.browser_pool.page(domain) as page:
+                    content = await self._load_page(page, url, wait_selector)
                 
                 response_time = time.time() - start_time
                 
+                if response_cache and content:
+                    response_cache.set_text('BROWSER', url, cache_params, None, content)
+                
                 # Registrar éxito en Circuit Breaker y Rate Limiter
                 if self.circuit_breaker:
                     self.circuit_breaker.record_success(domain)
@@ -336,8 +342,17 @@ class WebScraper:
         return f"{base_url}?{urlencode(params)}"
 
 
-class SimpleHTTPScraper:
-    """Scraper simple usando requests (sin JavaScript) con técnicas anti-detección avanzadas."""
+class _HTTPScraperBase:
+    """
+    Lógica común de SimpleHTTPScraper y AsyncHTTPScraper: inyección de
+    dependencias, headers, manejo de respuestas/errores y delays. Cada subclase
+    solo implementa su loop de fetch (time.sleep vs asyncio.sleep).
+    
+    Las subclases deben exponer `self.headers` (headers base de la sesión)
+    antes de llamar a este __init__.
+    """
+    
+    DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
     
     def __init__(
         self,
@@ -345,11 +360,10 @@ class SimpleHTTPScraper:
         circuit_breaker: Optional[CircuitBreaker] = None,
         referer_manager: Optional[RefererManager] = None,
         fingerprint_manager: Optional[FingerprintManager] = None,
-        rate_limiter: Optional[AdaptiveRateLimiter] = None,
-        http_client_strategy: Optional[HTTPClientStrategy] = None
+        rate_limiter: Optional[AdaptiveRateLimiter] = None
     ):
         """
-        Inicializa SimpleHTTPScraper con inyección de dependencias (SOLID: Dependency Inversion).
+        Inicializa las dependencias compartidas (SOLID: Dependency Inversion).
         
         Args:
             session_manager: Gestor de sesiones/cookies (opcional)
@@ -357,10 +371,8 @@ class SimpleHTTPScraper:
             referer_manager: Gestor de referers (opcional)
             fingerprint_manager: Gestor de fingerprint (opcional)
             rate_limiter: Rate limiter adaptativo (opcional)
-            http_client_strategy: Estrategia de HTTP client (opcional)
         """
         self.delay = SCRAPING_DELAY
-        self.session = requests.Session()
         
         # Inyección de dependencias (Dependency Inversion)
         self.session_manager = session_manager if USE_SESSION_PERSISTENCE else None
@@ -386,6 +398,170 @@ class SimpleHTTPScraper:
         if not self.rate_limiter and USE_ADAPTIVE_RATE_LIMITING:
             self.rate_limiter = AdaptiveRateLimiter()
         
+        # User-Agent y delays (mantener compatibilidad)
+        self.ua_rotator = UserAgentRotator() if USE_USER_AGENT_ROTATION else None
+        self.delay_manager = DelayManager(MIN_DELAY, MAX_DELAY) if RANDOM_DELAY_ENABLED else None
+        
+        # Configurar headers iniciales
+        if self.fingerprint_manager:
+            fingerprint = self.fingerprint_manager.get_current_fingerprint()
+            self.headers.update(self.ua_rotator.get_realistic_headers(fingerprint['user_agent']) if self.ua_rotator else {})
+        elif self.ua_rotator:
+            self.headers.update(self.ua_rotator.get_realistic_headers())
+        else:
+            self.headers.update({'User-Agent': self.DEFAULT_USER_AGENT})
+    
+    def _get_domain(self, url: str) -> str:
+        """Extrae dominio de una URL."""
+        try:
+            parsed = urlparse(url)
+            return parsed.netloc.replace('www.', '').lower()
+        except Exception:
+            return 'unknown'
+    
+    def _check_circuit(self, domain: str) -> None:
+        """Lanza excepción si el Circuit Breaker del dominio está abierto."""
+        if self.circuit_breaker and self.circuit_breaker.is_open(domain):
+            logger.warning(f"Circuit breaker OPEN para {domain}, saltando request")
+            raise Exception(f"Dominio {domain} está bloqueado temporalmente (Circuit Breaker)")
+    
+    def _prepare_headers(self, url: str, attempt: int) -> Dict[str, str]:
+        """
+        Prepara los headers del intento (fingerprint consistente y referer) y
+        los aplica a los headers base.
+        
+        Args:
+            url: URL del request
+            attempt: Número de intento (desde 0)
+        
+        Returns:
+            Headers específicos del intento
+        """
+        headers = {}
+        
+        if self.fingerprint_manager:
+            fingerprint = self.fingerprint_manager.get_current_fingerprint()
+            if self.ua_rotator:
+                headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent'])
+            else:
+                headers['User-Agent'] = fingerprint['user_agent']
+        elif self.ua_rotator and attempt == 0:
+            headers = self.ua_rotator.get_realistic_headers()
+        
+        # Agregar referer realista
+        if self.referer_manager:
+            referer = self.referer_manager.get_referer(url)
+            if referer:
+                headers['Referer'] = referer
+        
+        if headers:
+            self.headers.update(headers)
+        return headers
+    
+    def _handle_response(self, domain: str, url: str, params: Optional[Dict], response, start_time: float, response_cache) -> str:
+        """
+        Registra la respuesta y, si es exitosa, la cachea y guarda cookies.
+        
+        Raises:
+            requests.exceptions.HTTPError: Si el status indica error
+        
+        Returns:
+            HTML de la respuesta
+        """
+        # Registrar respuesta en Adaptive Rate Limiter (una sola vez, también para errores HTTP)
+        if self.rate_limiter:
+            self.rate_limiter.record_response(domain, response.status_code, time.time() - start_time)
+        
+        response.raise_for_status()
+        
+        if response_cache:
+            response_cache.set('GET', url, params, self.headers, response)
+        
+        # Guardar cookies si hay respuesta exitosa
+        if self.session_manager and response.cookies:
+            self.session_manager.update_cookies_from_response(domain, response.cookies)
+        
+        # Registrar éxito en Circuit Breaker
+        if self.circuit_breaker:
+            self.circuit_breaker.record_success(domain)
+        
+        return response.text
+    
+    def _handle_http_error(self, domain: str, url: str, error: requests.exceptions.HTTPError) -> None:
+        """Ante un bloqueo (403/429) registra el fallo y rota User-Agent y fingerprint."""
+        status_code = error.response.status_code if error.response is not None else 0
+        
+        if status_code in [403, 429]:
+            # Registrar fallo en Circuit Breaker
+            if self.circuit_breaker:
+                self.circuit_breaker.record_failure(domain)
+            
+            # Si es bloqueo, rotar User-Agent y fingerprint
+            if self.ua_rotator:
+                self.ua_rotator.rotate()
+            if self.fingerprint_manager:
+                self.fingerprint_manager.reset_fingerprint()
+                fingerprint = self.fingerprint_manager.get_current_fingerprint()
+                self.headers.update(self.ua_rotator.get_realistic_headers(fingerprint['user_agent']) if self.ua_rotator else {})
+            
+            logger.warning(f"Bloqueo detectado (403/429) para {url}, rotando User-Agent y fingerprint...")
+    
+    def _handle_error(self, domain: str, start_time: float) -> None:
+        """Registra un fallo genérico (red, timeout, etc.)."""
+        if self.rate_limiter:
+            self.rate_limiter.record_response(domain, 0, time.time() - start_time)  # 0 = error desconocido
+        if self.circuit_breaker:
+            self.circuit_breaker.record_failure(domain)
+    
+    def _retry_delay(self, attempt: int, max_jitter: float) -> float:
+        """Backoff exponencial con jitter antes del siguiente intento."""
+        return self.delay * (2 ** attempt) + random.uniform(0, max_jitter)
+    
+    def _success_delay(self, domain: str) -> float:
+        """Delay adaptativo a aplicar después de un request exitoso."""
+        if self.rate_limiter:
+            return self.rate_limiter.get_delay(domain)
+        if self.delay_manager:
+            return self.delay_manager.get_random_delay()
+        return self.delay
+    
+    def parse_html(self, html: str) -> BeautifulSoup:
+        """Parsea HTML con BeautifulSoup."""
+        return BeautifulSoup(html, 'html.parser')
+    
+    def extract_text(self, element, default: str = "") -> str:
+        """Extrae texto de un elemento BeautifulSoup."""
+        if element:
+            return element.get_text(strip=True)
+        return default
+
+
+class SimpleHTTPScraper(_HTTPScraperBase):
+    """Scraper simple usando requests (sin JavaScript) con técnicas anti-detección avanzadas."""
+    
+    def __init__(
+        self,
+        session_manager: Optional[SessionManager] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        referer_manager: Optional[RefererManager] = None,
+        fingerprint_manager: Optional[FingerprintManager] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        http_client_strategy: Optional[HTTPClientStrategy] = None
+    ):
+        """
+        Inicializa SimpleHTTPScraper con inyección de dependencias (SOLID: Dependency Inversion).
+        
+        Args:
+            session_manager: Gestor de sesiones/cookies (opcional)
+            circuit_breaker: Circuit breaker para detectar bloqueos (opcional)
+            referer_manager: Gestor de referers (opcional)
+            fingerprint_manager: Gestor de fingerprint (opcional)
+            rate_limiter: Rate limiter adaptativo (opcional)
+            http_client_strategy: Estrategia de HTTP client (opcional)
+        """
+        self.session = requests.Session()
+        super().__init__(session_manager, circuit_breaker, referer_manager, fingerprint_manager, rate_limiter)
+        
         # HTTP Client Strategy (SOLID: Dependency Inversion)
         # Usar TLS bypass si está habilitado y disponible, sino usar requests estándar
         if http_client_strategy:
@@ -407,30 +583,11 @@ class SimpleHTTPScraper:
         
         # Session Warmup (SOLID: Dependency Inversion)
         self.warmup = SessionWarmup(self.http_client) if USE_SESSION_WARMUP else None
-        
-        # User-Agent y delays (mantener compatibilidad)
-        self.ua_rotator = UserAgentRotator() if USE_USER_AGENT_ROTATION else None
-        self.delay_manager = DelayManager(MIN_DELAY, MAX_DELAY) if RANDOM_DELAY_ENABLED else None
-        
-        # Configurar headers iniciales
-        if self.fingerprint_manager:
-            fingerprint = self.fingerprint_manager.get_current_fingerprint()
-            headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent']) if self.ua_rotator else {}
-            self.session.headers.update(headers)
-        elif self.ua_rotator:
-            self.session.headers.update(self.ua_rotator.get_realistic_headers())
-        else:
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
     
-    def _get_domain(self, url: str) -> str:
-        """Extrae dominio de una URL."""
-        try:
-            parsed = urlparse(url)
-            return parsed.netloc.replace('www.', '').lower()
-        except Exception:
-            return 'unknown'
+    @property
+    def headers(self):
+        """Headers base: los de la sesión de requests."""
+        return self.session.headers
     
     def fetch(self, url: str, params: Optional[Dict] = None) -> str:
         """
@@ -442,14 +599,17 @@ class SimpleHTTPScraper:
         - Referer Manager para referers realistas
         - Adaptive Rate Limiter para delays adaptativos
         - Fingerprint Manager para consistencia
+        - Cache de respuestas en disco (USE_CACHE) sin red ni delays en hits
         """
+        response_cache = get_response_cache()
+        if response_cache:
+            cached = response_cache.get('GET', url, params, self.headers)
+            if cached is not None:
+                return cached.text
+        
         domain = self._get_domain(url)
         start_time = time.time()
-        
-        # Verificar Circuit Breaker
-        if self.circuit_breaker and self.circuit_breaker.is_open(domain):
-            logger.warning(f"Circuit breaker OPEN para {domain}, saltando request")
-            raise Exception(f"Dominio {domain} está bloqueado temporalmente (Circuit Breaker)")
+        self._check_circuit(domain)
         
         # Warm-up session si es necesario (solo una vez por dominio, antes del loop de retries)
         if self.warmup:
@@ -464,110 +624,143 @@ class SimpleHTTPScraper:
         
         for attempt in range(MAX_RETRIES):
             try:
-                # Preparar headers con fingerprint consistente
-                headers = {}
-                
-                if self.fingerprint_manager:
-                    fingerprint = self.fingerprint_manager.get_current_fingerprint()
-                    if self.ua_rotator:
-                        headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent'])
-                    else:
-                        headers['User-Agent'] = fingerprint['user_agent']
-                elif self.ua_rotator and attempt == 0:
-                    headers = self.ua_rotator.get_realistic_headers()
-                
-                # Agregar referer realista
-                if self.referer_manager:
-                    referer = self.referer_manager.get_referer(url)
-                    if referer:
-                        headers['Referer'] = referer
-                
-                # Actualizar headers de sesión
-                if headers:
-                    self.session.headers.update(headers)
+                headers = self._prepare_headers(url, attempt)
                 
                 # Ejecutar request usando estrategia HTTP (SOLID: Dependency Inversion)
                 response = self.http_client.get(url, params=params, headers=headers, timeout=30)
-                response_time = time.time() - start_time
-                
-                # Registrar respuesta en Adaptive Rate Limiter
-                if self.rate_limiter:
-                    self.rate_limiter.record_response(domain, response.status_code, response_time)
-                
-                response.raise_for_status()
-                
-                # Guardar cookies si hay respuesta exitosa
-                if self.session_manager and response.cookies:
-                    self.session_manager.update_cookies_from_response(domain, response.cookies)
-                
-                # Registrar éxito en Circuit Breaker
-                if self.circuit_breaker:
-                    self.circuit_breaker.record_success(domain)
+                html = self._handle_response(domain, url, params, response, start_time, response_cache)
                 
                 # Delay adaptativo después del request exitoso
-                if self.rate_limiter:
-                    delay = self.rate_limiter.get_delay(domain)
-                    time.sleep(delay)
-                elif self.delay_manager:
-                    self.delay_manager.wait_sync()
-                else:
-                    time.sleep(self.delay)
-                
-                return response.text
+                time.sleep(self._success_delay(domain))
+                return html
                 
             except requests.exceptions.HTTPError as e:
-                response_time = time.time() - start_time
+                self._handle_http_error(domain, url, e)
+                logger.warning(f"Intento {attempt + 1} fallido para {url}: {e}")
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(self._retry_delay(attempt, 2))
+                else:
+                    logger.error(f"Error al obtener {url}")
+                    raise
+            except Exception as e:
+                self._handle_error(domain, start_time)
+                logger.warning(f"Intento {attempt + 1} fallido para {url}: {e}")
+                if attempt < MAX_RETRIES - 1:
+                    time.sleep(self._retry_delay(attempt, 1))
+                else:
+                    logger.error(f"Error al obtener {url}")
+                    raise
+        
+        return ""
+
+
+class AsyncHTTPScraper(_HTTPScraperBase):
+    """
+    Scraper HTTP asíncrono (aiohttp, sin JavaScript) con las mismas técnicas
+    anti-detección que SimpleHTTPScraper, sin bloquear el event loop.
+    """
+    
+    def __init__(
+        self,
+        session_manager: Optional[SessionManager] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        referer_manager: Optional[RefererManager] = None,
+        fingerprint_manager: Optional[FingerprintManager] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        http_client_strategy: Optional[AsyncHTTPClientStrategy] = None
+    ):
+        """
+        Inicializa AsyncHTTPScraper con inyección de dependencias (SOLID: Dependency Inversion).
+        
+        Args:
+            session_manager: Gestor de sesiones/cookies (opcional)
+            circuit_breaker: Circuit breaker para detectar bloqueos (opcional)
+            referer_manager: Gestor de referers (opcional)
+            fingerprint_manager: Gestor de fingerprint (opcional)
+            rate_limiter: Rate limiter adaptativo (opcional)
+            http_client_strategy: Estrategia de HTTP client async (opcional, usa aiohttp)
+        """
+        # Headers base (equivalente a session.headers en SimpleHTTPScraper)
+        self.headers: Dict[str, str] = {}
+        super().__init__(session_manager, circuit_breaker, referer_manager, fingerprint_manager, rate_limiter)
+        
+        # HTTP Client Strategy async (SOLID: Dependency Inversion)
+        self.http_client = http_client_strategy or AiohttpClientStrategy(headers=self.headers)
+        
+        # Session Warmup (SOLID: Dependency Inversion)
+        self.warmup = SessionWarmup(self.http_client) if USE_SESSION_WARMUP else None
+    
+    async def __aenter__(self):
+        """Context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit - cerrar sesión HTTP."""
+        await self.close()
+    
+    async def close(self) -> None:
+        """Cierra la sesión HTTP subyacente."""
+        await self.http_client.close()
+    
+    async def fetch(self, url: str, params: Optional[Dict] = None) -> str:
+        """
+        Obtiene contenido HTML de forma asíncrona con técnicas anti-detección.
+        
+        Integra las mismas piezas que SimpleHTTPScraper.fetch (Circuit Breaker,
+        cookies persistentes, referer, rate limiter adaptativo y fingerprint),
+        usando asyncio.sleep para delays y backoff. Los hits del cache de
+        respuestas (USE_CACHE) no tocan la red ni aplican delays.
+        """
+        response_cache = get_response_cache()
+        if response_cache:
+            cached = response_cache.get('GET', url, params, self.headers)
+            if cached is not None:
+                return cached.text
+        
+        domain = self._get_domain(url)
+        start_time = time.time()
+        self._check_circuit(domain)
+        
+        # Warm-up session si es necesario (solo una vez por dominio)
+        if self.warmup:
+            await self.warmup.awarm_up(domain)
+        
+        # Cargar cookies guardadas
+        if self.session_manager and hasattr(self.http_client, 'update_cookies'):
+            saved_cookies = self.session_manager.load_cookies(domain)
+            if saved_cookies:
+                self.http_client.update_cookies(saved_cookies)
+                logger.debug(f"Cookies cargadas para {domain}")
+        
+        for attempt in range(MAX_RETRIES):
+            try:
+                self._prepare_headers(url, attempt)
                 
-                # Registrar respuesta en Adaptive Rate Limiter
-                if self.rate_limiter and e.response:
-                    self.rate_limiter.record_response(domain, e.response.status_code, response_time)
+                response = await self.http_client.get(url, params=params, headers=dict(self.headers), timeout=30)
+                html = self._handle_response(domain, url, params, response, start_time, response_cache)
                 
-                if e.response and e.response.status_code in [403, 429]:
-                    # Registrar fallo en Circuit Breaker
-                    if self.circuit_breaker:
-                        self.circuit_breaker.record_failure(domain)
-                    
-                    # Si es bloqueo, rotar User-Agent y fingerprint
-                    if self.ua_rotator:
-                        self.ua_rotator.rotate()
-                    if self.fingerprint_manager:
-                        self.fingerprint_manager.reset_fingerprint()
-                        fingerprint = self.fingerprint_manager.get_current_fingerprint()
-                        headers = self.ua_rotator.get_realistic_headers(fingerprint['user_agent']) if self.ua_rotator else {}
-                        self.session.headers.update(headers)
-                    
-                    logger.warning(f"Bloqueo detectado (403/429) para {url}, rotando User-Agent y fingerprint...")
+                # Delay adaptativo después del request exitoso
+                await asyncio.sleep(self._success_delay(domain))
+                return html
                 
+            except requests.exceptions.HTTPError as e:
+                self._handle_http_error(domain, url, e)
                 logger.warning(f"Intento {attempt + 1} fallido para {url}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    # Backoff exponencial con jitter
-                    backoff_delay = self.delay * (2 ** attempt) + random.uniform(0, 2)
-                    time.sleep(backoff_delay)
+                    await asyncio.sleep(self._retry_delay(attempt, 2))
                 else:
                     logger.error(f"Error al obtener {url}")
                     raise
             except Exception as e:
-                response_time = time.time() - start_time
-                
-                # Registrar fallo genérico
-                if self.rate_limiter:
-                    self.rate_limiter.record_response(domain, 0, response_time)  # 0 = error desconocido
-                if self.circuit_breaker:
-                    self.circuit_breaker.record_failure(domain)
-                
+                self._handle_error(domain, start_time)
                 logger.warning(f"Intento {attempt + 1} fallido para {url}: {e}")
                 if attempt < MAX_RETRIES - 1:
-                    backoff_delay = self.delay * (2 ** attempt) + random.uniform(0, 1)
-                    time.sleep(backoff_delay)
+                    await asyncio.sleep(self._retry_delay(attempt, 1))
                 else:
                     logger.error(f"Error al obtener {url}")
                     raise
         
         return ""
-    
-    def parse_html(self, html: str) -> BeautifulSoup:
-        """Parsea HTML con BeautifulSoup."""
-        return BeautifulSoup(html, 'html.parser')
 
 
 async def scrape_linkedin_jobs(keywords: List[str], max_results: int = 50, location: Optional[str] = None) -> List[Dict]:
@@ -626,48 +819,48 @@ async def scrape_linkedin_jobs(keywords: List[str], max_results: int = 50, locat
 async def scrape_indeed_jobs(keywords: List[str], max_results: int = 50, location: Optional[str] = None) -> List[Dict]:
     """Scraping de Indeed Jobs con filtro de ubicación opcional."""
     jobs = []
-    scraper = SimpleHTTPScraper()
     
-    for keyword in keywords[:3]:
-        try:
-            params = {
-                'q': keyword,
-                'l': location or 'remote',  # Usar location si se proporciona, sino 'remote'
-                'jt': 'fulltime',
-                'limit': 25
-            }
-            
-            url = "https://www.indeed.com/jobs"
-            html = scraper.fetch(url, params=params)
-            soup = scraper.parse_html(html)
-            
-            # Buscar cards de trabajo
-            job_cards = soup.select(".job_seen_beacon, .slider_container")
-            
-            for card in job_cards[:max_results // len(keywords)]:
-                try:
-                    title_elem = card.select_one("h2.jobTitle a, .jobTitle")
-                    company_elem = card.select_one(".companyName")
-                    location_elem = card.select_one(".companyLocation")
-                    
-                    if title_elem:
-                        job = {
-                            'title': scraper.extract_text(title_elem),
-                            'company': scraper.extract_text(company_elem),
-                            'location': scraper.extract_text(location_elem),
-                            'url': urljoin("https://www.indeed.com", title_elem.get('href', '')),
-                            'source': 'indeed',
-                            'keywords': [keyword]
-                        }
-                        if job['url']:
-                            jobs.append(job)
-                except Exception as e:
-                    logger.warning(f"Error procesando card de Indeed: {e}")
-                    continue
-                    
-        except Exception as e:
-            logger.error(f"Error scraping Indeed para keyword {keyword}: {e}")
-            continue
+    async with AsyncHTTPScraper() as scraper:
+        for keyword in keywords[:3]:
+            try:
+                params = {
+                    'q': keyword,
+                    'l': location or 'remote',  # Usar location si se proporciona, sino 'remote'
+                    'jt': 'fulltime',
+                    'limit': 25
+                }
+                
+                url = "https://www.indeed.com/jobs"
+                html = await scraper.fetch(url, params=params)
+                soup = scraper.parse_html(html)
+                
+                # Buscar cards de trabajo
+                job_cards = soup.select(".job_seen_beacon, .slider_container")
+                
+                for card in job_cards[:max_results // len(keywords)]:
+                    try:
+                        title_elem = card.select_one("h2.jobTitle a, .jobTitle")
+                        company_elem = card.select_one(".companyName")
+                        location_elem = card.select_one(".companyLocation")
+                        
+                        if title_elem:
+                            job = {
+                                'title': scraper.extract_text(title_elem),
+                                'company': scraper.extract_text(company_elem),
+                                'location': scraper.extract_text(location_elem),
+                                'url': urljoin("https://www.indeed.com", title_elem.get('href', '')),
+                                'source': 'indeed',
+                                'keywords': [keyword]
+                            }
+                            if job['url']:
+                                jobs.append(job)
+                    except Exception as e:
+                        logger.warning(f"Error procesando card de Indeed: {e}")
+                        continue
+                        
+            except Exception as e:
+                logger.error(f"Error scraping Indeed para keyword {keyword}: {e}")
+                continue
     
     return jobs
 
@@ -0,0 +1,172 @@
+"""Runtime compartido por los agentes: clientes LLM, scheduler, skills y configuración."""
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import httpx
+from openai import DefaultHttpxClient, DefaultAsyncHttpxClient
+from langchain_openai import ChatOpenAI
+from langchain_anthropic import ChatAnthropic
+from langchain_core.language_models import BaseChatModel
+
+from config.config_loader import load_job_sources_config
+from config.settings import LLM_MODEL
+from utils.skill_loader import SkillLoader
+from utils.llm_cache import get_llm_cache
+from utils.llm_scheduler import LLMScheduler
+
+logger = logging.getLogger(__name__)
+
+# Modelo Anthropic por defecto si LLM_MODEL no es un modelo Claude
+DEFAULT_ANTHROPIC_MODEL = "claude-3-5-sonnet-20241022"
+
+
+class AgentRuntime:
+    """
+    Recursos compartidos por todos los agentes de un proceso.
+
+    - Clientes LLM reutilizados por (proveedor, modelo, temperatura): los
+      agentes con la misma configuración comparten instancia y conexiones
+    - Un pool de conexiones HTTP (sync y async) para todos los clientes OpenAI
+    - Un LLMScheduler que despacha las llamadas de todos los agentes según
+      los límites RPM/TPM del proveedor
+    - Un SkillLoader, de modo que cada SKILL.md se parsea y compila una vez
+    - La configuración de job_sources.yaml cacheada por config_loader
+    """
+
+    def __init__(self, skill_loader: Optional[SkillLoader] = None):
+        """
+        Inicializa el runtime.
+
+        Args:
+            skill_loader: Cargador de skills (por defecto uno sobre skills/)
+        """
+        self.skill_loader = skill_loader or SkillLoader()
+        self.scheduler = LLMScheduler()
+        self._llms: Dict[Tuple[str, str, float], BaseChatModel] = {}
+        self._http_client: Optional[httpx.Client] = None
+        self._http_async_client: Optional[httpx.AsyncClient] = None
+
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuración de job_sources.yaml (parseada una vez por proceso)."""
+        return load_job_sources_config() or {}
+
+    def get_llm(self, provider: str, temperature: float = 0) -> BaseChatModel:
+        """
+        Retorna el cliente LLM compartido para el proveedor y la temperatura.
+
+        Args:
+            provider: "openai" o "anthropic"
+            temperature: Temperatura de muestreo
+
+        Returns:
+            Instancia de ChatOpenAI o ChatAnthropic (con el cache LLM del proceso)
+        """
+        if provider == "anthropic":
+            model = LLM_MODEL if "claude" in LLM_MODEL.lower() else DEFAULT_ANTHROPIC_MODEL
+        else:
+            model = LLM_MODEL
+        key = (provider, model, float(temperature))
+
+        if key not in self._llms:
+            if provider == "anthropic":
+                llm = ChatAnthropic(model=model, temperature=temperature, cache=get_llm_cache())
+            else:
+                llm = ChatOpenAI(
+                    model=model,
+                    temperature=temperature,
+                    cache=get_llm_cache(),
+                    http_client=self._get_http_client(),
+                    http_async_client=self._get_http_async_client()
+                )
+            self._llms[key] = llm
+            logger.debug(f"Cliente LLM creado: {provider}/{model} (temperatura {temperature})")
+        return self._llms[key]
+
+    def _get_http_client(self) -> httpx.Client:
+        """Pool de conexiones sync compartido por los clientes LLM."""
+        if self._http_client is None:
+            self._http_client = DefaultHttpxClient()
+        return self._http_client
+
+    def _get_http_async_client(self) -> httpx.AsyncClient:
+        """Pool de conexiones async compartido por los clientes LLM."""
+        if self._http_async_client is None:
+            self._http_async_client = DefaultAsyncHttpxClient()
+        return self._http_async_client
+
+    async def aclose(self) -> None:
+        """
+        Cierra el pool de conexiones async al final de la ejecución.
+
+        Debe llamarse dentro del event loop que usó el pool. Los clientes LLM
+        que lo referencian se descartan; los agentes los obtienen con SharedLLM,
+        así que su siguiente llamada usa un cliente nuevo con un pool nuevo.
+        """
+        if self._http_async_client is not None:
+            self._llms.clear()
+            await self._http_async_client.aclose()
+            self._http_async_client = None
+
+    def close(self) -> None:
+        """Descarta los clientes LLM y cierra el pool de conexiones sync."""
+        self._llms.clear()
+        if self._http_client is not None:
+            self._http_client.close()
+            self._http_client = None
+        # El cliente async se cierra con aclose() dentro de su event loop; aquí solo se descarta
+        self._http_async_client = None
+
+
+# Instancia única por proceso
+_runtime: Optional[AgentRuntime] = None
+
+
+def get_runtime() -> AgentRuntime:
+    """
+    Retorna el runtime compartido del proceso.
+
+    Returns:
+        AgentRuntime compartido
+    """
+    global _runtime
+    if _runtime is None:
+        _runtime = AgentRuntime()
+    return _runtime
+
+
+class SharedLLM:
+    """
+    Atributo `llm` de un agente que resuelve el cliente compartido del runtime en cada acceso.
+
+    El agente define `llm_provider` ("openai", "anthropic" o None) y `self.llm`
+    retorna get_runtime().get_llm(llm_provider, temperature). Así ningún agente
+    retiene un cliente cuyo pool cerró AgentRuntime.aclose: tras el cierre se
+    usa el cliente nuevo. Asignar `self.llm` (None o un mock en tests) fija ese
+    valor en lugar del cliente compartido.
+    """
+
+    def __init__(self, temperature: float = 0):
+        """
+        Args:
+            temperature: Temperatura de muestreo del cliente
+        """
+        self.temperature = temperature
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._override = f"_{name}_override"
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        if self._override in instance.__dict__:
+            return instance.__dict__[self._override]
+        provider = getattr(instance, 'llm_provider', None)
+        return get_runtime().get_llm(provider, self.temperature) if provider else None
+
+    def __set__(self, instance: Any, value: Any) -> None:
+        instance.__dict__[self._override] = value
@@ -0,0 +1,78 @@
+"""Selección de candidatos top-K para el análisis semántico (heap, cuotas y presupuesto de tokens)."""
+
+import heapq
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+
+def select_top_candidates(
+    jobs: List[Dict],
+    k: int,
+    min_score: float = 0,
+    score_key: str = 'match_score',
+    max_per_region: int = 0,
+    max_per_source: int = 0,
+    token_budget: int = 0,
+    estimate_tokens: Optional[Callable[[Dict], int]] = None
+) -> List[Dict]:
+    """
+    Elige los K trabajos de mayor score sin ordenar la lista completa.
+
+    Sin cuotas ni presupuesto es heapq.nlargest (O(n log k)). Con ellos se
+    construye un heap de todos los candidatos (O(n)) y se extraen en orden de
+    score hasta completar K: un trabajo se salta si su región o fuente ya
+    llenó su cuota, o si su costo estimado no cabe en el presupuesto restante
+    (uno más pequeño y con menor score aún puede caber).
+
+    Args:
+        jobs: Trabajos con score heurístico
+        k: Máximo de trabajos a elegir
+        min_score: Score mínimo para ser candidato
+        score_key: Campo del score
+        max_per_region: Máximo por search_region (0 = sin límite)
+        max_per_source: Máximo por source (0 = sin límite)
+        token_budget: Tokens totales disponibles (0 = sin límite)
+        estimate_tokens: Costo estimado en tokens de un trabajo (requerido con token_budget)
+
+    Returns:
+        Trabajos elegidos, de mayor a menor score (empates en el orden original)
+    """
+    if k <= 0:
+        return []
+
+    # (-score, posición) hace el heap estable: a igual score gana el primero
+    candidates = [
+        (-job.get(score_key, 0), position)
+        for position, job in enumerate(jobs)
+        if job.get(score_key, 0) >= min_score
+    ]
+    use_budget = token_budget > 0 and estimate_tokens is not None
+    if not (max_per_region or max_per_source or use_budget):
+        return [jobs[position] for _, position in heapq.nlargest(k, candidates, key=lambda c: (-c[0], -c[1]))]
+
+    heapq.heapify(candidates)
+    selected: List[Dict] = []
+    region_counts: Counter = Counter()
+    source_counts: Counter = Counter()
+    remaining_tokens = token_budget
+
+    while candidates and len(selected) < k and (not use_budget or remaining_tokens > 0):
+        _, position = heapq.heappop(candidates)
+        job = jobs[position]
+        region = job.get('search_region', 'unknown')
+        source = job.get('source', 'unknown')
+        if max_per_region and region_counts[region] >= max_per_region:
+            continue
+        if max_per_source and source_counts[source] >= max_per_source:
+            continue
+        if use_budget:
+            cost = estimate_tokens(job)
+            if cost > remaining_tokens:
+                continue
+            remaining_tokens -= cost
+
+        region_counts[region] += 1
+        source_counts[source] += 1
+        selected.append(job)
+
+    return selected
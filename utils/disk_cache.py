@@ -0,0 +1,158 @@
+"""Cache clave-valor persistente en disco (SQLite) con TTL, límite de tamaño y desalojo LRU."""
+
+import sqlite3
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+class DiskCache:
+    """
+    Almacén clave-valor en un archivo SQLite.
+
+    - Cada entrada expira tras su TTL (las expiradas se ignoran y se purgan)
+    - El tamaño total de los valores se limita a max_size_bytes
+    - Al superar el límite se desalojan las entradas menos usadas recientemente (LRU)
+    - Seguro para usar desde varios hilos del mismo proceso
+    """
+
+    def __init__(
+        self,
+        db_path: Union[str, Path],
+        max_size_bytes: int = 200 * 1024 * 1024,
+        default_ttl_seconds: Optional[float] = None
+    ):
+        """
+        Inicializa (o abre) el cache.
+
+        Args:
+            db_path: Ruta al archivo SQLite (se crea el directorio si no existe)
+            max_size_bytes: Tamaño máximo total de los valores almacenados
+            default_ttl_seconds: TTL por defecto; None = sin expiración
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_size_bytes = max_size_bytes
+        self.default_ttl_seconds = default_ttl_seconds
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                expires_at REAL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Obtiene un valor si existe y no ha expirado (actualiza su último acceso).
+
+        Args:
+            key: Clave de la entrada
+
+        Returns:
+            Valor almacenado o None
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+
+            self._conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+            return bytes(value)
+
+    def set(self, key: str, value: bytes, ttl_seconds: Optional[float] = None) -> None:
+        """
+        Guarda un valor, desalojando entradas antiguas si se supera el límite de tamaño.
+
+        Args:
+            key: Clave de la entrada
+            value: Contenido a guardar
+            ttl_seconds: TTL de la entrada (usa default_ttl_seconds si es None)
+        """
+        size = len(value)
+        if size > self.max_size_bytes:
+            logger.debug(f"Entrada de {size} bytes excede el tamaño máximo del cache, no se guarda")
+            return
+
+        now = time.time()
+        ttl = self.default_ttl_seconds if ttl_seconds is None else ttl_seconds
+        expires_at = now + ttl if ttl is not None else None
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, sqlite3.Binary(value), size, now, now, expires_at)
+            )
+            self._evict(now)
+            self._conn.commit()
+
+    def delete(self, key: str) -> None:
+        """Elimina una entrada si existe."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self) -> None:
+        """Elimina todas las entradas."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.commit()
+
+    def total_size(self) -> int:
+        """Retorna el tamaño total (bytes) de los valores almacenados."""
+        with self._lock:
+            return self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+    def _evict(self, now: float) -> None:
+        """Purga expiradas y desaloja por LRU hasta quedar bajo el límite (requiere el lock)."""
+        self._conn.execute("DELETE FROM entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_size_bytes:
+            return
+
+        evicted = 0
+        rows = self._conn.execute("SELECT key, size FROM entries ORDER BY accessed_at ASC").fetchall()
+        for key, size in rows:
+            if total <= self.max_size_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+
+        logger.debug(f"Cache {self.db_path.name}: {evicted} entradas desalojadas (LRU)")
+
+    def close(self) -> None:
+        """Cierra la conexión SQLite."""
+        with self._lock:
+            self._conn.close()
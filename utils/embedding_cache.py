@@ -0,0 +1,216 @@
+"""Cache persistente de embeddings: vectores float32 en un archivo memory-mapped con índice SQLite."""
+
+import hashlib
+import logging
+import re
+import sqlite3
+import threading
+from typing import Callable, Dict, List, Optional, Sequence
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from config.settings import CACHE_DIR, EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Límite de variables por consulta SQLite (IN (...))
+_SQL_CHUNK = 500
+
+
+class EmbeddingCache:
+    """
+    Vectores de embeddings de un modelo, guardados en disco.
+
+    - <modelo>.f32: matriz float32 (una fila por texto), de solo crecimiento y
+      leída con np.memmap, así que no se carga completa en memoria
+    - <modelo>.sqlite: índice clave -> fila, donde la clave es el sha256 del
+      modelo + el texto (el mismo texto con otro modelo es otra entrada)
+    """
+
+    def __init__(self, directory: Path, model: str):
+        """
+        Abre (o crea) el cache de un modelo.
+
+        Args:
+            directory: Directorio del cache
+            model: Nombre del modelo de embeddings
+        """
+        self.model = model
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        safe_name = re.sub(r'[^\w.-]', '_', model)
+        self.vectors_path = directory / f"{safe_name}.f32"
+        self.index_path = directory / f"{safe_name}.sqlite"
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        self._conn.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, row INTEGER NOT NULL)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._conn.commit()
+
+        row = self._conn.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        self.dim: Optional[int] = int(row[0]) if row else None
+        self._matrix: Optional[np.memmap] = None
+
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(self, text: str) -> str:
+        """Clave de un texto para este modelo (sha256 hexadecimal)."""
+        return hashlib.sha256(f"{self.model}\0{text}".encode('utf-8')).hexdigest()
+
+    def _stored_rows(self) -> int:
+        """Filas completas escritas en el archivo de vectores."""
+        if self.dim is None or not self.vectors_path.exists():
+            return 0
+        return self.vectors_path.stat().st_size // (self.dim * 4)
+
+    def _rows(self, rows: Sequence[int]) -> np.ndarray:
+        """Lee filas del archivo de vectores (reabre el memmap si el archivo creció)."""
+        needed = max(rows) + 1
+        if self._matrix is None or self._matrix.shape[0] < needed:
+            self._matrix = np.memmap(
+                self.vectors_path, dtype=np.float32, mode='r', shape=(self._stored_rows(), self.dim)
+            )
+        return np.array(self._matrix[list(rows)])
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """
+        Busca los vectores de varios textos.
+
+        Args:
+            texts: Textos a buscar
+
+        Returns:
+            Vector float32 por texto, o None si no está en cache
+        """
+        keys = [self.make_key(text) for text in texts]
+        with self._lock:
+            found: Dict[str, int] = {}
+            unique_keys = list(dict.fromkeys(keys))
+            for i in range(0, len(unique_keys), _SQL_CHUNK):
+                chunk = unique_keys[i:i + _SQL_CHUNK]
+                placeholders = ','.join('?' * len(chunk))
+                found.update(self._conn.execute(
+                    f"SELECT key, row FROM vectors WHERE key IN ({placeholders})", chunk
+                ).fetchall())
+
+            vectors_by_row = {}
+            if found:
+                rows = sorted(set(found.values()))
+                vectors_by_row = dict(zip(rows, self._rows(rows)))
+
+        result = []
+        for key in keys:
+            if key in found:
+                self.hits += 1
+                result.append(vectors_by_row[found[key]])
+            else:
+                self.misses += 1
+                result.append(None)
+        return result
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        """
+        Guarda los vectores de varios textos (los ya existentes se ignoran).
+
+        Args:
+            texts: Textos
+            vectors: Un vector por texto, todos de la misma dimensión
+        """
+        if not texts:
+            return
+        matrix = np.asarray(vectors, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[0] != len(texts):
+            raise ValueError("Se esperaba un vector por texto")
+
+        with self._lock:
+            if self.dim is None:
+                self.dim = int(matrix.shape[1])
+                self._conn.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('dim', ?)", (str(self.dim),))
+            elif matrix.shape[1] != self.dim:
+                raise ValueError(f"Dimensión {matrix.shape[1]} distinta a la del cache ({self.dim})")
+
+            # Descartar una fila incompleta (escritura interrumpida) antes de agregar
+            start = self._stored_rows()
+            row_bytes = self.dim * 4
+            with open(self.vectors_path, 'ab') as f:
+                if f.tell() != start * row_bytes:
+                    f.truncate(start * row_bytes)
+                    f.seek(start * row_bytes)
+                f.write(matrix.tobytes())
+
+            # El índice se confirma después de escribir los vectores
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO vectors (key, row) VALUES (?, ?)",
+                [(self.make_key(text), start + i) for i, text in enumerate(texts)]
+            )
+            self._conn.commit()
+
+    def embed(
+        self,
+        texts: Sequence[str],
+        embed_documents: Callable[[List[str]], List[List[float]]],
+        batch_size: int = EMBEDDING_BATCH_SIZE
+    ) -> np.ndarray:
+        """
+        Retorna los embeddings de los textos, calculando solo los que faltan.
+
+        Args:
+            texts: Textos a embeber
+            embed_documents: Función del proveedor (p.ej. OpenAIEmbeddings.embed_documents)
+            batch_size: Textos por llamada al proveedor
+
+        Returns:
+            Matriz float32 de forma (len(texts), dim)
+        """
+        vectors = self.get_many(texts)
+
+        # Textos faltantes, sin duplicados
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            logger.info(f"Calculando {len(missing)} embeddings ({len(texts) - len(missing)} en cache)")
+            computed: Dict[str, np.ndarray] = {}
+            for i in range(0, len(missing), max(1, batch_size)):
+                batch = missing[i:i + max(1, batch_size)]
+                batch_vectors = np.asarray(embed_documents(batch), dtype=np.float32)
+                self.put_many(batch, batch_vectors)
+                computed.update(zip(batch, batch_vectors))
+            vectors = [vector if vector is not None else computed[text] for text, vector in zip(texts, vectors)]
+
+        if not vectors:
+            return np.zeros((0, self.dim or 0), dtype=np.float32)
+        return np.vstack(vectors)
+
+    def count(self) -> int:
+        """Número de textos con vector en cache."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def close(self) -> None:
+        """Cierra el índice y libera el memmap."""
+        with self._lock:
+            self._matrix = None
+            self._conn.close()
+
+
+# Instancias por modelo (una por proceso)
+_embedding_caches: Dict[str, EmbeddingCache] = {}
+
+
+def get_embedding_cache(model: str = EMBEDDING_MODEL) -> EmbeddingCache:
+    """
+    Retorna el cache de embeddings del modelo, compartido en el proceso.
+
+    Args:
+        model: Modelo de embeddings
+
+    Returns:
+        EmbeddingCache en CACHE_DIR/embeddings
+    """
+    if model not in _embedding_caches:
+        _embedding_caches[model] = EmbeddingCache(CACHE_DIR / "embeddings", model)
+    return _embedding_caches[model]
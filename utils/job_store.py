@@ -0,0 +1,415 @@
+"""Almacén persistente (SQLite) del corpus de trabajos encontrados entre ejecuciones."""
+
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Union
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+logger = logging.getLogger(__name__)
+
+# Parámetros de query que solo sirven para tracking y no identifican la oferta
+TRACKING_PARAMS = {
+    'refid', 'trackingid', 'trk', 'position', 'pagenum', 'ref', 'source', 'src',
+    'from', 'fbclid', 'gclid', 'mc_cid', 'mc_eid'
+}
+
+# Campos que definen el contenido de una oferta (cambios => re-procesar)
+CONTENT_FIELDS = ('title', 'company', 'location', 'description')
+
+
+def canonical_url(url: str) -> str:
+    """
+    Normaliza una URL de oferta para identificarla entre ejecuciones y fuentes.
+
+    Minúsculas en esquema/host, sin 'www.', sin fragmento, sin barra final
+    y sin parámetros de tracking (utm_*, refId, trackingId, ...).
+
+    Args:
+        url: URL original
+
+    Returns:
+        URL canónica, o "" si no hay URL
+    """
+    if not url:
+        return ""
+    try:
+        parsed = urlparse(url.strip())
+    except ValueError:
+        return url.strip()
+
+    netloc = parsed.netloc.lower()
+    if netloc.startswith('www.'):
+        netloc = netloc[4:]
+    path = parsed.path.rstrip('/') or '/'
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True)
+        if not k.lower().startswith('utm_') and k.lower() not in TRACKING_PARAMS
+    ))
+    scheme = (parsed.scheme or 'https').lower()
+    if scheme == 'http':
+        scheme = 'https'
+    return urlunparse((scheme, netloc, path, '', query, ''))
+
+
+def _normalize_text(value: Optional[str]) -> str:
+    """Minúsculas y espacios colapsados."""
+    return re.sub(r'\s+', ' ', (value or '').strip().lower())
+
+
+def canonical_job_key(job: Dict) -> str:
+    """
+    Calcula la clave canónica de un trabajo.
+
+    Usa la URL canónica si existe; si no, título + empresa normalizados.
+
+    Args:
+        job: Diccionario del trabajo
+
+    Returns:
+        Hash sha256 hexadecimal estable entre ejecuciones
+    """
+    url = canonical_url(job.get('url', ''))
+    if url:
+        identity = f"url:{url}"
+    else:
+        identity = f"tc:{_normalize_text(job.get('title'))}|{_normalize_text(job.get('company'))}"
+    return hashlib.sha256(identity.encode('utf-8')).hexdigest()
+
+
+def job_content_hash(job: Dict) -> str:
+    """
+    Hash del contenido relevante de un trabajo (título, empresa, ubicación, descripción).
+
+    Args:
+        job: Diccionario del trabajo
+
+    Returns:
+        Hash sha256 hexadecimal
+    """
+    payload = '\x1f'.join(_normalize_text(job.get(field)) for field in CONTENT_FIELDS)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class JobStore:
+    """
+    Corpus persistente de trabajos en SQLite.
+
+    - Una fila por clave canónica (upsert: conserva first_seen, actualiza last_seen)
+    - Índices en url, source, company, first_seen y last_seen
+    - 'data' guarda el trabajo tal como se encontró; 'enrichment' los resultados
+      de etapas posteriores (emails, scores, análisis semántico)
+    """
+
+    def __init__(self, db_path: Union[str, Path]):
+        """
+        Inicializa (o abre) el almacén.
+
+        Args:
+            db_path: Ruta al archivo SQLite (se crea el directorio si no existe)
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS jobs (
+                job_key TEXT PRIMARY KEY,
+                url TEXT,
+                source TEXT,
+                company TEXT,
+                title TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL,
+                seen_count INTEGER NOT NULL DEFAULT 1,
+                content_hash TEXT NOT NULL,
+                data TEXT NOT NULL,
+                enrichment TEXT NOT NULL DEFAULT '{}'
+            );
+            CREATE INDEX IF NOT EXISTS idx_jobs_url ON jobs(url);
+            CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+            CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+            CREATE INDEX IF NOT EXISTS idx_jobs_first_seen ON jobs(first_seen);
+            CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+            """
+        )
+        self._conn.commit()
+
+    def upsert_jobs(self, jobs: Iterable[Dict], seen_at: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Inserta o actualiza trabajos.
+
+        Agrega a cada diccionario 'job_key', 'first_seen', 'last_seen' y
+        'corpus_status' ('new', 'changed' o 'unchanged' respecto de lo guardado
+        antes del lote) para que las etapas siguientes puedan referirse al
+        registro persistente. Si el contenido cambió, se descarta el
+        enriquecimiento guardado.
+
+        Args:
+            jobs: Trabajos encontrados en esta ejecución
+            seen_at: Momento de la observación (por defecto, ahora)
+
+        Returns:
+            Conteo {'new', 'changed', 'unchanged'} por clave canónica
+        """
+        seen = (seen_at or datetime.now()).isoformat(timespec='seconds')
+        stats = {'new': 0, 'changed': 0, 'unchanged': 0}
+
+        # Agrupar por clave: las copias repetidas en el lote (p.ej. el mismo feed
+        # en ambas regiones) comparten estado y cuentan como una observación
+        batch: Dict[str, List[Dict]] = {}
+        for job in jobs:
+            batch.setdefault(canonical_job_key(job), []).append(job)
+
+        with self._lock:
+            # Estado previo al lote de todas las claves
+            previous = {}
+            keys = list(batch)
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                for row in self._conn.execute(
+                    f"SELECT job_key, first_seen, content_hash FROM jobs WHERE job_key IN ({placeholders})", chunk
+                ):
+                    previous[row['job_key']] = row
+
+            for job_key, copies in batch.items():
+                job = copies[-1]
+                content_hash = job_content_hash(job)
+                row = previous.get(job_key)
+
+                if row is None:
+                    status = 'new'
+                    first_seen = seen
+                elif row['content_hash'] != content_hash:
+                    status = 'changed'
+                    first_seen = row['first_seen']
+                else:
+                    status = 'unchanged'
+                    first_seen = row['first_seen']
+                stats[status] += 1
+
+                for copy in copies:
+                    copy['job_key'] = job_key
+                    copy['corpus_status'] = status
+                    copy['first_seen'] = first_seen
+                    copy['last_seen'] = seen
+
+                # Si cambió el contenido, el enriquecimiento guardado ya no aplica
+                self._conn.execute(
+                    """
+                    INSERT INTO jobs (job_key, url, source, company, title, first_seen, last_seen,
+                                      seen_count, content_hash, data)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, 1, ?, ?)
+                    ON CONFLICT(job_key) DO UPDATE SET
+                        url = excluded.url,
+                        source = excluded.source,
+                        company = excluded.company,
+                        title = excluded.title,
+                        last_seen = excluded.last_seen,
+                        seen_count = jobs.seen_count + 1,
+                        enrichment = CASE WHEN jobs.content_hash = excluded.content_hash
+                                          THEN jobs.enrichment ELSE '{}' END,
+                        content_hash = excluded.content_hash,
+                        data = excluded.data
+                    """,
+                    (
+                        job_key,
+                        canonical_url(job.get('url', '')),
+                        job.get('source', ''),
+                        job.get('company', ''),
+                        job.get('title', ''),
+                        first_seen,
+                        seen,
+                        content_hash,
+                        json.dumps(job, ensure_ascii=False, default=str),
+                    )
+                )
+            self._conn.commit()
+
+        return stats
+
+    def update_enrichment(self, job_key: str, enrichment: Dict) -> None:
+        """
+        Combina resultados de una etapa con el enriquecimiento guardado.
+
+        Args:
+            job_key: Clave canónica del trabajo
+            enrichment: Campos a guardar (p.ej. {'emails': [...]})
+        """
+        self.update_enrichments({job_key: enrichment})
+
+    def update_enrichments(self, enrichments: Dict[str, Dict]) -> None:
+        """
+        Versión por lotes de update_enrichment (una sola transacción).
+
+        Args:
+            enrichments: Dict job_key -> campos a combinar
+        """
+        with self._lock:
+            for job_key, enrichment in enrichments.items():
+                row = self._conn.execute(
+                    "SELECT enrichment FROM jobs WHERE job_key = ?", (job_key,)
+                ).fetchone()
+                if row is None:
+                    continue
+                merged = json.loads(row['enrichment'] or '{}')
+                merged.update(enrichment)
+                self._conn.execute(
+                    "UPDATE jobs SET enrichment = ? WHERE job_key = ?",
+                    (json.dumps(merged, ensure_ascii=False, default=str), job_key)
+                )
+            self._conn.commit()
+
+    def get(self, job_key: str) -> Optional[Dict]:
+        """
+        Obtiene un trabajo con su enriquecimiento.
+
+        Args:
+            job_key: Clave canónica
+
+        Returns:
+            Diccionario del trabajo o None si no existe
+        """
+        jobs = self.get_many([job_key])
+        return jobs.get(job_key)
+
+    def get_many(self, job_keys: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Obtiene varios trabajos por clave.
+
+        Args:
+            job_keys: Claves canónicas
+
+        Returns:
+            Dict job_key -> trabajo (solo las claves existentes)
+        """
+        keys = list(dict.fromkeys(job_keys))
+        result = {}
+        with self._lock:
+            # Consultar en bloques para no superar el límite de parámetros de SQLite
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                placeholders = ','.join('?' * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT * FROM jobs WHERE job_key IN ({placeholders})", chunk
+                ).fetchall()
+                for row in rows:
+                    result[row['job_key']] = self._row_to_job(row)
+        return result
+
+    def query(
+        self,
+        source: Optional[str] = None,
+        company: Optional[str] = None,
+        seen_since: Optional[datetime] = None,
+        first_seen_since: Optional[datetime] = None,
+        limit: Optional[int] = None
+    ) -> List[Dict]:
+        """
+        Consulta el corpus histórico usando los índices.
+
+        Args:
+            source: Filtrar por fuente
+            company: Filtrar por empresa (exacta)
+            seen_since: Solo trabajos vistos desde esta fecha
+            first_seen_since: Solo trabajos descubiertos desde esta fecha
+            limit: Máximo de resultados
+
+        Returns:
+            Trabajos ordenados por last_seen descendente
+        """
+        clauses, params = [], []
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if company:
+            clauses.append("company = ?")
+            params.append(company)
+        if seen_since:
+            clauses.append("last_seen >= ?")
+            params.append(seen_since.isoformat(timespec='seconds'))
+        if first_seen_since:
+            clauses.append("first_seen >= ?")
+            params.append(first_seen_since.isoformat(timespec='seconds'))
+
+        sql = "SELECT * FROM jobs"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY last_seen DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [self._row_to_job(row) for row in rows]
+
+    def count(self, first_seen_since: Optional[datetime] = None) -> int:
+        """
+        Cuenta trabajos en el corpus.
+
+        Args:
+            first_seen_since: Contar solo los descubiertos desde esta fecha
+
+        Returns:
+            Número de trabajos
+        """
+        with self._lock:
+            if first_seen_since:
+                return self._conn.execute(
+                    "SELECT COUNT(*) FROM jobs WHERE first_seen >= ?",
+                    (first_seen_since.isoformat(timespec='seconds'),)
+                ).fetchone()[0]
+            return self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def _row_to_job(self, row: sqlite3.Row) -> Dict:
+        """Reconstruye el trabajo: datos originales + enriquecimiento + metadata del corpus."""
+        job = json.loads(row['data'])
+        job.pop('corpus_status', None)  # relativo a la ejecución que lo guardó
+        job.update(json.loads(row['enrichment'] or '{}'))
+        job['job_key'] = row['job_key']
+        job['first_seen'] = row['first_seen']
+        job['last_seen'] = row['last_seen']
+        job['seen_count'] = row['seen_count']
+        job['content_hash'] = row['content_hash']
+        return job
+
+    def close(self) -> None:
+        """Cierra la conexión SQLite."""
+        with self._lock:
+            self._conn.close()
+
+
+# Instancia única por proceso
+_job_store: Optional[JobStore] = None
+
+
+def get_job_store() -> Optional[JobStore]:
+    """
+    Retorna el almacén de trabajos del proceso, o None si USE_JOB_STORE está deshabilitado.
+
+    Returns:
+        JobStore compartido o None
+    """
+    global _job_store
+    from config.settings import USE_JOB_STORE, JOB_STORE_PATH
+
+    if not USE_JOB_STORE:
+        return None
+    if _job_store is None:
+        try:
+            _job_store = JobStore(JOB_STORE_PATH)
+        except Exception as e:
+            logger.warning(f"No se pudo abrir el almacén de trabajos: {e}")
+            return None
+    return _job_store
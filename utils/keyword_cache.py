@@ -0,0 +1,160 @@
+"""Cache persistente de keywords adaptativos (por perfil, fuente y región) y variaciones de queries."""
+
+import hashlib
+import json
+import logging
+from typing import List, Optional, Sequence
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import USE_KEYWORD_CACHE, KEYWORD_CACHE_TTL_HOURS, CACHE_MAX_SIZE_MB, CACHE_DIR
+from utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class KeywordCache:
+    """
+    Cache de keywords generados por LLM sobre DiskCache.
+
+    - Keywords adaptativos: la clave es el sha256 del hash de contenido del
+      perfil + keywords base normalizados + fuente + región + número de
+      keywords + versión de los skills (make_key)
+    - Variaciones de queries: la clave es el sha256 del keyword normalizado +
+      número de variaciones + versión de los skills (make_variation_key)
+
+    Una ejecución repetida con la misma configuración no llama al LLM, y
+    cualquier cambio en ella genera resultados nuevos.
+    """
+
+    def __init__(self, disk_cache: Optional[DiskCache] = None):
+        """
+        Inicializa el cache de keywords.
+
+        Args:
+            disk_cache: Almacén subyacente (por defecto CACHE_DIR/keywords.sqlite
+                        con TTL KEYWORD_CACHE_TTL_HOURS y límite CACHE_MAX_SIZE_MB)
+        """
+        self.store = disk_cache if disk_cache is not None else DiskCache(
+            CACHE_DIR / "keywords.sqlite",
+            max_size_bytes=CACHE_MAX_SIZE_MB * 1024 * 1024,
+            default_ttl_seconds=KEYWORD_CACHE_TTL_HOURS * 3600
+        )
+
+    @staticmethod
+    def make_key(
+        profile_hash: str,
+        source: str,
+        region: str,
+        base_keywords: Optional[Sequence[str]],
+        num_keywords: int,
+        skill_version: str
+    ) -> str:
+        """
+        Calcula la clave de una combinación.
+
+        Args:
+            profile_hash: Hash de contenido del perfil (ProfileIndex.content_hash)
+            source: Fuente de búsqueda
+            region: Región objetivo
+            base_keywords: Keywords base (se ignoran mayúsculas, espacios y orden)
+            num_keywords: Número de keywords pedidos
+            skill_version: Versión de los skills que generan los keywords
+
+        Returns:
+            Hash sha256 hexadecimal
+        """
+        normalized_base = sorted({' '.join(str(kw).lower().split()) for kw in base_keywords or []})
+        payload = json.dumps(
+            [profile_hash, source.lower(), region.lower(), normalized_base, num_keywords, skill_version],
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_variation_key(keyword: str, num_variations: int, skill_version: str) -> str:
+        """
+        Calcula la clave de las variaciones de un keyword.
+
+        Args:
+            keyword: Keyword original (se ignoran mayúsculas y espacios extra)
+            num_variations: Número de variaciones pedidas
+            skill_version: Versión de los skills que generan las variaciones
+
+        Returns:
+            Hash sha256 hexadecimal
+        """
+        payload = json.dumps(
+            ['variations', ' '.join(keyword.lower().split()), num_variations, skill_version],
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[List[str]]:
+        """
+        Retorna los keywords cacheados, o None si no existen o expiraron.
+
+        Args:
+            key: Clave calculada con make_key o make_variation_key
+        """
+        try:
+            raw = self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Error leyendo cache de keywords: {e}")
+            return None
+        if raw is None:
+            return None
+
+        try:
+            keywords = json.loads(raw.decode('utf-8'))
+        except ValueError as e:
+            logger.warning(f"Entrada de cache de keywords corrupta: {e}")
+            self.store.delete(key)
+            return None
+        if not isinstance(keywords, list) or not all(isinstance(kw, str) for kw in keywords):
+            self.store.delete(key)
+            return None
+        return keywords
+
+    def set(self, key: str, keywords: List[str]) -> None:
+        """
+        Guarda los keywords de una combinación.
+
+        Args:
+            key: Clave calculada con make_key o make_variation_key
+            keywords: Keywords generados
+        """
+        try:
+            self.store.set(key, json.dumps(keywords, ensure_ascii=False).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Error escribiendo cache de keywords: {e}")
+
+    def clear(self) -> None:
+        """Elimina todos los keywords cacheados."""
+        self.store.clear()
+
+
+# Instancia única por proceso
+_keyword_cache: Optional[KeywordCache] = None
+
+
+def get_keyword_cache() -> Optional[KeywordCache]:
+    """
+    Retorna el cache de keywords del proceso, o None si USE_KEYWORD_CACHE está deshabilitado.
+
+    Returns:
+        KeywordCache compartido o None
+    """
+    global _keyword_cache
+    if not USE_KEYWORD_CACHE:
+        return None
+    if _keyword_cache is None:
+        try:
+            _keyword_cache = KeywordCache()
+        except Exception as e:
+            logger.warning(f"No se pudo inicializar el cache de keywords: {e}")
+            return None
+    return _keyword_cache
@@ -0,0 +1,129 @@
+"""Cache persistente de respuestas LLM compartido por todos los agentes."""
+
+import hashlib
+import json
+import logging
+from typing import Any, Optional, Sequence
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.caches import BaseCache
+from langchain_core.load import dumps, loads
+from langchain_core.outputs import Generation
+
+from config.settings import USE_LLM_CACHE, LLM_CACHE_TTL_HOURS, CACHE_MAX_SIZE_MB, CACHE_DIR
+from utils.disk_cache import DiskCache
+
+logger = logging.getLogger(__name__)
+
+
+class DiskLLMCache(BaseCache):
+    """
+    Cache LangChain de completions sobre DiskCache.
+
+    La clave es el sha256 de la configuración del modelo (proveedor, modelo,
+    temperatura y demás parámetros de invocación) + los mensajes del prompt
+    renderizado, por lo que el mismo prompt en otra ejecución no vuelve a llamar
+    a la API.
+    """
+
+    def __init__(self, disk_cache: Optional[DiskCache] = None):
+        """
+        Inicializa el cache.
+
+        Args:
+            disk_cache: Almacén subyacente (por defecto CACHE_DIR/llm_responses.sqlite
+                        con TTL LLM_CACHE_TTL_HOURS y límite CACHE_MAX_SIZE_MB)
+        """
+        self.store = disk_cache if disk_cache is not None else DiskCache(
+            CACHE_DIR / "llm_responses.sqlite",
+            max_size_bytes=CACHE_MAX_SIZE_MB * 1024 * 1024,
+            default_ttl_seconds=LLM_CACHE_TTL_HOURS * 3600
+        )
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """
+        Calcula la clave de una completion.
+
+        Args:
+            prompt: Mensajes del prompt serializados por LangChain
+            llm_string: Configuración serializada del modelo
+
+        Returns:
+            Hash sha256 hexadecimal
+        """
+        payload = json.dumps([llm_string, prompt], ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        """Retorna las generaciones cacheadas, o None si no existen o expiraron."""
+        key = self.make_key(prompt, llm_string)
+        try:
+            raw = self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Error leyendo cache LLM: {e}")
+            return None
+        if raw is None:
+            self.misses += 1
+            return None
+
+        try:
+            generations = [loads(item) for item in json.loads(raw.decode('utf-8'))]
+        except Exception as e:
+            logger.warning(f"Entrada de cache LLM corrupta: {e}")
+            self.store.delete(key)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        logger.debug("Cache LLM hit")
+        return generations
+
+    def contains(self, prompt: str, llm_string: str) -> bool:
+        """Indica si hay una completion vigente para la clave (sin contar hit ni miss)."""
+        try:
+            return self.store.get(self.make_key(prompt, llm_string)) is not None
+        except Exception as e:
+            logger.warning(f"Error leyendo cache LLM: {e}")
+            return False
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        """Guarda las generaciones de una completion."""
+        try:
+            payload = json.dumps([dumps(generation) for generation in return_val])
+            self.store.set(self.make_key(prompt, llm_string), payload.encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Error escribiendo cache LLM: {e}")
+
+    def clear(self, **kwargs: Any) -> None:
+        """Elimina todas las completions cacheadas."""
+        self.store.clear()
+
+
+# Instancia única por proceso
+_llm_cache: Optional[DiskLLMCache] = None
+
+
+def get_llm_cache() -> Optional[DiskLLMCache]:
+    """
+    Retorna el cache LLM del proceso, o None si USE_LLM_CACHE está deshabilitado.
+
+    Pasar None como `cache=` a un modelo de LangChain equivale a no usar cache.
+
+    Returns:
+        DiskLLMCache compartido o None
+    """
+    global _llm_cache
+    if not USE_LLM_CACHE:
+        return None
+    if _llm_cache is None:
+        try:
+            _llm_cache = DiskLLMCache()
+        except Exception as e:
+            logger.warning(f"No se pudo inicializar el cache LLM: {e}")
+            return None
+    return _llm_cache
@@ -0,0 +1,22 @@
+"""Utilidades para leer respuestas JSON de los LLM."""
+
+
+def extract_json_content(content: str) -> str:
+    """Extrae el JSON del contenido de una respuesta LLM (puede venir con markdown).
+    
+    Args:
+        content: Texto de la respuesta
+    
+    Returns:
+        El bloque ```json``` (o ```) si existe; si no, el texto sin espacios extremos
+    
+    Examples:
+        >>> extract_json_content('```json\\n[1, 2]\\n```')
+        '[1, 2]'
+    """
+    content = content.strip()
+    if "```json" in content:
+        content = content.split("```json")[1].split("```")[0].strip()
+    elif "```" in content:
+        content = content.split("```")[1].split("```")[0].strip()
+    return content
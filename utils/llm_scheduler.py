@@ -0,0 +1,341 @@
+"""
+Scheduler global de llamadas LLM con límites RPM/TPM por proveedor y modelo.
+
+Solo cubre los chat models. Los embeddings (EmbeddingCache.embed desde
+MatcherAgent.apply_embedding_scores) no pasan por aquí: son llamadas síncronas
+por lotes, cacheadas en disco, y el proveedor les aplica límites propios.
+Las respuestas ya guardadas en el cache LLM (DiskLLMCache) tampoco consumen
+cupo: se sirven sin esperar a la cola.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_core.load import dumps
+
+from config.settings import LLM_RPM_LIMIT, LLM_TPM_LIMIT, LLM_MAX_CONCURRENCY, LLM_RATE_LIMIT_RETRIES
+from utils.llm_cache import DiskLLMCache
+
+logger = logging.getLogger(__name__)
+
+# Prioridades (menor = se despacha antes)
+PRIORITY_HIGH = 0    # Análisis semántico de los mejores candidatos
+PRIORITY_NORMAL = 1  # Keywords adaptativos y variaciones de queries
+PRIORITY_LOW = 2     # Extracción de emails
+
+# Estimación de tokens sin tokenizer (~4 caracteres por token)
+CHARS_PER_TOKEN = 4
+DEFAULT_OUTPUT_TOKENS = 256
+
+# Backoff exponencial ante 429 (si la respuesta no trae Retry-After)
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+
+def estimate_prompt_tokens(prompt: Any) -> int:
+    """
+    Estima los tokens de un prompt antes de enviarlo.
+
+    Args:
+        prompt: Texto o lista de mensajes LangChain
+
+    Returns:
+        Tokens estimados del prompt
+    """
+    if isinstance(prompt, str):
+        chars = len(prompt)
+    else:
+        chars = sum(len(str(getattr(message, 'content', message))) for message in prompt)
+    return chars // CHARS_PER_TOKEN + 1
+
+
+def is_rate_limit_error(error: Exception) -> bool:
+    """Indica si la excepción del proveedor es un 429 (rate limit)."""
+    status = getattr(error, 'status_code', None)
+    if status is None:
+        status = getattr(getattr(error, 'response', None), 'status_code', None)
+    return status == 429 or type(error).__name__ == 'RateLimitError'
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """Segundos de espera indicados por el header Retry-After del 429, si existe."""
+    headers = getattr(getattr(error, 'response', None), 'headers', None)
+    if not headers:
+        return None
+    try:
+        return max(0.0, float(headers.get('retry-after')))
+    except (TypeError, ValueError):
+        return None
+
+
+def is_cached(llm: Any, prompt: Any) -> bool:
+    """
+    Indica si la respuesta del prompt ya está en el DiskLLMCache del modelo.
+
+    Calcula la clave igual que BaseChatModel al consultar su cache (mensajes
+    serializados sin id + configuración del modelo).
+
+    Args:
+        llm: Cliente LangChain
+        prompt: Prompt a enviar (texto o mensajes)
+
+    Returns:
+        True si llm.ainvoke(prompt) se servirá del cache sin llamar a la API
+    """
+    cache = getattr(llm, 'cache', None)
+    if not isinstance(cache, DiskLLMCache):
+        return False
+    try:
+        messages = [
+            message.model_copy(update={'id': None}) if getattr(message, 'id', None) is not None else message
+            for message in llm._convert_input(prompt).to_messages()
+        ]
+        return cache.contains(dumps(messages), llm._get_llm_string())
+    except Exception as e:
+        logger.debug(f"No se pudo consultar el cache LLM antes de encolar: {e}")
+        return False
+
+
+class TokenBucket:
+    """
+    Token bucket con relleno continuo: `per_minute` unidades por minuto, hasta
+    `per_minute` acumuladas. El nivel puede quedar negativo (deuda) cuando un
+    request consume más de lo estimado.
+    """
+
+    def __init__(self, per_minute: int, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa el bucket lleno.
+
+        Args:
+            per_minute: Capacidad y ritmo de relleno por minuto (0 = sin límite)
+            clock: Reloj monotónico en segundos
+        """
+        self.capacity = float(max(0, per_minute))
+        self.rate = self.capacity / 60.0
+        self.level = self.capacity
+        self._clock = clock
+        self._updated = clock()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def time_until(self, amount: float) -> float:
+        """Segundos hasta poder consumir `amount` (se limita a la capacidad)."""
+        if self.unlimited:
+            return 0.0
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return max(0.0, missing / self.rate)
+
+    def consume(self, amount: float) -> None:
+        """Descuenta `amount` del bucket."""
+        if self.unlimited:
+            return
+        self._refill()
+        self.level -= amount
+
+    def refund(self, amount: float) -> None:
+        """Devuelve `amount` al bucket (sin superar la capacidad)."""
+        if self.unlimited:
+            return
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class _ModelState:
+    """Cola y límites de un par proveedor/modelo dentro de un event loop."""
+
+    def __init__(self, rpm_limit: int, tpm_limit: int, clock: Callable[[], float]):
+        self.loop = asyncio.get_running_loop()
+        self.condition = asyncio.Condition()
+        self.waiters: List[Tuple[int, int]] = []
+        self.active = 0
+        self.blocked_until = 0.0
+        self.requests = TokenBucket(rpm_limit, clock)
+        self.tokens = TokenBucket(tpm_limit, clock)
+
+
+class LLMScheduler:
+    """
+    Despacha las llamadas LLM de todos los agentes respetando los límites del proveedor.
+
+    - Token buckets de requests (RPM) y tokens (TPM) por proveedor y modelo;
+      los tokens se estiman del prompt antes de enviar y se corrigen con el uso
+      real que reporta la respuesta
+    - Cola con prioridad: con capacidad limitada, se despacha primero la menor
+      prioridad y, a igual prioridad, en orden de llegada
+    - Un 429 pausa toda la cola del modelo (Retry-After o backoff exponencial
+      con jitter) y el request se reintenta en su misma posición
+    """
+
+    def __init__(
+        self,
+        rpm_limit: int = LLM_RPM_LIMIT,
+        tpm_limit: int = LLM_TPM_LIMIT,
+        max_concurrency: int = LLM_MAX_CONCURRENCY,
+        max_retries: int = LLM_RATE_LIMIT_RETRIES,
+        backoff_base_seconds: float = BACKOFF_BASE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Inicializa el scheduler.
+
+        Args:
+            rpm_limit: Requests por minuto por proveedor/modelo (0 = sin límite)
+            tpm_limit: Tokens por minuto por proveedor/modelo (0 = sin límite)
+            max_concurrency: Llamadas simultáneas por proveedor/modelo
+            max_retries: Reintentos ante 429 antes de propagar el error
+            backoff_base_seconds: Espera del primer reintento (se duplica en cada uno)
+            clock: Reloj monotónico en segundos
+        """
+        self.rpm_limit = rpm_limit
+        self.tpm_limit = tpm_limit
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max(0, max_retries)
+        self.backoff_base_seconds = backoff_base_seconds
+        self._clock = clock
+        self._states: Dict[Tuple[str, str], _ModelState] = {}
+        self._sequence = itertools.count()
+        self.rate_limited = 0
+
+    @staticmethod
+    def _model_key(llm: Any) -> Tuple[str, str]:
+        """Par (proveedor, modelo) que comparte límites."""
+        model = getattr(llm, 'model_name', None) or getattr(llm, 'model', '')
+        return type(llm).__name__, str(model)
+
+    def _get_state(self, llm: Any) -> _ModelState:
+        """Estado del modelo para el event loop actual (las primitivas asyncio no se comparten entre loops)."""
+        key = self._model_key(llm)
+        state = self._states.get(key)
+        if state is None or state.loop is not asyncio.get_running_loop():
+            state = _ModelState(self.rpm_limit, self.tpm_limit, self._clock)
+            self._states[key] = state
+        return state
+
+    async def _acquire(self, state: _ModelState, entry: Tuple[int, int], tokens: int) -> None:
+        """Espera turno (prioridad, capacidad de los buckets y concurrencia) y reserva el cupo."""
+        async with state.condition:
+            heapq.heappush(state.waiters, entry)
+            try:
+                while True:
+                    timeout = None
+                    if state.waiters[0] == entry and state.active < self.max_concurrency:
+                        timeout = max(
+                            state.blocked_until - self._clock(),
+                            state.requests.time_until(1),
+                            state.tokens.time_until(tokens)
+                        )
+                        if timeout <= 0:
+                            heapq.heappop(state.waiters)
+                            state.requests.consume(1)
+                            state.tokens.consume(tokens)
+                            state.active += 1
+                            state.condition.notify_all()
+                            return
+                    try:
+                        await asyncio.wait_for(state.condition.wait(), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        pass
+            except BaseException:
+                # Cancelado mientras esperaba: liberar su lugar en la cola
+                if entry in state.waiters:
+                    state.waiters.remove(entry)
+                    heapq.heapify(state.waiters)
+                    state.condition.notify_all()
+                raise
+
+    async def _release(self, state: _ModelState) -> None:
+        """Libera el cupo de concurrencia y despierta a la cola."""
+        async with state.condition:
+            state.active -= 1
+            state.condition.notify_all()
+
+    def _backoff_delay(self, error: Exception, attempt: int) -> float:
+        """Espera antes de reintentar un 429."""
+        retry_after = _retry_after_seconds(error)
+        if retry_after is not None:
+            return retry_after
+        delay = min(BACKOFF_MAX_SECONDS, self.backoff_base_seconds * (2 ** attempt))
+        return delay * random.uniform(0.5, 1.0)
+
+    async def ainvoke(
+        self,
+        llm: Any,
+        prompt: Any,
+        priority: int = PRIORITY_NORMAL,
+        expected_output_tokens: int = DEFAULT_OUTPUT_TOKENS
+    ) -> Any:
+        """
+        Llama a `llm.ainvoke(prompt)` cuando los límites del modelo lo permiten
+        (de inmediato si la respuesta ya está en el cache LLM).
+
+        Args:
+            llm: Cliente LangChain (ChatOpenAI, ChatAnthropic, ...)
+            prompt: Prompt a enviar (texto o mensajes)
+            priority: PRIORITY_HIGH, PRIORITY_NORMAL o PRIORITY_LOW
+            expected_output_tokens: Tokens de respuesta esperados (para el presupuesto TPM)
+
+        Returns:
+            Respuesta del LLM
+
+        Raises:
+            Exception: El error del proveedor si no es un 429 o se agotan los reintentos
+        """
+        if is_cached(llm, prompt):
+            # Respuesta cacheada: no hay request al proveedor, no consume RPM/TPM ni espera turno
+            return await llm.ainvoke(prompt)
+
+        state = self._get_state(llm)
+        estimated = estimate_prompt_tokens(prompt) + expected_output_tokens
+        entry = (priority, next(self._sequence))
+        attempt = 0
+
+        while True:
+            await self._acquire(state, entry, estimated)
+            try:
+                response = await llm.ainvoke(prompt)
+            except Exception as e:
+                if not is_rate_limit_error(e) or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(e, attempt)
+                attempt += 1
+                self.rate_limited += 1
+                # Pausar la cola completa del modelo, no solo este request
+                state.blocked_until = max(state.blocked_until, self._clock() + delay)
+                logger.warning(
+                    f"Rate limit del proveedor (429), reintento {attempt}/{self.max_retries} en {delay:.1f}s"
+                )
+                continue
+            finally:
+                await self._release(state)
+
+            self._record_usage(state, response, estimated)
+            return response
+
+    @staticmethod
+    def _record_usage(state: _ModelState, response: Any, estimated: int) -> None:
+        """Corrige el bucket de tokens con el uso real reportado por la respuesta."""
+        usage = getattr(response, 'usage_metadata', None)
+        if not isinstance(usage, dict) or not isinstance(usage.get('total_tokens'), int):
+            return
+        difference = estimated - usage['total_tokens']
+        if difference > 0:
+            state.tokens.refund(difference)
+        else:
+            state.tokens.consume(-difference)
@@ -0,0 +1,141 @@
+"""Relevancia local perfil-trabajo: TF-IDF sobre n-gramas con hashing y similitud coseno (sin red)."""
+
+import math
+import re
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Dimensión del espacio de hashing (las colisiones son raras con vocabularios de ofertas)
+N_FEATURES = 2 ** 18
+
+# Palabras vacías en inglés y español que no aportan a la relevancia
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to we will with you your
+al como con de del el en es la las lo los para por que se su sus un una y o
+""".split())
+
+
+def _hashed_terms(text: str) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Cuenta unigramas y bigramas del texto proyectados con hashing.
+
+    Usa hash() de Python, que solo es estable dentro del proceso: perfil y
+    trabajos siempre se vectorizan en la misma llamada a cosine_relevance.
+
+    Returns:
+        (columnas únicas, conteos)
+    """
+    words = [word for word in WORD_PATTERN.findall(text.lower()) if word not in STOPWORDS]
+    if not words:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    hashes = np.fromiter(map(hash, words), dtype=np.int64, count=len(words))
+    # Bigrama = combinación de los hashes de palabras consecutivas (el overflow de int64 es intencional)
+    terms = np.concatenate([hashes, hashes[:-1] * 1000003 ^ hashes[1:]]) % N_FEATURES
+    return np.unique(terms, return_counts=True)
+
+
+def profile_relevance_text(profile: Dict) -> str:
+    """
+    Aplana el perfil (salida de CVParser) en un texto para vectorizar.
+
+    Args:
+        profile: Perfil del candidato
+
+    Returns:
+        Resumen, skills, experiencia y proyectos concatenados
+    """
+    parts: List[str] = []
+    summary = profile.get('summary')
+    if isinstance(summary, str):
+        parts.append(summary)
+
+    skills = profile.get('skills', {})
+    if isinstance(skills, dict):
+        for items in skills.values():
+            parts.extend(str(item) for item in (items if isinstance(items, list) else [items]))
+    elif isinstance(skills, list):
+        parts.extend(str(item) for item in skills)
+
+    for section in ('experience', 'projects'):
+        for item in profile.get(section, []) or []:
+            if isinstance(item, dict):
+                for field in ('title', 'role', 'name', 'description'):
+                    if isinstance(item.get(field), str):
+                        parts.append(item[field])
+                parts.extend(str(tech) for tech in item.get('technologies', []) or [])
+            elif isinstance(item, str):
+                parts.append(item)
+
+    return '\n'.join(parts)
+
+
+def cosine_relevance(profile_text: str, documents: Sequence[str]) -> np.ndarray:
+    """
+    Similitud coseno TF-IDF entre el perfil y cada documento.
+
+    El IDF se calcula sobre el corpus recibido (documentos + perfil), con tf
+    sublineal (1 + log tf) e idf suavizado (log((1 + N) / (1 + df)) + 1).
+
+    Args:
+        profile_text: Texto del perfil
+        documents: Textos de los trabajos
+
+    Returns:
+        Arreglo de similitudes en [0, 1], una por documento
+    """
+    n_docs = len(documents)
+    if n_docs == 0:
+        return np.zeros(0)
+
+    doc_cols: List[np.ndarray] = []
+    doc_counts: List[np.ndarray] = []
+    for document in documents:
+        cols, counts = _hashed_terms(document or '')
+        doc_cols.append(cols)
+        doc_counts.append(counts)
+    profile_cols, profile_counts = _hashed_terms(profile_text or '')
+    lengths = [len(cols) for cols in doc_cols]
+    if profile_cols.size == 0 or sum(lengths) == 0:
+        return np.zeros(n_docs)
+
+    # Matriz dispersa documentos x términos en formato COO
+    rows_arr = np.repeat(np.arange(n_docs), lengths)
+    cols_arr = np.concatenate(doc_cols)
+    counts_arr = np.concatenate(doc_counts).astype(np.float64)
+    profile_counts = profile_counts.astype(np.float64)
+
+    # Frecuencia de documento: cada término aparece una vez por documento en (rows, cols)
+    df = np.bincount(cols_arr, minlength=N_FEATURES).astype(np.float64)
+    df[profile_cols] += 1
+    idf = np.log((1 + n_docs + 1) / (1 + df)) + 1
+
+    weights = (1 + np.log(counts_arr)) * idf[cols_arr]
+    norms = np.sqrt(np.bincount(rows_arr, weights=weights ** 2, minlength=n_docs))
+
+    profile_vector = np.zeros(N_FEATURES)
+    profile_vector[profile_cols] = (1 + np.log(profile_counts)) * idf[profile_cols]
+    profile_vector /= np.linalg.norm(profile_vector)
+
+    dots = np.bincount(rows_arr, weights=weights * profile_vector[cols_arr], minlength=n_docs)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        similarities = np.where(norms > 0, dots / norms, 0.0)
+    return np.clip(similarities, 0.0, 1.0)
+
+
+def relevance_to_score(similarity: float) -> float:
+    """
+    Convierte una similitud coseno TF-IDF en un score 0-100.
+
+    La raíz cuadrada expande el rango típico perfil-oferta (~0.01-0.3), que en
+    escala lineal quedaría comprimido cerca de 0.
+
+    Args:
+        similarity: Similitud en [0, 1]
+
+    Returns:
+        Score 0-100 redondeado a 1 decimal
+    """
+    return round(100 * math.sqrt(max(0.0, min(1.0, similarity))), 1)
@@ -0,0 +1,190 @@
+"""Detección de trabajos casi duplicados entre fuentes (MinHash + LSH por bandas)."""
+
+import re
+from collections import defaultdict
+from typing import Dict, List, Optional
+
+import numpy as np
+
+WORD_PATTERN = re.compile(r'\w+')
+
+# Firma MinHash: NUM_PERM = LSH_BANDS * LSH_ROWS. Con 16 bandas de 4 filas, un par con
+# Jaccard 0.8 es candidato con probabilidad ~0.9998 y uno con Jaccard 0.3 con ~0.12
+NUM_PERM = 64
+LSH_BANDS = 16
+LSH_ROWS = 4
+
+# Caracteres de la descripción que entran en la huella
+MAX_DESCRIPTION_CHARS = 2000
+
+# Permutaciones multiply-shift: ((a * x + b) mod 2^64) >> 32, con a impar
+_rng = np.random.RandomState(20240601)
+_PERM_A = _rng.randint(0, 2 ** 63, size=NUM_PERM, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.randint(0, 2 ** 63, size=NUM_PERM, dtype=np.int64).astype(np.uint64)
+
+
+def _normalize_company(company: Optional[str]) -> str:
+    """Empresa en minúsculas y sin signos ("ACME, Inc." -> "acme inc")."""
+    return ' '.join(WORD_PATTERN.findall((company or '').lower()))
+
+
+def _fingerprint_text(job: Dict) -> str:
+    """Texto que identifica la oferta: título, empresa y descripción."""
+    description = (job.get('description', '') or job.get('summary', '') or '')[:MAX_DESCRIPTION_CHARS]
+    return f"{job.get('title', '')} {job.get('company', '')} {description}"
+
+
+def shingle_hashes(text: str) -> np.ndarray:
+    """
+    Hashes (ordenados y sin repetidos) de los bigramas de palabras del texto.
+
+    hash() solo es estable dentro del proceso, igual que la deduplicación.
+
+    Args:
+        text: Texto a procesar
+
+    Returns:
+        Arreglo uint64 (la palabra sola si el texto tiene una; vacío si no tiene)
+    """
+    words = WORD_PATTERN.findall(text.lower())
+    if not words:
+        return np.zeros(0, dtype=np.uint64)
+    hashes = np.fromiter(map(hash, words), dtype=np.int64, count=len(words))
+    shingles = hashes[:-1] * 1000003 ^ hashes[1:] if len(words) > 1 else hashes
+    return np.unique(shingles).view(np.uint64)
+
+
+def minhash_signature(shingles: np.ndarray) -> Optional[np.ndarray]:
+    """
+    Firma MinHash de un conjunto de shingles.
+
+    Args:
+        shingles: Resultado de shingle_hashes
+
+    Returns:
+        Arreglo de NUM_PERM enteros, o None si no hay shingles
+    """
+    if shingles.size == 0:
+        return None
+    # El overflow de uint64 es la reducción mod 2^64 del esquema multiply-shift
+    with np.errstate(over='ignore'):
+        permuted = (_PERM_A[:, None] * shingles[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+    return permuted.min(axis=1)
+
+
+def jaccard(a: np.ndarray, b: np.ndarray) -> float:
+    """Similitud Jaccard exacta entre dos conjuntos de shingles (ordenados y sin repetidos)."""
+    if a.size == 0 or b.size == 0:
+        return 0.0
+    intersection = np.intersect1d(a, b, assume_unique=True).size
+    return intersection / (a.size + b.size - intersection)
+
+
+def find_duplicate_clusters(jobs: List[Dict], threshold: float = 0.8) -> List[List[int]]:
+    """
+    Agrupa trabajos casi duplicados.
+
+    Los candidatos salen del índice LSH sobre las firmas MinHash (sin comparar
+    todos contra todos) y se confirman si la similitud Jaccard exacta de sus
+    shingles es >= threshold y la empresa coincide. Dos trabajos sin empresa
+    solo se agrupan si tienen descripción.
+
+    Args:
+        jobs: Trabajos a analizar
+        threshold: Similitud mínima (0-1)
+
+    Returns:
+        Clusters de índices (cada trabajo aparece en exactamente uno), en orden
+        de primera aparición
+    """
+    shingles = [shingle_hashes(_fingerprint_text(job)) for job in jobs]
+    signatures = [minhash_signature(job_shingles) for job_shingles in shingles]
+    companies = [_normalize_company(job.get('company')) for job in jobs]
+    has_description = [bool(job.get('description') or job.get('summary')) for job in jobs]
+
+    parent = list(range(len(jobs)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def can_merge(i: int, j: int) -> bool:
+        if companies[i] != companies[j]:
+            return False
+        if not companies[i] and not (has_description[i] and has_description[j]):
+            return False
+        return jaccard(shingles[i], shingles[j]) >= threshold
+
+    checked = set()
+    for band in range(LSH_BANDS):
+        buckets: Dict[bytes, List[int]] = defaultdict(list)
+        start = band * LSH_ROWS
+        for i, signature in enumerate(signatures):
+            if signature is not None:
+                buckets[signature[start:start + LSH_ROWS].tobytes()].append(i)
+
+        for members in buckets.values():
+            for position, i in enumerate(members):
+                for j in members[position + 1:]:
+                    if (i, j) in checked:
+                        continue
+                    checked.add((i, j))
+                    root_i, root_j = find(i), find(j)
+                    if root_i != root_j and can_merge(i, j):
+                        parent[max(root_i, root_j)] = min(root_i, root_j)
+
+    clusters: Dict[int, List[int]] = {}
+    for i in range(len(jobs)):
+        clusters.setdefault(find(i), []).append(i)
+    return list(clusters.values())
+
+
+def merge_duplicates(jobs: List[Dict], threshold: float = 0.8) -> List[Dict]:
+    """
+    Deja un representante por cluster de casi duplicados con la metadata combinada.
+
+    El representante es el trabajo con la descripción más larga (el primero en
+    caso de empate) y recibe:
+    - sources / search_countries: fuentes y países donde apareció la oferta
+    - duplicate_urls: URLs de las copias descartadas
+    - duplicate_count: número de copias descartadas
+    - region_priority / search_region: la mejor región del cluster
+
+    Args:
+        jobs: Trabajos a deduplicar
+        threshold: Similitud mínima (0-1)
+
+    Returns:
+        Trabajos únicos, en el orden de aparición de su cluster
+    """
+    unique_jobs = []
+    for cluster in find_duplicate_clusters(jobs, threshold):
+        members = [jobs[i] for i in cluster]
+        if len(members) == 1:
+            unique_jobs.append(members[0])
+            continue
+
+        representative = max(
+            members,
+            key=lambda job: len(job.get('description', '') or job.get('summary', '') or '')
+        )
+        others = [job for job in members if job is not representative]
+
+        representative['sources'] = sorted({job['source'] for job in members if job.get('source')})
+        representative['search_countries'] = sorted(
+            {job['search_country'] for job in members if job.get('search_country')}
+        )
+        representative['duplicate_urls'] = [
+            job['url'] for job in others if job.get('url') and job.get('url') != representative.get('url')
+        ]
+        representative['duplicate_count'] = len(others)
+
+        best_region = min(members, key=lambda job: job.get('region_priority', 999))
+        if 'region_priority' in best_region:
+            representative['region_priority'] = best_region['region_priority']
+            representative['search_region'] = best_region.get('search_region', representative.get('search_region'))
+
+        unique_jobs.append(representative)
+    return unique_jobs
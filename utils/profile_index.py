@@ -0,0 +1,179 @@
+"""Índice precalculado del perfil del candidato, compartido por los agentes de matching y keywords."""
+
+import hashlib
+import json
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Set
+
+# Tecnologías que se reconocen dentro de textos libres del perfil
+TECH_KEYWORDS = [
+    'Python', 'Django', 'Flask', 'FastAPI', 'Pandas', 'NumPy',
+    'TypeScript', 'JavaScript', 'Node.js', 'React', 'Java', 'Spring Boot',
+    'AWS', 'GCP', 'ECS', 'Lambda', 'S3', 'DynamoDB', 'CloudFormation',
+    'Docker', 'Kubernetes', 'K8s', 'GKE',
+    'n8n', 'Jupyter', 'LLM', 'MLOps', 'LLMOps', 'AI', 'Machine Learning',
+    'MySQL', 'PostgreSQL', 'MongoDB', 'Redshift',
+    'Git', 'GitHub', 'CI/CD', 'Jenkins'
+]
+
+# Índices recientes por identidad del perfil (ver get_profile_index)
+_MAX_CACHED_INDEXES = 8
+_index_cache: "OrderedDict[int, ProfileIndex]" = OrderedDict()
+_EMPTY_PROFILE: Dict = {}
+
+
+def extract_tech_keywords(text: str) -> List[str]:
+    """
+    Extrae keywords tecnológicos de un texto.
+
+    Args:
+        text: Texto libre (skill, experiencia, etc.)
+
+    Returns:
+        Tecnologías de TECH_KEYWORDS presentes en el texto
+    """
+    text_lower = text.lower()
+    return [tech for tech in TECH_KEYWORDS if tech.lower() in text_lower]
+
+
+def profile_content_hash(profile: Optional[Dict]) -> str:
+    """
+    Hash sha256 estable del contenido del perfil (independiente del orden de claves).
+
+    Args:
+        profile: Perfil del candidato
+
+    Returns:
+        Hash hexadecimal
+    """
+    payload = json.dumps(profile or {}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+class ProfileIndex:
+    """
+    Datos derivados del perfil, calculados una sola vez por perfil.
+
+    - skills: skills normalizadas (sin duplicados ni vacías, orden de aparición)
+    - skills_lower / skill_set: las mismas en minúsculas, como lista y conjunto
+    - tech_keywords: tecnologías de TECH_KEYWORDS mencionadas en el perfil
+    - content_hash: hash estable del perfil completo
+    - memo(): resultados derivados adicionales (p.ej. resúmenes para prompts)
+    """
+
+    def __init__(self, profile: Optional[Dict]):
+        """
+        Construye el índice.
+
+        Args:
+            profile: Perfil del candidato (se asume que no se modifica después)
+        """
+        self.profile = profile if profile is not None else {}
+        self.content_hash = profile_content_hash(self.profile)
+
+        self.skills = self._normalize(self._collect_skills(self.profile))
+        self.skills_lower = [skill.lower() for skill in self.skills]
+        self.skill_set: Set[str] = set(self.skills_lower)
+
+        tech_text = ' '.join(self.skills)
+        self.tech_keywords: Set[str] = set(extract_tech_keywords(tech_text)) if tech_text else set()
+
+        self._memo: Dict[str, Any] = {}
+
+    @staticmethod
+    def _collect_skills(profile: Dict) -> List[str]:
+        """Recorre skills, experiencia y proyectos del perfil y retorna las skills encontradas."""
+        skills = []
+
+        # Skills explícitas - manejar tanto diccionario como lista
+        skills_data = profile.get('skills', {})
+        if isinstance(skills_data, dict):
+            # Si es un diccionario, iterar sobre categorías
+            for category, items in skills_data.items():
+                if isinstance(items, list):
+                    for item in items:
+                        # Extraer tecnologías del texto y agregar el item directamente
+                        if isinstance(item, str):
+                            skills.extend(extract_tech_keywords(item))
+                            skills.append(item)
+                elif isinstance(items, str):
+                    skills.extend(extract_tech_keywords(items))
+                    skills.append(items)
+        elif isinstance(skills_data, list):
+            for item in skills_data:
+                if isinstance(item, str):
+                    skills.append(item)
+                    skills.extend(extract_tech_keywords(item))
+                elif isinstance(item, dict):
+                    skills.extend(extract_tech_keywords(str(item)))
+
+        # Skills de experiencia
+        for exp in profile.get('experience', []) or []:
+            if isinstance(exp, dict):
+                skills.extend(exp.get('technologies', []) or [])
+            elif isinstance(exp, str):
+                skills.extend(extract_tech_keywords(exp))
+
+        # Skills de proyectos
+        for proj in profile.get('projects', []) or []:
+            if isinstance(proj, dict):
+                skills.extend(proj.get('technologies', []) or [])
+
+        return skills
+
+    @staticmethod
+    def _normalize(skills: List[Any]) -> List[str]:
+        """Quita espacios, vacíos y duplicados (sin distinguir mayúsculas), conservando el orden."""
+        normalized = []
+        seen = set()
+        for skill in skills:
+            if not isinstance(skill, str):
+                continue
+            skill = ' '.join(skill.split())
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                normalized.append(skill)
+        return normalized
+
+    def memo(self, name: str, builder: Callable[[], Any]) -> Any:
+        """
+        Retorna un valor derivado del perfil, calculándolo solo la primera vez.
+
+        Args:
+            name: Nombre del valor (ej: "semantic_summary")
+            builder: Función sin argumentos que lo calcula
+
+        Returns:
+            Valor memorizado
+        """
+        if name not in self._memo:
+            self._memo[name] = builder()
+        return self._memo[name]
+
+
+def get_profile_index(profile: Optional[Dict]) -> ProfileIndex:
+    """
+    Retorna el índice del perfil, reutilizándolo mientras se pase el mismo objeto.
+
+    El índice se identifica por la identidad del diccionario, así que obtenerlo
+    por trabajo cuesta O(1); un perfil nuevo (otro objeto) genera un índice nuevo.
+
+    Args:
+        profile: Perfil del candidato
+
+    Returns:
+        ProfileIndex compartido
+    """
+    if profile is None:
+        profile = _EMPTY_PROFILE
+    key = id(profile)
+    index = _index_cache.get(key)
+    if index is not None and index.profile is profile:
+        _index_cache.move_to_end(key)
+        return index
+
+    index = ProfileIndex(profile)
+    _index_cache[key] = index
+    while len(_index_cache) > _MAX_CACHED_INDEXES:
+        _index_cache.popitem(last=False)
+    return index
@@ -1,17 +1,20 @@
 """Generador de variaciones de queries usando LLM para parecer más humanas."""
 
-from typing import List, Optional
+from typing import Dict, List, Optional
+import asyncio
+import json
 import logging
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain_core.prompts import ChatPromptTemplate
-from utils.skill_loader import SkillLoader
+from utils.agent_runtime import get_runtime, SharedLLM
+from utils.llm_json import extract_json_content
+from utils.llm_scheduler import PRIORITY_NORMAL
+from utils.keyword_cache import get_keyword_cache
 from config.settings import (
-    LLM_PROVIDER, LLM_MODEL, OPENAI_API_KEY, ANTHROPIC_API_KEY,
+    LLM_PROVIDER, OPENAI_API_KEY, ANTHROPIC_API_KEY,
     USE_QUERY_VARIATIONS
 )
 
@@ -26,6 +29,8 @@ class QueryVariator:
     Open/Closed: Extensible mediante diferentes estrategias de variación
     """
     
+    llm = SharedLLM(temperature=0.7)  # Más creatividad para variaciones
+    
     def __init__(self, enabled: Optional[bool] = None):
         """
         Inicializa QueryVariator.
@@ -34,40 +39,94 @@ class QueryVariator:
             enabled: Si está habilitado. Si None, usa USE_QUERY_VARIATIONS de settings
         """
         self.enabled = enabled if enabled is not None else USE_QUERY_VARIATIONS
-        self.llm = None
+        self.llm_provider = None
         self.prompt_template = None
+        self.batch_prompt_template = None
+        self.persistent_cache = None
+        self.skill_version = ""
+        self.scheduler = None
         
         if self.enabled:
+            runtime = get_runtime()
+            self.scheduler = runtime.scheduler
             if LLM_PROVIDER == "anthropic" and ANTHROPIC_API_KEY:
                 try:
-                    self.llm = ChatAnthropic(
-                        model=LLM_MODEL if "claude" in LLM_MODEL.lower() else "claude-3-5-sonnet-20241022",
-                        temperature=0.7  # Más creatividad para variaciones
-                    )
+                    self.llm_provider = "anthropic"
+                    self.llm  # Crear el cliente compartido ahora para detectar errores de configuración
                     logger.debug("QueryVariator inicializado con Anthropic")
                 except Exception as e:
+                    self.llm_provider = None
                     logger.warning(f"Error inicializando Anthropic para QueryVariator: {e}")
             elif OPENAI_API_KEY:
                 try:
-                    self.llm = ChatOpenAI(model=LLM_MODEL, temperature=0.7)
+                    self.llm_provider = "openai"
+                    self.llm  # Crear el cliente compartido ahora para detectar errores de configuración
                     logger.debug("QueryVariator inicializado con OpenAI")
                 except Exception as e:
+                    self.llm_provider = None
                     logger.warning(f"Error inicializando OpenAI para QueryVariator: {e}")
             
             if not self.llm:
                 logger.warning("QueryVariator habilitado pero sin LLM disponible, usando fallback")
             else:
                 # Cargar skill para template de prompt
+                skill_loader = runtime.skill_loader
                 try:
-                    skill_loader = SkillLoader()
                     self.prompt_template = skill_loader.load_skill("query-variator")
                     logger.debug("Skill query-variator cargado correctamente")
                 except Exception as e:
                     logger.warning(f"Error cargando skill query-variator: {e}, usando prompts por defecto")
+                
+                # Variante por lotes (todos los keywords en una llamada)
+                try:
+                    self.batch_prompt_template = skill_loader.load_skill("query-variator-batch")
+                except Exception as e:
+                    logger.warning(f"Error cargando skill query-variator-batch: {e}")
+                
+                # Variaciones persistentes por keyword y versión de los skills
+                self.persistent_cache = get_keyword_cache()
+                self.skill_version = skill_loader.get_skills_version(["query-variator", "query-variator-batch"])
     
-    def generate_variations(self, keyword: str, num_variations: int = 3) -> List[str]:
+    def _clean_variations(self, keyword: str, variations: List[str], num_variations: int) -> List[str]:
         """
-        Genera variaciones naturales de un keyword.
+        Limpia las variaciones generadas y agrega el keyword original al inicio.
+        
+        Returns:
+            Lista con el original + hasta num_variations variaciones, o vacía si
+            no quedó ninguna variación válida
+        """
+        variations = [
+            v.strip() for v in variations
+            if isinstance(v, str) and v.strip() and not v.strip().startswith(('1.', '2.', '3.', '-', '*'))
+        ]
+        variations = [v for v in variations if len(v) > 3 and len(v) < 100]
+        if not variations:
+            return []
+        
+        # Agregar original al inicio si no está
+        if keyword not in variations:
+            variations.insert(0, keyword)
+        return variations[:num_variations + 1]  # +1 para incluir original
+    
+    def _get_cached_variations(self, keyword: str, num_variations: int) -> Optional[List[str]]:
+        """Busca las variaciones de un keyword en el caché persistente."""
+        if self.persistent_cache is None:
+            return None
+        return self.persistent_cache.get(
+            self.persistent_cache.make_variation_key(keyword, num_variations, self.skill_version)
+        )
+    
+    def _store_variations(self, keyword: str, num_variations: int, variations: List[str]) -> None:
+        """Guarda las variaciones generadas por el LLM en el caché persistente."""
+        if self.persistent_cache is not None:
+            self.persistent_cache.set(
+                self.persistent_cache.make_variation_key(keyword, num_variations, self.skill_version),
+                variations
+            )
+    
+    async def agenerate_variations(self, keyword: str, num_variations: int = 3) -> List[str]:
+        """
+        Genera variaciones naturales de un keyword (llamada LLM async vía el scheduler).
         
         Args:
             keyword: Keyword original
@@ -83,6 +142,10 @@ class QueryVariator:
         if not self.llm:
             return self._simple_variations(keyword, num_variations)
         
+        cached = self._get_cached_variations(keyword, num_variations)
+        if cached:
+            return cached
+        
         try:
             # Usar skill si está disponible, sino usar prompt por defecto
             if self.prompt_template:
@@ -104,24 +167,18 @@ Las variaciones deben:
 Responde SOLO con las variaciones, una por línea, sin numeración ni viñetas.""")
                 ])
             
-            chain = prompt | self.llm
-            response = chain.invoke({"keyword": keyword, "num": num_variations})
-            
-            # Parsear respuesta
-            variations = [
-                v.strip() 
-                for v in response.content.split('\n') 
-                if v.strip() and not v.strip().startswith(('1.', '2.', '3.', '-', '*'))
-            ]
+            response = await self.scheduler.ainvoke(
+                self.llm,
+                prompt.format_messages(keyword=keyword, num=num_variations),
+                priority=PRIORITY_NORMAL
+            )
             
-            # Limpiar y validar
-            variations = [v for v in variations if len(v) > 3 and len(v) < 100]
+            # Parsear, limpiar y validar
+            variations = self._clean_variations(keyword, response.content.split('\n'), num_variations)
             
             if variations:
-                # Agregar original al inicio si no está
-                if keyword not in variations:
-                    variations.insert(0, keyword)
-                return variations[:num_variations + 1]  # +1 para incluir original
+                self._store_variations(keyword, num_variations, variations)
+                return variations
             else:
                 logger.warning(f"No se generaron variaciones para '{keyword}', usando fallback")
                 return self._simple_variations(keyword, num_variations)
@@ -130,6 +187,80 @@ Responde SOLO con las variaciones, una por línea, sin numeración ni viñetas."
             logger.warning(f"Error generando variaciones con LLM para '{keyword}': {e}")
             return self._simple_variations(keyword, num_variations)
     
+    async def agenerate_variations_batch(self, keywords: List[str], num_variations: int = 3) -> Dict[str, List[str]]:
+        """
+        Genera las variaciones de varios keywords con una sola llamada LLM async.
+        
+        Los keywords con variaciones en caché no se piden. Si el skill por lotes
+        no está disponible, cada keyword se pide con agenerate_variations en
+        paralelo; las entradas que falten o queden vacías usan las variaciones
+        simples.
+        
+        Args:
+            keywords: Keywords originales
+            num_variations: Número de variaciones por keyword
+        
+        Returns:
+            Diccionario keyword -> variaciones (incluye el original)
+        """
+        if not self.enabled:
+            return {keyword: [keyword] for keyword in keywords}
+        if not self.llm:
+            return {keyword: self._simple_variations(keyword, num_variations) for keyword in keywords}
+        
+        result: Dict[str, List[str]] = {}
+        missing: List[str] = []
+        for keyword in dict.fromkeys(keywords):
+            cached = self._get_cached_variations(keyword, num_variations)
+            if cached:
+                result[keyword] = cached
+            else:
+                missing.append(keyword)
+        if not missing:
+            return result
+        
+        if not self.batch_prompt_template:
+            variations = await asyncio.gather(*(
+                self.agenerate_variations(keyword, num_variations) for keyword in missing
+            ))
+            result.update(zip(missing, variations))
+            return result
+        
+        try:
+            prompt = self.batch_prompt_template.format_messages(
+                keywords_block="\n".join(f"{index}. {keyword}" for index, keyword in enumerate(missing, start=1)),
+                keyword_count=len(missing),
+                num=num_variations
+            )
+            response = await self.scheduler.ainvoke(self.llm, prompt, priority=PRIORITY_NORMAL)
+            parsed = json.loads(extract_json_content(response.content))
+        except Exception as e:
+            logger.warning(f"Error generando variaciones por lotes ({len(missing)} keywords): {e}")
+            parsed = []
+        
+        if isinstance(parsed, dict):
+            parsed = parsed.get('results', [parsed])
+        for entry in parsed if isinstance(parsed, list) else []:
+            if not isinstance(entry, dict) or not isinstance(entry.get('variations'), list):
+                continue
+            try:
+                index = int(entry.get('keyword_index')) - 1
+            except (TypeError, ValueError):
+                continue
+            if not 0 <= index < len(missing) or missing[index] in result:
+                continue
+            keyword = missing[index]
+            variations = self._clean_variations(keyword, entry['variations'], num_variations)
+            if variations:
+                self._store_variations(keyword, num_variations, variations)
+                result[keyword] = variations
+        
+        for keyword in missing:
+            if keyword not in result:
+                logger.debug(f"Sin variaciones válidas para '{keyword}', usando fallback")
+                result[keyword] = self._simple_variations(keyword, num_variations)
+        return result
+    
     def _simple_variations(self, keyword: str, num_variations: int) -> List[str]:
         """
         Genera variaciones simples sin LLM (fallback).
@@ -0,0 +1,191 @@
+"""Cache de respuestas HTTP direccionado por contenido del request (URL, params y headers relevantes)."""
+
+import base64
+import hashlib
+import json
+import logging
+from typing import Any, Mapping, Optional
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from config.settings import USE_CACHE, CACHE_EXPIRY_HOURS, CACHE_MAX_SIZE_MB, CACHE_DIR
+from utils.disk_cache import DiskCache
+from tools.http_client_strategy import HTTPResponse
+
+logger = logging.getLogger(__name__)
+
+# Headers que cambian la representación retornada por el servidor.
+# Los headers anti-bot (User-Agent, Referer, Accept-Language rotado) no forman
+# parte de la clave: varían en cada request y harían inútil el cache.
+VARY_HEADERS = ('accept', 'authorization', 'x-api-key')
+
+
+class ResponseCache:
+    """
+    Cache de respuestas HTTP exitosas sobre DiskCache.
+
+    La clave es el sha256 de método + URL + params ordenados + headers de VARY_HEADERS,
+    por lo que el mismo request en otra ejecución reutiliza la respuesta sin red ni delays.
+    """
+
+    def __init__(self, disk_cache: Optional[DiskCache] = None):
+        """
+        Inicializa el cache de respuestas.
+
+        Args:
+            disk_cache: Almacén subyacente (por defecto CACHE_DIR/http_responses.sqlite
+                        con TTL CACHE_EXPIRY_HOURS y límite CACHE_MAX_SIZE_MB)
+        """
+        self.store = disk_cache if disk_cache is not None else DiskCache(
+            CACHE_DIR / "http_responses.sqlite",
+            max_size_bytes=CACHE_MAX_SIZE_MB * 1024 * 1024,
+            default_ttl_seconds=CACHE_EXPIRY_HOURS * 3600
+        )
+
+    @staticmethod
+    def make_key(
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> str:
+        """
+        Calcula la clave del request.
+
+        Args:
+            method: Método HTTP (o "BROWSER" para páginas renderizadas)
+            url: URL del request
+            params: Parámetros de query
+            headers: Headers del request (solo se usan los de VARY_HEADERS)
+
+        Returns:
+            Hash sha256 hexadecimal
+        """
+        relevant_headers = {}
+        for name, value in (headers or {}).items():
+            if name.lower() in VARY_HEADERS:
+                relevant_headers[name.lower()] = str(value)
+
+        payload = json.dumps(
+            {
+                'method': method.upper(),
+                'url': url,
+                'params': sorted((str(k), str(v)) for k, v in (params or {}).items()),
+                'headers': sorted(relevant_headers.items()),
+            },
+            ensure_ascii=False,
+            separators=(',', ':')
+        )
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def get(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None
+    ) -> Optional[HTTPResponse]:
+        """
+        Retorna la respuesta cacheada para el request, o None si no existe o expiró.
+
+        Returns:
+            HTTPResponse reconstruida desde el cache
+        """
+        key = self.make_key(method, url, params, headers)
+        try:
+            raw = self.store.get(key)
+        except Exception as e:
+            logger.warning(f"Error leyendo cache de respuestas: {e}")
+            return None
+        if raw is None:
+            return None
+
+        try:
+            data = json.loads(raw.decode('utf-8'))
+            logger.debug(f"Cache hit: {method} {url}")
+            return HTTPResponse(
+                url=data['url'],
+                status_code=data['status_code'],
+                content=base64.b64decode(data['content']),
+                headers=data.get('headers', {}),
+                encoding=data.get('encoding') or 'utf-8'
+            )
+        except (ValueError, KeyError) as e:
+            logger.warning(f"Entrada de cache corrupta para {url}: {e}")
+            self.store.delete(key)
+            return None
+
+    def set(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        headers: Optional[Mapping[str, str]],
+        response: Any
+    ) -> None:
+        """
+        Guarda una respuesta exitosa (status 200).
+
+        Args:
+            method: Método HTTP
+            url: URL del request
+            params: Parámetros de query
+            headers: Headers del request
+            response: requests.Response, HTTPResponse o compatible
+                      (status_code, content, headers, encoding)
+        """
+        if getattr(response, 'status_code', None) != 200:
+            return
+
+        data = {
+            'url': str(getattr(response, 'url', url) or url),
+            'status_code': 200,
+            'content': base64.b64encode(response.content or b'').decode('ascii'),
+            'headers': {k: v for k, v in dict(getattr(response, 'headers', {}) or {}).items()
+                        if k.lower() in ('content-type', 'etag', 'last-modified')},
+            'encoding': getattr(response, 'encoding', None) or 'utf-8'
+        }
+        try:
+            self.store.set(self.make_key(method, url, params, headers), json.dumps(data).encode('utf-8'))
+        except Exception as e:
+            logger.warning(f"Error escribiendo cache de respuestas: {e}")
+
+    def get_text(self, method: str, url: str, params: Optional[Mapping[str, Any]] = None,
+                 headers: Optional[Mapping[str, str]] = None) -> Optional[str]:
+        """Atajo: retorna el texto de la respuesta cacheada o None."""
+        cached = self.get(method, url, params, headers)
+        return cached.text if cached is not None else None
+
+    def set_text(self, method: str, url: str, params: Optional[Mapping[str, Any]],
+                 headers: Optional[Mapping[str, str]], text: str) -> None:
+        """Atajo: guarda un contenido de texto ya obtenido (p.ej. HTML renderizado)."""
+        self.set(method, url, params, headers,
+                 HTTPResponse(url=url, status_code=200, content=text.encode('utf-8')))
+
+    def clear(self) -> None:
+        """Elimina todas las respuestas cacheadas."""
+        self.store.clear()
+
+
+# Instancia única por proceso
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Retorna el cache de respuestas del proceso, o None si USE_CACHE está deshabilitado.
+
+    Returns:
+        ResponseCache compartido o None
+    """
+    global _response_cache
+    if not USE_CACHE:
+        return None
+    if _response_cache is None:
+        try:
+            _response_cache = ResponseCache()
+        except Exception as e:
+            logger.warning(f"No se pudo inicializar el cache de respuestas: {e}")
+            return None
+    return _response_cache
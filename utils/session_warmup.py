@@ -1,12 +1,12 @@
 """Gestor de sesión warm-up para establecer sesiones legítimas antes de scraping."""
 
-from typing import Optional
+from typing import Optional, Union
 import logging
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from tools.http_client_strategy import HTTPClientStrategy
+from tools.http_client_strategy import HTTPClientStrategy, AsyncHTTPClientStrategy
 from config.settings import USE_SESSION_WARMUP
 
 logger = logging.getLogger(__name__)
@@ -25,12 +25,13 @@ class SessionWarmup:
         'www.indeed.com': 'https://www.indeed.com',
     }
     
-    def __init__(self, http_client: HTTPClientStrategy):
+    def __init__(self, http_client: Union[HTTPClientStrategy, AsyncHTTPClientStrategy]):
         """
         Inicializa SessionWarmup.
         
         Args:
-            http_client: Estrategia HTTP client para hacer requests (Dependency Inversion)
+            http_client: Estrategia HTTP client para hacer requests (Dependency Inversion).
+                         Con una estrategia async se debe usar awarm_up().
         """
         self.http_client = http_client
         self.warmed_up_domains = set()  # Track de dominios ya calentados
@@ -47,6 +48,34 @@ class SessionWarmup:
         """
         return domain in self.WARMUP_DOMAINS
     
+    def _pending_warmup_url(self, domain: str) -> Optional[str]:
+        """
+        URL de warm-up del dominio, o None si no requiere warm-up o ya se hizo.
+        
+        Args:
+            domain: Dominio para warm-up
+        """
+        if not USE_SESSION_WARMUP or not self.needs_warmup(domain):
+            return None
+        
+        if domain in self.warmed_up_domains:
+            logger.debug(f"Dominio {domain} ya calentado en esta sesión")
+            return None
+        
+        warmup_url = self.WARMUP_DOMAINS.get(domain)
+        if warmup_url:
+            logger.info(f"Realizando warm-up para {domain}...")
+        return warmup_url
+    
+    def _record_warmup(self, domain: str, status_code: int) -> bool:
+        """Registra el resultado del warm-up y retorna si fue exitoso."""
+        if status_code == 200:
+            self.warmed_up_domains.add(domain)
+            logger.info(f"Warm-up exitoso para {domain}")
+            return True
+        logger.warning(f"Warm-up falló para {domain}: status {status_code}")
+        return False
+    
     def warm_up(self, domain: str) -> bool:
         """
         Realiza warm-up visitando página principal del dominio.
@@ -57,32 +86,34 @@ class SessionWarmup:
         Returns:
             True si warm-up exitoso, False en caso contrario
         """
-        if not USE_SESSION_WARMUP:
+        warmup_url = self._pending_warmup_url(domain)
+        if not warmup_url:
             return True
         
-        if not self.needs_warmup(domain):
-            return True
+        try:
+            response = self.http_client.get(warmup_url, timeout=30)
+            return self._record_warmup(domain, response.status_code)
+        except Exception as e:
+            logger.warning(f"Error en warm-up para {domain}: {e}")
+            return False
+    
+    async def awarm_up(self, domain: str) -> bool:
+        """
+        Versión asíncrona de warm_up para usar con AsyncHTTPClientStrategy.
         
-        if domain in self.warmed_up_domains:
-            logger.debug(f"Dominio {domain} ya calentado en esta sesión")
-            return True
+        Args:
+            domain: Dominio para warm-up
         
-        warmup_url = self.WARMUP_DOMAINS.get(domain)
+        Returns:
+            True si warm-up exitoso, False en caso contrario
+        """
+        warmup_url = self._pending_warmup_url(domain)
         if not warmup_url:
             return True
         
         try:
-            logger.info(f"Realizando warm-up para {domain}...")
-            response = self.http_client.get(warmup_url, timeout=30)
-            
-            if response.status_code == 200:
-                self.warmed_up_domains.add(domain)
-                logger.info(f"Warm-up exitoso para {domain}")
-                return True
-            else:
-                logger.warning(f"Warm-up falló para {domain}: status {response.status_code}")
-                return False
-                
+            response = await self.http_client.get(warmup_url, timeout=30)
+            return self._record_warmup(domain, response.status_code)
         except Exception as e:
             logger.warning(f"Error en warm-up para {domain}: {e}")
             return False
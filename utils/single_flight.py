@@ -0,0 +1,92 @@
+"""Registro single-flight: coalesce fetches idénticos concurrentes en una sola ejecución."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce llamadas asíncronas idénticas identificadas por una clave.
+
+    - Si ya hay una ejecución en curso para la clave, el llamador espera el mismo futuro
+    - Si la clave ya se resolvió (y memoize=True), se reutiliza el resultado sin volver a ejecutar
+    - Los errores se propagan a todos los que esperaban y no se memorizan
+
+    Los resultados memorizados se comparten por referencia: quien los modifique
+    debe copiarlos antes.
+    """
+
+    def __init__(self, memoize: bool = True):
+        """
+        Inicializa el registro.
+
+        Args:
+            memoize: Guardar resultados exitosos para llamadas posteriores
+        """
+        self.memoize = memoize
+        self._inflight: Dict[Hashable, asyncio.Future] = {}
+        self._results: Dict[Hashable, Any] = {}
+        self.executions = 0  # Llamadas que ejecutaron la fábrica
+        self.shared = 0      # Llamadas resueltas con una ejecución ajena (en curso o memorizada)
+
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Ejecuta factory una sola vez por clave y comparte el resultado.
+
+        Args:
+            key: Identificador del fetch (ej: ('GET', url))
+            factory: Función sin argumentos que retorna la corrutina a ejecutar
+
+        Returns:
+            Resultado de la corrutina
+        """
+        if key in self._results:
+            self.shared += 1
+            logger.debug(f"Single-flight: reutilizando resultado para {key}")
+            return self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(self._run(key, factory))
+            self._inflight[key] = task
+        else:
+            self.shared += 1
+            logger.debug(f"Single-flight: esperando fetch en curso para {key}")
+
+        # shield: cancelar a un llamador no cancela el fetch que esperan los demás
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Ejecuta la fábrica y memoriza el resultado si corresponde."""
+        try:
+            result = await factory()
+            if self.memoize:
+                self._results[key] = result
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    def forget(self, key: Hashable) -> None:
+        """Olvida el resultado memorizado de una clave."""
+        self._results.pop(key, None)
+
+    def clear(self) -> None:
+        """Olvida todos los resultados memorizados (las ejecuciones en curso continúan)."""
+        self._results.clear()
+        self._inflight.clear()
+
+
+# Instancia única por proceso
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Retorna el registro single-flight compartido del proceso (lo crea si no existe)."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -1,5 +1,6 @@
 """Skill loader para cargar y parsear archivos SKILL.md."""
 
+import hashlib
 import logging
 import re
 from pathlib import Path
@@ -34,6 +35,8 @@ class SkillLoader:
         
         self.skills_dir = Path(skills_dir)
         self._cache: Dict[str, Dict] = {}
+        # Templates ya compilados (se comparten entre agentes: solo se formatean)
+        self._templates: Dict[str, ChatPromptTemplate] = {}
         
         if not self.skills_dir.exists():
             logger.warning(f"Directorio de skills no encontrado: {self.skills_dir}")
@@ -120,6 +123,8 @@ class SkillLoader:
             ChatPromptTemplate listo para usar con LangChain
         """
         # Verificar caché
+        if use_cache and skill_name in self._templates:
+            return self._templates[skill_name]
         if use_cache and skill_name in self._cache:
             skill_data = self._cache[skill_name]
         else:
@@ -140,7 +145,10 @@ class SkillLoader:
                 self._cache[skill_name] = skill_data
         
         # Construir ChatPromptTemplate
-        return self._build_prompt_template(skill_data)
+        template = self._build_prompt_template(skill_data)
+        if use_cache:
+            self._templates[skill_name] = template
+        return template
     
     def _build_prompt_template(self, skill_data: Dict) -> ChatPromptTemplate:
         """
@@ -256,7 +264,30 @@ class SkillLoader:
         except Exception as e:
             return False, str(e)
     
+    def get_skills_version(self, skill_names: List[str]) -> str:
+        """
+        Versión del contenido de uno o más skills, para invalidar resultados cacheados.
+        
+        Usa el hash de cada SKILL.md (cambia con cualquier edición del prompt,
+        aunque no se actualice el campo version del frontmatter).
+        
+        Args:
+            skill_names: Nombres de los skills
+        
+        Returns:
+            String "skill@hash,..." ("missing" si el archivo no existe)
+        """
+        parts = []
+        for name in skill_names:
+            try:
+                digest = hashlib.sha256((self.skills_dir / name / "SKILL.md").read_bytes()).hexdigest()[:12]
+            except OSError:
+                digest = "missing"
+            parts.append(f"{name}@{digest}")
+        return ",".join(parts)
+    
     def clear_cache(self):
         """Limpia el caché de skills."""
         self._cache.clear()
+        self._templates.clear()
         logger.debug("Caché de skills limpiado")
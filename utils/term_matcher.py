@@ -0,0 +1,213 @@
+"""Matcher multi-término: busca todo un vocabulario por categorías en un solo recorrido del texto."""
+
+import hashlib
+import json
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+# Palabras (\w+, incluye acentos) o signos individuales: "c++" -> c, +, +; "full-time" -> full, -, time
+TOKEN_PATTERN = re.compile(r'\w+|[^\w\s]')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Divide un texto en tokens en minúsculas (palabras y signos sueltos).
+
+    Args:
+        text: Texto a tokenizar
+
+    Returns:
+        Lista de tokens en orden de aparición
+    """
+    return TOKEN_PATTERN.findall((text or '').lower())
+
+
+def _contains_sequence(tokens: List[str], sequence: Tuple[str, ...]) -> bool:
+    """Indica si la secuencia aparece contigua en tokens."""
+    first, length = sequence[0], len(sequence)
+    start = -1
+    try:
+        while True:
+            start = tokens.index(first, start + 1)
+            if tuple(tokens[start:start + length]) == sequence:
+                return True
+    except ValueError:
+        return False
+
+
+@dataclass
+class TermOccurrences:
+    """
+    Matriz dispersa textos x términos en formato COO (una entrada por término encontrado).
+
+    Se calcula una vez por corpus y vocabulario; re-puntuar con otros pesos no
+    requiere volver a tokenizar los textos.
+    """
+    rows: np.ndarray                 # Índice del texto
+    cols: np.ndarray                 # Índice del término (TermMatcher.keys)
+    n_docs: int
+    signature: str                   # Vocabulario con el que se calculó
+
+    def keys_by_doc(self) -> List[List[int]]:
+        """Lista de términos encontrados por texto."""
+        keys: List[List[int]] = [[] for _ in range(self.n_docs)]
+        for row, col in zip(self.rows.tolist(), self.cols.tolist()):
+            keys[row].append(col)
+        return keys
+
+
+class TermMatcher:
+    """
+    Índice compilado de términos agrupados por categoría.
+
+    Los términos se comparan por tokens completos, así que respetan límites de
+    palabra: "ai" no coincide dentro de "maintain" y "senior" no coincide en
+    "seniority". El texto se tokeniza una sola vez y todos los términos se
+    resuelven con búsquedas en conjuntos, por lo que el costo por texto casi no
+    depende del tamaño del vocabulario (a diferencia de un `term in text` por
+    término).
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        """
+        Compila el vocabulario.
+
+        Args:
+            categories: Dict categoría -> términos (el orden de los términos se
+                        conserva en los resultados)
+        """
+        self.categories = list(categories)
+        # Secuencia de tokens -> [(categoría, posición en la categoría, término original)]
+        self._entries: Dict[Tuple[str, ...], List[Tuple[str, int, str]]] = {}
+        for category, terms in categories.items():
+            for position, term in enumerate(terms):
+                key = tuple(tokenize(str(term)))
+                if not key:
+                    continue
+                self._entries.setdefault(key, []).append((category, position, term))
+
+        # Cada secuencia distinta tiene un índice (columna de TermOccurrences)
+        self.keys: List[Tuple[str, ...]] = list(self._entries)
+        self._single_ids: Dict[str, int] = {key[0]: i for i, key in enumerate(self.keys) if len(key) == 1}
+        self._single_tokens: Set[str] = set(self._single_ids)
+        self._phrases: List[Tuple[int, Tuple[str, ...]]] = [
+            (i, key) for i, key in enumerate(self.keys) if len(key) > 1
+        ]
+
+        vocabulary = [[category, [str(term) for term in terms]] for category, terms in categories.items()]
+        self.signature = hashlib.sha256(
+            json.dumps(vocabulary, ensure_ascii=False).encode('utf-8')
+        ).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def find_keys(self, text: str) -> List[int]:
+        """
+        Retorna los índices (en self.keys) de los términos presentes en el texto.
+
+        Args:
+            text: Texto a analizar
+
+        Returns:
+            Índices de términos encontrados (sin orden particular)
+        """
+        tokens = tokenize(text)
+        token_set = set(tokens)
+
+        found = [self._single_ids[token] for token in token_set & self._single_tokens]
+        for key_id, phrase in self._phrases:
+            if token_set.issuperset(phrase) and _contains_sequence(tokens, phrase):
+                found.append(key_id)
+        return found
+
+    def hits_from_keys(
+        self,
+        key_ids: Iterable[int],
+        categories: Optional[Sequence[str]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Agrupa términos encontrados por categoría, en el orden configurado.
+
+        Args:
+            key_ids: Índices retornados por find_keys
+            categories: Limitar el resultado a estas categorías (default: todas)
+
+        Returns:
+            Dict categoría -> términos encontrados
+        """
+        wanted = self.categories if categories is None else categories
+        hits: Dict[str, List[Tuple[int, str]]] = {category: [] for category in wanted}
+        for key_id in key_ids:
+            for category, position, term in self._entries[self.keys[key_id]]:
+                if category in hits:
+                    hits[category].append((position, term))
+
+        return {category: [term for _, term in sorted(items)] for category, items in hits.items()}
+
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Busca todos los términos del vocabulario en el texto.
+
+        Args:
+            text: Texto a analizar
+
+        Returns:
+            Dict categoría -> términos encontrados, en el orden configurado
+            (todas las categorías están presentes, vacías si no hubo coincidencias)
+        """
+        return self.hits_from_keys(self.find_keys(text))
+
+    def occurrences(self, texts: Iterable[str]) -> TermOccurrences:
+        """
+        Tokeniza cada texto una vez y construye la matriz dispersa textos x términos.
+
+        Args:
+            texts: Textos a analizar
+
+        Returns:
+            TermOccurrences en formato COO
+        """
+        rows: List[int] = []
+        cols: List[int] = []
+        n_docs = 0
+        for row, text in enumerate(texts):
+            n_docs += 1
+            if not text:
+                continue
+            found = self.find_keys(text)
+            rows.extend([row] * len(found))
+            cols.extend(found)
+        return TermOccurrences(
+            rows=np.asarray(rows, dtype=np.int64),
+            cols=np.asarray(cols, dtype=np.int64),
+            n_docs=n_docs,
+            signature=self.signature
+        )
+
+    def category_counts(self, occurrences: TermOccurrences, category: str) -> np.ndarray:
+        """
+        Cuenta, por texto, los términos encontrados de una categoría.
+
+        Equivale a len(match(texto)[category]) para cada texto.
+
+        Args:
+            occurrences: Matriz calculada con este vocabulario
+            category: Categoría a contar
+
+        Returns:
+            Arreglo float64 de largo n_docs
+        """
+        entries_per_key = np.zeros(len(self.keys), dtype=np.float64)
+        for key_id, key in enumerate(self.keys):
+            entries_per_key[key_id] = sum(1 for entry in self._entries[key] if entry[0] == category)
+        if occurrences.rows.size == 0:
+            return np.zeros(occurrences.n_docs, dtype=np.float64)
+        return np.bincount(
+            occurrences.rows,
+            weights=entries_per_key[occurrences.cols],
+            minlength=occurrences.n_docs
+        )